@@ -20,12 +20,12 @@ from models_library.api_schemas_storage.storage_schemas import (
     UploadedPart,
 )
 from models_library.basic_types import SHA256Str
-from models_library.bytes_iters import BytesIter, DataSize
+from models_library.bytes_iters import BytesIter, BytesIterCallable, DataSize
 from pydantic import AnyUrl, ByteSize, TypeAdapter
 from servicelib.bytes_iters import DEFAULT_READ_CHUNK_SIZE, BytesStreamer
 from servicelib.logging_utils import log_catch, log_context
 from servicelib.s3_utils import FileLikeReader
-from servicelib.utils import limited_gather
+from servicelib.utils import limited_as_completed
 from settings_library.s3 import S3Settings
 from types_aiobotocore_s3 import S3Client
 from types_aiobotocore_s3.literals import BucketLocationConstraintType
@@ -59,6 +59,7 @@ _DEFAULT_AWS_REGION: Final[str] = "us-east-1"
 _MAX_ITEMS_PER_PAGE: Final[int] = 500
 _MAX_CONCURRENT_COPY: Final[int] = 4
 _AWS_MAX_ITEMS_PER_PAGE: Final[int] = 1000
+_DEFAULT_STREAM_PREFETCH_COUNT: Final[int] = 10
 
 
 ListAnyUrlTypeAdapter: Final[TypeAdapter[list[AnyUrl]]] = TypeAdapter(list[AnyUrl])
@@ -558,8 +559,9 @@ class SimcoreS3API:  # pylint: disable=too-many-public-methods
         dst_metadata = await self.get_directory_metadata(bucket=bucket, prefix=dst_prefix)
         if dst_metadata.size and dst_metadata.size > 0:
             raise S3DestinationNotEmptyError(dst_prefix=dst_prefix)
-        await limited_gather(
-            *[
+        # NOTE: copies are started while the listing goes on (the next page is only fetched when needed)
+        async for copy_task in limited_as_completed(
+            (
                 self.copy_object(
                     bucket=bucket,
                     src_object_key=s3_object.object_key,
@@ -568,9 +570,29 @@ class SimcoreS3API:  # pylint: disable=too-many-public-methods
                     object_metadata=s3_object,
                 )
                 async for s3_object in self._list_all_objects(bucket=bucket, prefix=src_prefix)
-            ],
+            ),
             limit=_MAX_CONCURRENT_COPY,
-        )
+        ):
+            await copy_task
+
+    def _create_bytes_iter_callable(
+        self,
+        bucket_name: S3BucketName,
+        object_key: S3ObjectKey,
+        *,
+        chunk_size: int,
+    ) -> BytesIterCallable:
+        async def _() -> BytesIter:
+            # Use a single get_object request and stream from the body
+            response = await self._client.get_object(Bucket=bucket_name, Key=object_key)
+            body = response["Body"]
+            while True:
+                chunk = await body.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+
+        return _
 
     async def get_bytes_streamer_from_object(
         self,
@@ -589,17 +611,71 @@ class SimcoreS3API:  # pylint: disable=too-many-public-methods
         head_response = await self._client.head_object(Bucket=bucket_name, Key=object_key)
         data_size = DataSize(head_response["ContentLength"])
 
-        async def _() -> BytesIter:
-            # Use a single get_object request and stream from the body
-            response = await self._client.get_object(Bucket=bucket_name, Key=object_key)
+        return BytesStreamer(
+            data_size,
+            self._create_bytes_iter_callable(bucket_name, object_key, chunk_size=chunk_size),
+        )
+
+    @contextlib.asynccontextmanager
+    async def get_prefetching_bytes_streamers_from_s3_metadata(
+        self,
+        bucket_name: S3BucketName,
+        s3_objects: Sequence[S3MetaData],
+        *,
+        chunk_size: int = DEFAULT_READ_CHUNK_SIZE,
+        prefetch_count: int = _DEFAULT_STREAM_PREFETCH_COUNT,
+    ) -> AsyncIterator[list[BytesStreamer]]:
+        """Creates byte streamers (no HEAD request) that are meant to be consumed in order.
+
+        While the object at index i is streamed, the next `prefetch_count` objects which are not
+        larger than `chunk_size` are read concurrently and their responses closed. Larger objects
+        are only requested once streamed, so that no connection is held by an unread response.
+        Memory usage is bounded by ((prefetch_count + 1) * chunk_size).
+        Pending prefetches are cancelled when leaving the context.
+        """
+        prefetched: dict[int, asyncio.Task[bytes]] = {}
+
+        async def _read_object(s3_object: S3MetaData) -> bytes:
+            response = await self._client.get_object(Bucket=bucket_name, Key=s3_object.object_key)
             body = response["Body"]
-            while True:
-                chunk = await body.read(chunk_size)
-                if not chunk:
-                    break
-                yield chunk
+            try:
+                return await body.read()
+            finally:
+                body.close()
+
+        def _schedule(start_index: int) -> None:
+            for index in range(start_index, min(start_index + prefetch_count + 1, len(s3_objects))):
+                if index not in prefetched and s3_objects[index].size <= chunk_size:
+                    prefetched[index] = asyncio.create_task(_read_object(s3_objects[index]))
+
+        def _create_prefetching_bytes_iter_callable(index: int) -> BytesIterCallable:
+            async def _() -> BytesIter:
+                _schedule(index)
+                if index in prefetched:
+                    if data := await prefetched.pop(index):
+                        yield data
+                    return
+
+                response = await self._client.get_object(Bucket=bucket_name, Key=s3_objects[index].object_key)
+                body = response["Body"]
+                try:
+                    while chunk := await body.read(chunk_size):
+                        yield chunk
+                finally:
+                    body.close()
+
+            return _
 
-        return BytesStreamer(data_size, _)
+        try:
+            yield [
+                BytesStreamer(DataSize(s3_object.size), _create_prefetching_bytes_iter_callable(index))
+                for index, s3_object in enumerate(s3_objects)
+            ]
+        finally:
+            for task in prefetched.values():
+                task.cancel()
+            await asyncio.gather(*prefetched.values(), return_exceptions=True)
+            prefetched.clear()
 
     @s3_exception_handler(_logger)
     async def upload_object_from_file_like(
@@ -15,7 +15,7 @@ import random
 import time
 from collections import defaultdict
 from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
-from contextlib import contextmanager
+from contextlib import aclosing, contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Final
@@ -1251,6 +1251,49 @@ async def test_create_multipart_presigned_upload_link(
     )
 
 
+@pytest.mark.parametrize(
+    "file_size",
+    [
+        parametrized_file_size(MULTIPART_UPLOADS_MIN_TOTAL_SIZE.human_readable()),
+    ],
+    ids=byte_size_ids,
+)
+@pytest.mark.parametrize("with_sha256_checksum", [True, False])
+async def test_create_multipart_presigned_upload_link_sha256_checksum_metadata(
+    mocked_s3_server_envs: EnvVarsDict,
+    simcore_s3_api: SimcoreS3API,
+    with_s3_bucket: S3BucketName,
+    create_file_of_size: Callable[[ByteSize], Path],
+    default_expiration_time_seconds: int,
+    s3_client: S3Client,
+    faker: Faker,
+    file_size: ByteSize,
+    with_sha256_checksum: bool,
+):
+    # NOTE: the checksum is only stored in the object metadata when known before uploading,
+    # a checksum computed while uploading is reported when completing the upload
+    file = create_file_of_size(file_size)
+    object_key = S3ObjectKey(file.name)
+    sha256_checksum = TypeAdapter(SHA256Str).validate_python(faker.sha256()) if with_sha256_checksum else None
+    upload_links = await simcore_s3_api.create_multipart_upload_links(
+        bucket=with_s3_bucket,
+        object_key=object_key,
+        file_size=ByteSize(file.stat().st_size),
+        expiration_secs=default_expiration_time_seconds,
+        sha256_checksum=sha256_checksum,
+    )
+    uploaded_parts = await upload_file_to_presigned_link(file, upload_links)
+    await simcore_s3_api.complete_multipart_upload(
+        bucket=with_s3_bucket,
+        object_key=object_key,
+        upload_id=upload_links.upload_id,
+        uploaded_parts=uploaded_parts,
+    )
+
+    response = await s3_client.head_object(Bucket=with_s3_bucket, Key=object_key)
+    assert response["Metadata"] == ({"sha256_checksum": sha256_checksum} if sha256_checksum else {})
+
+
 @pytest.mark.parametrize(
     "file_size",
     [
@@ -1780,6 +1823,186 @@ async def test_read_from_bytes_streamer(
     await assert_same_file_content(with_uploaded_file_on_s3.local_path, fake_file_name)
 
 
+@pytest.mark.parametrize(
+    "directory_size, min_file_size, max_file_size, depth",
+    [
+        (
+            TypeAdapter(ByteSize).validate_python("1Mib"),
+            TypeAdapter(ByteSize).validate_python("1B"),
+            TypeAdapter(ByteSize).validate_python("10Kib"),
+            None,
+        )
+    ],
+    ids=byte_size_ids,
+)
+@pytest.mark.parametrize("prefetch_count", [0, 1, 5])
+async def test_read_from_prefetching_bytes_streamers(
+    mocked_s3_server_envs: EnvVarsDict,
+    with_uploaded_folder_on_s3: list[UploadedFile],
+    simcore_s3_api: SimcoreS3API,
+    with_s3_bucket: S3BucketName,
+    mocker: MockerFixture,
+    prefetch_count: int,
+):
+    s3_objects = [
+        await simcore_s3_api.get_object_metadata(bucket=with_s3_bucket, object_key=uploaded_file.s3_key)
+        for uploaded_file in with_uploaded_folder_on_s3
+    ]
+    spy_head_object = mocker.spy(simcore_s3_api._client, "head_object")  # noqa: SLF001
+
+    async with simcore_s3_api.get_prefetching_bytes_streamers_from_s3_metadata(
+        with_s3_bucket, s3_objects, chunk_size=1024, prefetch_count=prefetch_count
+    ) as bytes_streamers:
+        assert len(bytes_streamers) == len(s3_objects)
+        for uploaded_file, bytes_streamer in zip(with_uploaded_folder_on_s3, bytes_streamers, strict=True):
+            assert bytes_streamer.data_size == uploaded_file.local_path.stat().st_size
+            received = b"".join([chunk async for chunk in bytes_streamer.with_progress_bytes_iter(AsyncMock())])
+            assert received == uploaded_file.local_path.read_bytes()
+
+    spy_head_object.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "directory_size, min_file_size, max_file_size, depth",
+    [
+        (
+            TypeAdapter(ByteSize).validate_python("1Mib"),
+            TypeAdapter(ByteSize).validate_python("1B"),
+            TypeAdapter(ByteSize).validate_python("10Kib"),
+            None,
+        )
+    ],
+    ids=byte_size_ids,
+)
+@pytest.mark.parametrize("prefetch_completed", [True, False])
+async def test_prefetching_bytes_streamers_cleanup_when_not_consumed(
+    mocked_s3_server_envs: EnvVarsDict,
+    with_uploaded_folder_on_s3: list[UploadedFile],
+    simcore_s3_api: SimcoreS3API,
+    with_s3_bucket: S3BucketName,
+    mocker: MockerFixture,
+    prefetch_completed: bool,
+):
+    s3_objects = [
+        await simcore_s3_api.get_object_metadata(bucket=with_s3_bucket, object_key=uploaded_file.s3_key)
+        for uploaded_file in with_uploaded_folder_on_s3
+    ]
+    assert len(s3_objects) > 4, "wrong initialization of test!"
+
+    spied_body_closes: list[Mock] = []
+    original_get_object = simcore_s3_api._client.get_object  # noqa: SLF001
+
+    async def _get_object(**kwargs):
+        if not prefetch_completed and kwargs["Key"] != s3_objects[0].object_key:
+            # the prefetches are still pending when leaving the context
+            await asyncio.Event().wait()
+        response = await original_get_object(**kwargs)
+        spied_body_closes.append(mocker.spy(response["Body"], "close"))
+        return response
+
+    mocker.patch.object(simcore_s3_api._client, "get_object", side_effect=_get_object)  # noqa: SLF001
+    spy_create_task = mocker.spy(asyncio, "create_task")
+
+    async with simcore_s3_api.get_prefetching_bytes_streamers_from_s3_metadata(
+        with_s3_bucket, s3_objects, chunk_size=max(s3_object.size for s3_object in s3_objects), prefetch_count=3
+    ) as bytes_streamers:
+        # only read the first chunk of the first object, the next ones are prefetched
+        async with aclosing(bytes_streamers[0].bytes_iter_callable()) as bytes_iter:
+            async for _ in bytes_iter:
+                break
+
+        prefetch_tasks = [
+            task
+            for call, task in zip(spy_create_task.call_args_list, spy_create_task.spy_return_list, strict=True)
+            if call.args[0].__name__ == "_read_object"
+        ]
+        assert len(prefetch_tasks) == 4
+        if prefetch_completed:
+            await asyncio.wait(prefetch_tasks)
+            # the prefetched responses are closed once read
+            assert len(spied_body_closes) == 4
+            for spied_close in spied_body_closes:
+                spied_close.assert_called()
+
+    # the pending prefetches were cancelled and awaited
+    assert all(task.done() for task in prefetch_tasks)
+    if prefetch_completed:
+        assert not any(task.cancelled() for task in prefetch_tasks)
+    else:
+        assert all(task.cancelled() for task in prefetch_tasks[1:])
+    # and every opened response was closed
+    assert len(spied_body_closes) == (4 if prefetch_completed else 1)
+    for spied_close in spied_body_closes:
+        spied_close.assert_called()
+
+
+async def test_prefetching_bytes_streamers_do_not_hold_responses_of_large_objects(
+    mocked_s3_server_envs: EnvVarsDict,
+    simcore_s3_api: SimcoreS3API,
+    with_s3_bucket: S3BucketName,
+    create_file_of_size: Callable[[ByteSize], Path],
+    upload_file: Callable[[Path], Awaitable[UploadedFile]],
+    mocker: MockerFixture,
+):
+    chunk_size = 1024
+    file_sizes = [100, 10 * chunk_size, 100, chunk_size, 100, 100]
+    uploaded_files = [await upload_file(create_file_of_size(ByteSize(file_size))) for file_size in file_sizes]
+    s3_objects = [
+        await simcore_s3_api.get_object_metadata(bucket=with_s3_bucket, object_key=uploaded_file.s3_key)
+        for uploaded_file in uploaded_files
+    ]
+    large_object_key = s3_objects[1].object_key
+
+    spied_body_closes: dict[S3ObjectKey, Mock] = {}
+    original_get_object = simcore_s3_api._client.get_object  # noqa: SLF001
+
+    async def _get_object(**kwargs):
+        response = await original_get_object(**kwargs)
+        spied_body_closes[kwargs["Key"]] = mocker.spy(response["Body"], "close")
+        return response
+
+    mocker.patch.object(simcore_s3_api._client, "get_object", side_effect=_get_object)  # noqa: SLF001
+    spy_create_task = mocker.spy(asyncio, "create_task")
+
+    async def _wait_for_prefetches() -> None:
+        await asyncio.wait(
+            [
+                task
+                for call, task in zip(spy_create_task.call_args_list, spy_create_task.spy_return_list, strict=True)
+                if call.args[0].__name__ == "_read_object"
+            ]
+        )
+
+    async with simcore_s3_api.get_prefetching_bytes_streamers_from_s3_metadata(
+        with_s3_bucket, s3_objects, chunk_size=chunk_size, prefetch_count=3
+    ) as bytes_streamers:
+        received = [b"".join([chunk async for chunk in bytes_streamers[0].bytes_iter_callable()])]
+        await _wait_for_prefetches()
+        # the large object is not requested before being streamed
+        assert set(spied_body_closes) == {s3_objects[i].object_key for i in (0, 2, 3)}
+
+        async with aclosing(bytes_streamers[1].bytes_iter_callable()) as bytes_iter:
+            large_object_chunks = [await anext(bytes_iter)]
+            await _wait_for_prefetches()
+            # while the large object is streamed, the next small ones were read and only its response is open
+            assert set(spied_body_closes) == {s3_objects[i].object_key for i in range(5)}
+            for object_key, spied_close in spied_body_closes.items():
+                assert spied_close.called is (object_key != large_object_key)
+            large_object_chunks += [chunk async for chunk in bytes_iter]
+        received.append(b"".join(large_object_chunks))
+        spied_body_closes[large_object_key].assert_called()
+
+        received += [
+            b"".join([chunk async for chunk in bytes_streamer.bytes_iter_callable()])
+            for bytes_streamer in bytes_streamers[2:]
+        ]
+
+    assert received == [uploaded_file.local_path.read_bytes() for uploaded_file in uploaded_files]
+    assert set(spied_body_closes) == {s3_object.object_key for s3_object in s3_objects}
+    for spied_close in spied_body_closes.values():
+        spied_close.assert_called()
+
+
 @pytest.mark.parametrize("upload_from_s3", [True, False])
 async def test_upload_object_from_file_like(
     mocked_s3_server_envs: EnvVarsDict,
@@ -353,6 +353,10 @@ class UploadedPart(BaseModel):
 
 class FileUploadCompletionBody(BaseModel):
     parts: list[UploadedPart]
+    sha256_checksum: Annotated[
+        SHA256Str | None,
+        Field(description="checksum of the uploaded file, when computed while uploading"),
+    ] = None
 
     @field_validator("parts")
     @classmethod
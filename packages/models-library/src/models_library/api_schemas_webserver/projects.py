@@ -16,6 +16,7 @@ from pydantic import (
     ConfigDict,
     Field,
     HttpUrl,
+    NonNegativeInt,
     PlainSerializer,
     field_validator,
 )
@@ -207,7 +208,14 @@ class ProjectGet(OutputSchema):
 TaskProjectGet: TypeAlias = TaskGet
 
 
-class ProjectListItem(ProjectGet): ...
+class ProjectListItem(ProjectGet):
+    # NOTE: the heavy fields are omitted in the listing's "basic" view
+    workbench: Annotated[NodesDict, Field(default_factory=dict, json_schema_extra={"default": {}})] = DEFAULT_FACTORY
+    dev: dict | None = None
+    nodes_count: Annotated[
+        NonNegativeInt | None,
+        Field(description="Number of nodes in the project (returned instead of the workbench)"),
+    ] = None
 
 
 class ProjectReplace(InputSchema):
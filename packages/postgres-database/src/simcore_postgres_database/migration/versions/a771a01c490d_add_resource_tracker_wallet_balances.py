@@ -0,0 +1,132 @@
+"""add resource_tracker_wallet_balances table
+
+Revision ID: a771a01c490d
+Revises: 3f8c0e8d11a4
+Create Date: 2026-10-16 09:12:41.503117+00:00
+
+"""
+
+from typing import Final
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a771a01c490d"
+down_revision = "3f8c0e8d11a4"
+branch_labels = None
+depends_on = None
+
+
+# TRIGGERS ------------------------
+_PROCEDURE_NAME: Final[str] = "update_resource_tracker_wallet_balances"
+_TRIGGER_NAME: Final[str] = f"{_PROCEDURE_NAME}_event"
+
+wallet_balance_trigger = sa.DDL(
+    f"""
+DROP TRIGGER IF EXISTS {_TRIGGER_NAME} on resource_tracker_credit_transactions;
+CREATE TRIGGER {_TRIGGER_NAME}
+AFTER INSERT OR DELETE OR UPDATE OF product_name, wallet_id, osparc_credits, transaction_status
+ON resource_tracker_credit_transactions
+    FOR EACH ROW
+    EXECUTE PROCEDURE {_PROCEDURE_NAME}();
+"""
+)
+
+# PROCEDURES ------------------------
+wallet_balance_procedure = sa.DDL(
+    f"""
+CREATE OR REPLACE FUNCTION {_PROCEDURE_NAME}() RETURNS TRIGGER AS $$
+    BEGIN
+        IF (TG_OP = 'UPDATE' OR TG_OP = 'DELETE') THEN
+            INSERT INTO resource_tracker_wallet_balances AS balances
+                (product_name, wallet_id, settled_osparc_credits, pending_osparc_credits)
+            VALUES (
+                OLD.product_name,
+                OLD.wallet_id,
+                CASE WHEN OLD.transaction_status IN ('BILLED', 'IN_DEBT') THEN -OLD.osparc_credits ELSE 0 END,
+                CASE WHEN OLD.transaction_status = 'PENDING' THEN -OLD.osparc_credits ELSE 0 END
+            )
+            ON CONFLICT (product_name, wallet_id) DO UPDATE SET
+                settled_osparc_credits = balances.settled_osparc_credits + EXCLUDED.settled_osparc_credits,
+                pending_osparc_credits = balances.pending_osparc_credits + EXCLUDED.pending_osparc_credits,
+                modified = now();
+        END IF;
+        IF (TG_OP = 'UPDATE' OR TG_OP = 'INSERT') THEN
+            INSERT INTO resource_tracker_wallet_balances AS balances
+                (product_name, wallet_id, settled_osparc_credits, pending_osparc_credits)
+            VALUES (
+                NEW.product_name,
+                NEW.wallet_id,
+                CASE WHEN NEW.transaction_status IN ('BILLED', 'IN_DEBT') THEN NEW.osparc_credits ELSE 0 END,
+                CASE WHEN NEW.transaction_status = 'PENDING' THEN NEW.osparc_credits ELSE 0 END
+            )
+            ON CONFLICT (product_name, wallet_id) DO UPDATE SET
+                settled_osparc_credits = balances.settled_osparc_credits + EXCLUDED.settled_osparc_credits,
+                pending_osparc_credits = balances.pending_osparc_credits + EXCLUDED.pending_osparc_credits,
+                modified = now();
+        END IF;
+        RETURN NULL;
+    END;
+$$ LANGUAGE plpgsql;
+"""
+)
+
+
+def upgrade():
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.create_table(
+        "resource_tracker_wallet_balances",
+        sa.Column("product_name", sa.String(), nullable=False),
+        sa.Column("wallet_id", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "settled_osparc_credits",
+            sa.Numeric(scale=2),
+            server_default=sa.text("0"),
+            nullable=False,
+        ),
+        sa.Column(
+            "pending_osparc_credits",
+            sa.Numeric(scale=2),
+            server_default=sa.text("0"),
+            nullable=False,
+        ),
+        sa.Column(
+            "modified",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("product_name", "wallet_id"),
+    )
+    # ### end Alembic commands ###
+
+    # custom
+    op.execute(wallet_balance_procedure)
+    op.execute(wallet_balance_trigger)
+
+    # initial balances from the existing transactions
+    op.execute(
+        sa.DDL(
+            """
+INSERT INTO resource_tracker_wallet_balances (product_name, wallet_id, settled_osparc_credits, pending_osparc_credits)
+SELECT
+    product_name,
+    wallet_id,
+    COALESCE(SUM(osparc_credits) FILTER (WHERE transaction_status IN ('BILLED', 'IN_DEBT')), 0),
+    COALESCE(SUM(osparc_credits) FILTER (WHERE transaction_status = 'PENDING'), 0)
+FROM resource_tracker_credit_transactions
+GROUP BY product_name, wallet_id;
+            """
+        )
+    )
+
+
+def downgrade():
+    # custom
+    op.execute(f"DROP TRIGGER IF EXISTS {_TRIGGER_NAME} on resource_tracker_credit_transactions;")
+    op.execute(f"DROP FUNCTION {_PROCEDURE_NAME}();")
+
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.drop_table("resource_tracker_wallet_balances")
+    # ### end Alembic commands ###
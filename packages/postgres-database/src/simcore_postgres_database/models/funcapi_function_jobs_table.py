@@ -60,6 +60,12 @@ function_jobs_table = sa.Table(
         JSONB,
         doc="Inputs of the function job",
     ),
+    sa.Column(
+        "inputs_hash",
+        sa.String,
+        nullable=True,
+        doc="Canonical hash of the inputs (see utils_funcapi_function_jobs.compute_function_job_inputs_hash)",
+    ),
     sa.Column(
         "outputs",
         JSONB,
@@ -74,4 +80,6 @@ function_jobs_table = sa.Table(
     column_created_datetime(),
     column_modified_datetime(),
     sa.PrimaryKeyConstraint("uuid", name="funcapi_function_jobs_pk"),
+    # NOTE: lookup of cached function jobs
+    sa.Index("ix_funcapi_function_jobs_function_uuid_inputs_hash", "function_uuid", "inputs_hash"),
 )
@@ -0,0 +1,107 @@
+"""Wallets balance
+- Materialized sum of the credit transactions of each wallet, so that the balance is
+  a single-row read instead of a SUM over all the transactions of the wallet.
+- Maintained by a trigger on `resource_tracker_credit_transactions` (do not write it directly)
+"""
+
+from typing import Final
+
+import sqlalchemy as sa
+
+from ._common import NUMERIC_KWARGS, column_modified_datetime
+from .base import metadata
+from .resource_tracker_credit_transactions import resource_tracker_credit_transactions
+
+resource_tracker_wallet_balances = sa.Table(
+    "resource_tracker_wallet_balances",
+    metadata,
+    sa.Column(
+        "product_name",
+        sa.String,
+        nullable=False,
+        primary_key=True,
+        doc="Product name",
+    ),
+    sa.Column(
+        "wallet_id",
+        sa.BigInteger,
+        nullable=False,
+        primary_key=True,
+        doc="Wallet id",
+    ),
+    sa.Column(
+        "settled_osparc_credits",
+        sa.Numeric(**NUMERIC_KWARGS),  # type: ignore
+        nullable=False,
+        server_default=sa.text("0"),
+        doc="Sum of the credits of the BILLED and IN_DEBT transactions",
+    ),
+    sa.Column(
+        "pending_osparc_credits",
+        sa.Numeric(**NUMERIC_KWARGS),  # type: ignore
+        nullable=False,
+        server_default=sa.text("0"),
+        doc="Sum of the credits of the PENDING transactions (i.e. running services)",
+    ),
+    column_modified_datetime(timezone=True),
+)
+
+
+# ------------------------ TRIGGERS
+DB_PROCEDURE_NAME: Final[str] = "update_resource_tracker_wallet_balances"
+DB_TRIGGER_NAME: Final[str] = f"{DB_PROCEDURE_NAME}_event"
+
+wallet_balance_trigger = sa.DDL(
+    f"""
+DROP TRIGGER IF EXISTS {DB_TRIGGER_NAME} on resource_tracker_credit_transactions;
+CREATE TRIGGER {DB_TRIGGER_NAME}
+AFTER INSERT OR DELETE OR UPDATE OF product_name, wallet_id, osparc_credits, transaction_status
+ON resource_tracker_credit_transactions
+    FOR EACH ROW
+    EXECUTE PROCEDURE {DB_PROCEDURE_NAME}();
+"""
+)
+
+# ---------------------- PROCEDURES
+wallet_balance_procedure = sa.DDL(
+    f"""
+CREATE OR REPLACE FUNCTION {DB_PROCEDURE_NAME}() RETURNS TRIGGER AS $$
+    BEGIN
+        IF (TG_OP = 'UPDATE' OR TG_OP = 'DELETE') THEN
+            INSERT INTO resource_tracker_wallet_balances AS balances
+                (product_name, wallet_id, settled_osparc_credits, pending_osparc_credits)
+            VALUES (
+                OLD.product_name,
+                OLD.wallet_id,
+                CASE WHEN OLD.transaction_status IN ('BILLED', 'IN_DEBT') THEN -OLD.osparc_credits ELSE 0 END,
+                CASE WHEN OLD.transaction_status = 'PENDING' THEN -OLD.osparc_credits ELSE 0 END
+            )
+            ON CONFLICT (product_name, wallet_id) DO UPDATE SET
+                settled_osparc_credits = balances.settled_osparc_credits + EXCLUDED.settled_osparc_credits,
+                pending_osparc_credits = balances.pending_osparc_credits + EXCLUDED.pending_osparc_credits,
+                modified = now();
+        END IF;
+        IF (TG_OP = 'UPDATE' OR TG_OP = 'INSERT') THEN
+            INSERT INTO resource_tracker_wallet_balances AS balances
+                (product_name, wallet_id, settled_osparc_credits, pending_osparc_credits)
+            VALUES (
+                NEW.product_name,
+                NEW.wallet_id,
+                CASE WHEN NEW.transaction_status IN ('BILLED', 'IN_DEBT') THEN NEW.osparc_credits ELSE 0 END,
+                CASE WHEN NEW.transaction_status = 'PENDING' THEN NEW.osparc_credits ELSE 0 END
+            )
+            ON CONFLICT (product_name, wallet_id) DO UPDATE SET
+                settled_osparc_credits = balances.settled_osparc_credits + EXCLUDED.settled_osparc_credits,
+                pending_osparc_credits = balances.pending_osparc_credits + EXCLUDED.pending_osparc_credits,
+                modified = now();
+        END IF;
+        RETURN NULL;
+    END;
+$$ LANGUAGE plpgsql;
+"""
+)
+
+# NOTE: the trigger is set on the transactions table, which must therefore be created first
+resource_tracker_wallet_balances.add_is_dependent_on(resource_tracker_credit_transactions)
+sa.event.listen(resource_tracker_wallet_balances, "after_create", wallet_balance_procedure)
+sa.event.listen(resource_tracker_wallet_balances, "after_create", wallet_balance_trigger)
@@ -0,0 +1,31 @@
+import hashlib
+import json
+from typing import Any
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {f"{k}": _normalize(v) for k, v in value.items()}
+    if isinstance(value, list | tuple):
+        return [_normalize(v) for v in value]
+    if isinstance(value, float) and value.is_integer():
+        # NOTE: 1.0 and 1 are the same input
+        return int(value)
+    return value
+
+
+def compute_function_job_inputs_hash(inputs: dict[str, Any] | None) -> str:
+    """Canonical hash of function job inputs
+
+    Semantically identical inputs (i.e. regardless of keys order or number formatting)
+    get the same hash, which is indexed together with the function to lookup cached jobs.
+
+    WARNING: changing this function requires re-computing the stored hashes (migration)
+    """
+    canonical_json = json.dumps(
+        _normalize(inputs),
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(canonical_json.encode("utf-8")).hexdigest()
@@ -0,0 +1,41 @@
+# pylint: disable=redefined-outer-name
+# pylint: disable=unused-argument
+# pylint: disable=unused-variable
+
+from typing import Any
+
+import pytest
+from simcore_postgres_database.utils_funcapi_function_jobs import (
+    compute_function_job_inputs_hash,
+)
+
+
+@pytest.mark.parametrize(
+    "inputs, equivalent_inputs",
+    [
+        ({"a": 1, "b": "x"}, {"b": "x", "a": 1}),
+        ({"a": 1}, {"a": 1.0}),
+        ({"a": {"c": [1, 2.0], "b": None}}, {"a": {"b": None, "c": [1.0, 2]}}),
+        (None, None),
+    ],
+)
+def test_compute_function_job_inputs_hash_is_canonical(
+    inputs: dict[str, Any] | None, equivalent_inputs: dict[str, Any] | None
+):
+    assert compute_function_job_inputs_hash(inputs) == compute_function_job_inputs_hash(equivalent_inputs)
+
+
+@pytest.mark.parametrize(
+    "inputs, other_inputs",
+    [
+        ({"a": 1}, {"a": 1.5}),
+        ({"a": 1}, {"a": "1"}),
+        ({"a": [1, 2]}, {"a": [2, 1]}),
+        ({"a": True}, {"a": 1}),
+        ({}, None),
+    ],
+)
+def test_compute_function_job_inputs_hash_differs(
+    inputs: dict[str, Any] | None, other_inputs: dict[str, Any] | None
+):
+    assert compute_function_job_inputs_hash(inputs) != compute_function_job_inputs_hash(other_inputs)
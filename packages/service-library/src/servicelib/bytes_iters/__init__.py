@@ -1,3 +1,8 @@
+from ._compression_policy import (
+    DEFAULT_COMPRESSION_POLICY,
+    DEFLATE_ALL_COMPRESSION_POLICY,
+    CompressionPolicy,
+)
 from ._constants import DEFAULT_READ_CHUNK_SIZE
 from ._input import DiskStreamReader
 from ._models import BytesStreamer
@@ -5,10 +10,13 @@ from ._output import DiskStreamWriter
 from ._stream_zip import ArchiveEntries, ArchiveFileEntry, get_zip_bytes_iter
 
 __all__: tuple[str, ...] = (
+    "DEFAULT_COMPRESSION_POLICY",
     "DEFAULT_READ_CHUNK_SIZE",
+    "DEFLATE_ALL_COMPRESSION_POLICY",
     "ArchiveEntries",
     "ArchiveFileEntry",
     "BytesStreamer",
+    "CompressionPolicy",
     "DiskStreamReader",
     "DiskStreamWriter",
     "get_zip_bytes_iter",
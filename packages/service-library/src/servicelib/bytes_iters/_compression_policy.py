@@ -0,0 +1,89 @@
+import zlib
+from dataclasses import dataclass, field
+from pathlib import PurePosixPath
+from typing import Final
+
+from pydantic import ByteSize, TypeAdapter
+from stream_zip import ZIP_AUTO, Method
+
+# NOTE: deflate level 0 emits "stored" deflate blocks: the member remains streamable
+# (no need to know the CRC-32 upfront, as with NO_COMPRESSION_*) but costs ~no CPU
+STORE_COMPRESSION_LEVEL: Final[int] = 0
+DEFAULT_DEFLATE_COMPRESSION_LEVEL: Final[int] = 9
+
+_DEFAULT_PROBE_SIZE: Final[int] = TypeAdapter(ByteSize).validate_python("64KiB")
+_PROBE_COMPRESSION_LEVEL: Final[int] = 1
+
+ALREADY_COMPRESSED_EXTENSIONS: Final[frozenset[str]] = frozenset(
+    {
+        # archives
+        ".7z",
+        ".br",
+        ".bz2",
+        ".gz",
+        ".lz4",
+        ".rar",
+        ".tgz",
+        ".xz",
+        ".zip",
+        ".zst",
+        # images
+        ".gif",
+        ".jpeg",
+        ".jpg",
+        ".png",
+        ".webp",
+        # audio/video
+        ".avi",
+        ".flac",
+        ".mkv",
+        ".mov",
+        ".mp3",
+        ".mp4",
+        ".ogg",
+        ".webm",
+        # compressed containers
+        ".docx",
+        ".npz",
+        ".pptx",
+        ".xlsx",
+    }
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class CompressionPolicy:
+    """Selects how each member of a zip archive is compressed
+
+    - files with a known already-compressed extension are stored
+    - otherwise a cheap probe compresses the beginning of the file (first chunk):
+      if it does not shrink below `min_compression_ratio` the file is stored
+    - all other files are deflated with `deflate_level`
+    """
+
+    store_extensions: frozenset[str] = field(default=ALREADY_COMPRESSED_EXTENSIONS)
+    probe_size: int = _DEFAULT_PROBE_SIZE
+    min_compression_ratio: float = 0.9
+    deflate_level: int = DEFAULT_DEFLATE_COMPRESSION_LEVEL
+
+    def select_compression_level(self, file_name: str, first_chunk: bytes) -> int:
+        if PurePosixPath(file_name).suffix.lower() in self.store_extensions:
+            return STORE_COMPRESSION_LEVEL
+
+        probe = first_chunk[: self.probe_size]
+        if probe and self.probe_size > 0:
+            compressed_probe_size = len(zlib.compress(probe, level=_PROBE_COMPRESSION_LEVEL))
+            if compressed_probe_size >= len(probe) * self.min_compression_ratio:
+                return STORE_COMPRESSION_LEVEL
+
+        return self.deflate_level
+
+    def select_method(self, file_name: str, first_chunk: bytes, *, uncompressed_size: int) -> Method:
+        return ZIP_AUTO(uncompressed_size, level=self.select_compression_level(file_name, first_chunk))
+
+
+DEFAULT_COMPRESSION_POLICY: Final[CompressionPolicy] = CompressionPolicy()
+# NOTE: previous behaviour, every member is deflated
+DEFLATE_ALL_COMPRESSION_POLICY: Final[CompressionPolicy] = CompressionPolicy(
+    store_extensions=frozenset(), probe_size=0
+)
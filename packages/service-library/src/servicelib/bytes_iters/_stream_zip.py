@@ -1,12 +1,13 @@
 import logging
-from collections.abc import AsyncIterable
+from collections.abc import AsyncIterable, AsyncIterator
 from datetime import UTC, datetime
 from stat import S_IFREG
 
 from models_library.bytes_iters import BytesIter, DataSize
-from stream_zip import ZIP_64, AsyncMemberFile, async_stream_zip
+from stream_zip import AsyncMemberFile, async_stream_zip
 
 from ..progress_bar import ProgressBarData
+from ._compression_policy import DEFAULT_COMPRESSION_POLICY, CompressionPolicy
 from ._models import BytesStreamer
 
 _logger = logging.getLogger(__name__)
@@ -16,16 +17,28 @@ type ArchiveFileEntry = tuple[FileNameInArchive, BytesStreamer]
 type ArchiveEntries = list[ArchiveFileEntry]
 
 
+async def _prepend_chunk(first_chunk: bytes, bytes_iter: AsyncIterator[bytes]) -> BytesIter:
+    if first_chunk:
+        yield first_chunk
+    async for chunk in bytes_iter:
+        yield chunk
+
+
 async def _member_files_iter(
-    archive_entries: ArchiveEntries, progress_bar: ProgressBarData
+    archive_entries: ArchiveEntries,
+    progress_bar: ProgressBarData,
+    compression_policy: CompressionPolicy,
 ) -> AsyncIterable[AsyncMemberFile]:
     for file_name, byte_streamer in archive_entries:
+        # the first chunk is used to select the compression method
+        bytes_iter = aiter(byte_streamer.with_progress_bytes_iter(progress_bar=progress_bar))
+        first_chunk = await anext(bytes_iter, b"")
         yield (
             file_name,
             datetime.now(UTC),
             S_IFREG | 0o600,
-            ZIP_64,
-            byte_streamer.with_progress_bytes_iter(progress_bar=progress_bar),
+            compression_policy.select_method(file_name, first_chunk, uncompressed_size=byte_streamer.data_size),
+            _prepend_chunk(first_chunk, bytes_iter),
         )
 
 
@@ -34,6 +47,7 @@ async def get_zip_bytes_iter(
     *,
     progress_bar: ProgressBarData | None = None,
     chunk_size: int,
+    compression_policy: CompressionPolicy = DEFAULT_COMPRESSION_POLICY,
 ) -> BytesIter:
     # NOTE: this is CPU bound task, even though the loop is not blocked,
     # the CPU is still used for compressing the content.
@@ -46,7 +60,10 @@ async def get_zip_bytes_iter(
     async with progress_bar.sub_progress(
         steps=total_stream_length, description=description, progress_unit="Byte"
     ) as sub_progress:
-        # NOTE: do not disable compression or the streams will be
-        # loaded fully in memory before yielding their content
-        async for chunk in async_stream_zip(_member_files_iter(archive_entries, sub_progress), chunk_size=chunk_size):
+        # NOTE: do not use NO_COMPRESSION_* methods or the streams will be
+        # loaded fully in memory before yielding their content, the compression_policy
+        # "stores" members with a deflate level of 0 instead
+        async for chunk in async_stream_zip(
+            _member_files_iter(archive_entries, sub_progress, compression_policy), chunk_size=chunk_size
+        ):
             yield chunk
@@ -115,3 +115,12 @@ class BaseDeferredHandler(ABC, Generic[ResultType]):
             `True` while task execution is not finished
             `False` if task is no longer present
         """
+
+    @classmethod
+    @abstractmethod
+    async def are_present(cls, task_uids: list[TaskUID]) -> list[bool]:
+        """same as ``is_present`` for multiple deferred at once (in a single round trip)
+
+        Returns:
+            for each of the `task_uids` (in the same order) if it is still present
+        """
@@ -5,10 +5,17 @@ from ._task_schedule import TaskScheduleModel
 
 
 class BaseTaskTracker(ABC):
+    async def setup(self) -> None:  # noqa: B027
+        """called once before the tracker is used"""
+
     @abstractmethod
     async def get_new_unique_identifier(self) -> TaskUID:
         """provides a unique identifier for a new task"""
 
+    @abstractmethod
+    async def are_present(self, task_uids: list[TaskUID]) -> list[bool]:
+        """returns for each of the provided task unique ids if an entry exists (in the same order)"""
+
     @abstractmethod
     async def get(self, task_uid: TaskUID) -> TaskScheduleModel | None:
         """returns the given entry for provided task unique id"""
@@ -109,6 +109,20 @@ class _PatchIsPresent:
         return await self.manager_is_present(task_uid)
 
 
+class _PatchArePresent:
+    def __init__(
+        self,
+        *,
+        original_are_present: Callable[[list[TaskUID]], Awaitable[list[bool]]],
+        manager_are_present: Callable[[list[TaskUID]], Awaitable[list[bool]]],
+    ) -> None:
+        self.original_are_present = original_are_present
+        self.manager_are_present = manager_are_present
+
+    async def __call__(self, task_uids: list[TaskUID]) -> list[bool]:
+        return await self.manager_are_present(task_uids)
+
+
 def _log_state(task_state: TaskState, task_uid: TaskUID) -> None:
     _logger.debug("Handling state '%s' for task_uid '%s'", task_state, task_uid)
 
@@ -220,6 +234,18 @@ class DeferredManager:  # pylint:disable=too-many-instance-attributes
                     )
                     subclass.is_present = patched_is_present  # type: ignore
 
+            if not isinstance(subclass.are_present, _PatchArePresent):
+                with log_context(
+                    _logger,
+                    logging.DEBUG,
+                    f"Patch `are_present` for {class_unique_reference}",
+                ):
+                    patched_are_present = _PatchArePresent(
+                        original_are_present=subclass.are_present,
+                        manager_are_present=self.__are_present,
+                    )
+                    subclass.are_present = patched_are_present  # type: ignore
+
             self._patched_deferred_handlers[class_unique_reference] = subclass
 
     @classmethod
@@ -258,6 +284,16 @@ class DeferredManager:  # pylint:disable=too-many-instance-attributes
                         subclass.is_present.original_is_present  # type: ignore
                     )
 
+            if isinstance(subclass.are_present, _PatchArePresent):
+                with log_context(
+                    _logger,
+                    logging.DEBUG,
+                    f"Remove `are_present` patch for {class_unique_reference}",
+                ):
+                    subclass.are_present = (  # type: ignore
+                        subclass.are_present.original_are_present  # type: ignore
+                    )
+
     def _get_global_queue(self, queue_name: _FastStreamRabbitQueue) -> RabbitQueue:
         # See https://github.com/ITISFoundation/osparc-simcore/pull/8573
         # to understand why QUORUM queues are used here
@@ -564,6 +600,9 @@ class DeferredManager:  # pylint:disable=too-many-instance-attributes
         task_schedule: TaskScheduleModel | None = await self._task_tracker.get(task_uid)
         return task_schedule is not None
 
+    async def __are_present(self, task_uids: list[TaskUID]) -> list[bool]:
+        return await self._task_tracker.are_present(task_uids)
+
     def _register_subscribers(self) -> None:
         # Registers subscribers at runtime instead of import time.
         # Enables code reuse.
@@ -618,6 +657,8 @@ class DeferredManager:  # pylint:disable=too-many-instance-attributes
         )(self._fs_handle_manually_cancelled)
 
     async def setup(self) -> None:
+        await self._task_tracker.setup()
+
         self._register_subscribers()
         self.broker.include_router(self.router)
 
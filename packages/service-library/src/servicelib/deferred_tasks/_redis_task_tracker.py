@@ -1,50 +1,122 @@
-import pickle
 from typing import Final
 from uuid import uuid4
 
 from models_library.basic_types import IDStr
-from pydantic import NonNegativeInt
 
-from ..redis import RedisClientSDK
-from ..utils import logged_gather
+from ..redis import RedisClientSDK, handle_redis_returns_union_types
 from ._base_task_tracker import BaseTaskTracker
 from ._models import TaskUID
+from ._serialization import dumps, loads
 from ._task_schedule import TaskScheduleModel
 
 _TASK_TRACKER_PREFIX: Final[str] = "mm:"
-_MAX_REDIS_CONCURRENCY: Final[NonNegativeInt] = 10
+# NOTE: must not match `_TASK_TRACKER_PREFIX*`, entries under the prefix are all expected to be task schedules
+_TASK_TRACKER_INDEX_KEY: Final[str] = "mm-index"
 
 
 def _get_key(task_uid: TaskUID) -> str:
     return f"{_TASK_TRACKER_PREFIX}{task_uid}"
 
 
+def _to_str(value: bytes | str) -> str:
+    # NOTE: the client is usually created with `decode_responses=False` since values are binary
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _get_task_uid(redis_key: bytes | str) -> TaskUID:
+    return TaskUID(_to_str(redis_key).removeprefix(_TASK_TRACKER_PREFIX))
+
+
+def _get_score(task_schedule: TaskScheduleModel) -> float:
+    return task_schedule.time_started.timestamp()
+
+
 class RedisTaskTracker(BaseTaskTracker):
+    """
+    Task schedules are stored under `mm:{task_uid}` and indexed by a sorted set
+    (`mm-index`) scored by their start time, so that listing them does not
+    SCAN the keyspace
+    """
+
     def __init__(self, redis_client_sdk: RedisClientSDK) -> None:
         self.redis_client_sdk = redis_client_sdk
 
+    async def setup(self) -> None:
+        await self._index_existing_entries()
+
+    async def _index_existing_entries(self) -> None:
+        # NOTE: indexes the entries created before the index existed, this SCANs the keyspace once on setup
+        redis_keys: list[bytes | str] = [
+            x async for x in self.redis_client_sdk.redis.scan_iter(match=f"{_TASK_TRACKER_PREFIX}*")
+        ]
+        if not redis_keys:
+            return
+
+        found_data: list[bytes | None] = await handle_redis_returns_union_types(
+            self.redis_client_sdk.redis.mget(redis_keys)
+        )
+        mapping: dict[str, float] = {
+            _get_task_uid(redis_key): _get_score(loads(data))
+            for redis_key, data in zip(redis_keys, found_data, strict=True)
+            if data is not None
+        }
+        if mapping:
+            await handle_redis_returns_union_types(
+                self.redis_client_sdk.redis.zadd(_TASK_TRACKER_INDEX_KEY, mapping, nx=True)
+            )
+
     async def get_new_unique_identifier(self) -> TaskUID:
         candidate_already_exists = True
         while candidate_already_exists:
             candidate = IDStr(f"{uuid4()}")
-            candidate_already_exists = await self.redis_client_sdk.redis.get(_get_key(candidate)) is not None
+            candidate_already_exists = await self.redis_client_sdk.redis.exists(_get_key(candidate)) > 0
         return TaskUID(candidate)
 
-    async def _get_raw(self, redis_key: str) -> TaskScheduleModel | None:
-        found_data = await self.redis_client_sdk.redis.get(redis_key)
-        return None if found_data is None else pickle.loads(found_data)  # noqa: S301
+    async def are_present(self, task_uids: list[TaskUID]) -> list[bool]:
+        if not task_uids:
+            return []
+
+        async with self.redis_client_sdk.redis.pipeline(transaction=False) as pipe:
+            for task_uid in task_uids:
+                pipe.exists(_get_key(task_uid))
+            results: list[int] = await pipe.execute()
+        return [x > 0 for x in results]
 
     async def get(self, task_uid: TaskUID) -> TaskScheduleModel | None:
-        return await self._get_raw(_get_key(task_uid))
+        found_data = await self.redis_client_sdk.redis.get(_get_key(task_uid))
+        return None if found_data is None else loads(found_data)
 
     async def save(self, task_uid: TaskUID, task_schedule: TaskScheduleModel) -> None:
-        await self.redis_client_sdk.redis.set(_get_key(task_uid), pickle.dumps(task_schedule))
+        async with self.redis_client_sdk.redis.pipeline(transaction=True) as pipe:
+            pipe.set(_get_key(task_uid), dumps(task_schedule))
+            pipe.zadd(_TASK_TRACKER_INDEX_KEY, {task_uid: _get_score(task_schedule)})
+            await pipe.execute()
 
     async def remove(self, task_uid: TaskUID) -> None:
-        await self.redis_client_sdk.redis.delete(_get_key(task_uid))
+        async with self.redis_client_sdk.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(_get_key(task_uid))
+            pipe.zrem(_TASK_TRACKER_INDEX_KEY, task_uid)
+            await pipe.execute()
 
     async def all(self) -> list[TaskScheduleModel]:
-        return await logged_gather(
-            *[self._get_raw(x) async for x in self.redis_client_sdk.redis.scan_iter(match=f"{_TASK_TRACKER_PREFIX}*")],
-            max_concurrency=_MAX_REDIS_CONCURRENCY,
+        index_members: list[bytes | str] = await handle_redis_returns_union_types(
+            self.redis_client_sdk.redis.zrange(_TASK_TRACKER_INDEX_KEY, 0, -1)
+        )
+        if not index_members:
+            return []
+
+        task_uids = [TaskUID(_to_str(x)) for x in index_members]
+
+        found_data: list[bytes | None] = await handle_redis_returns_union_types(
+            self.redis_client_sdk.redis.mget([_get_key(x) for x in task_uids])
         )
+
+        if stale_task_uids := [
+            task_uid for task_uid, data in zip(task_uids, found_data, strict=True) if data is None
+        ]:
+            # NOTE: entries removed without going through the tracker
+            await handle_redis_returns_union_types(
+                self.redis_client_sdk.redis.zrem(_TASK_TRACKER_INDEX_KEY, *stale_task_uids)
+            )
+
+        return [loads(data) for data in found_data if data is not None]
@@ -0,0 +1,144 @@
+"""Compact and versioned encoding of the task schedules stored by the task tracker
+
+Entries are stored as a version header followed by JSON. Values which JSON cannot round-trip
+(e.g. a NodeID in the start context or a pydantic model returned by a handler) are tagged with
+their type, so that they are decoded back to the objects the handlers expect.
+
+Entries pickled by previous versions of the tracker are still readable.
+"""
+
+import base64
+import importlib
+import pickle
+from datetime import date, datetime, timedelta
+from enum import Enum
+from pathlib import Path
+from typing import Any, Final
+from uuid import UUID
+
+from common_library.json_serialization import json_dumps, json_loads
+from pydantic import BaseModel
+
+from ._models import TaskResultSuccess
+from ._task_schedule import TaskScheduleModel
+
+_HEADER_V1: Final[bytes] = b"v1:"
+
+_TYPE_TAG: Final[str] = "$type"
+_VALUE_TAG: Final[str] = "$value"
+_CLASS_TAG: Final[str] = "$class"
+
+
+def _get_class_reference(cls: type) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _get_class(class_reference: str) -> type[BaseModel] | type[Enum]:
+    module_name, qualname = class_reference.split(":", maxsplit=1)
+    obj: Any = importlib.import_module(module_name)
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+    if not (isinstance(obj, type) and issubclass(obj, BaseModel | Enum)):
+        msg = f"'{class_reference}' is not a pydantic model or an enum"
+        raise TypeError(msg)
+    return obj
+
+
+def _tagged(type_name: str, value: Any, **extra: str) -> dict[str, Any]:
+    return {_TYPE_TAG: type_name, **extra, _VALUE_TAG: value}
+
+
+def _encode(obj: Any) -> Any:  # noqa: PLR0911
+    # NOTE: enums are checked first, since they can also be str or int
+    if isinstance(obj, Enum):
+        return _tagged("enum", _encode(obj.value), **{_CLASS_TAG: _get_class_reference(type(obj))})
+    if obj is None or isinstance(obj, bool | int | float | str):
+        return obj
+    if isinstance(obj, list):
+        return [_encode(x) for x in obj]
+    if isinstance(obj, dict):
+        if _TYPE_TAG not in obj and all(isinstance(k, str) for k in obj):
+            return {k: _encode(v) for k, v in obj.items()}
+        return _tagged("dict", [[_encode(k), _encode(v)] for k, v in obj.items()])
+    if isinstance(obj, BaseModel):
+        # NOTE: iterating a model also yields its extra fields
+        return _tagged(
+            "model", {name: _encode(value) for name, value in obj}, **{_CLASS_TAG: _get_class_reference(type(obj))}
+        )
+    if isinstance(obj, tuple | set | frozenset):
+        return _tagged(type(obj).__name__, [_encode(x) for x in obj])
+    if isinstance(obj, UUID):
+        return _tagged("uuid", f"{obj}")
+    if isinstance(obj, datetime):
+        return _tagged("datetime", obj.isoformat())
+    if isinstance(obj, date):
+        return _tagged("date", obj.isoformat())
+    if isinstance(obj, timedelta):
+        return _tagged("timedelta", [obj.days, obj.seconds, obj.microseconds])
+    if isinstance(obj, Path):
+        return _tagged("path", f"{obj}")
+    if isinstance(obj, bytes):
+        return _tagged("bytes", base64.b85encode(obj).decode())
+
+    msg = f"Cannot encode object of type {type(obj)}: {obj!r}"
+    raise TypeError(msg)
+
+
+_DECODERS: Final[dict[str, Any]] = {
+    "tuple": tuple,
+    "set": set,
+    "frozenset": frozenset,
+    "uuid": UUID,
+    "datetime": datetime.fromisoformat,
+    "date": date.fromisoformat,
+    "timedelta": lambda value: timedelta(days=value[0], seconds=value[1], microseconds=value[2]),
+    "path": Path,
+    "bytes": base64.b85decode,
+}
+
+
+def _decode(obj: Any) -> Any:
+    if isinstance(obj, list):
+        return [_decode(x) for x in obj]
+    if not isinstance(obj, dict):
+        return obj
+    if _TYPE_TAG not in obj:
+        return {k: _decode(v) for k, v in obj.items()}
+
+    type_name: str = obj[_TYPE_TAG]
+    value = _decode(obj[_VALUE_TAG])
+    match type_name:
+        case "dict":
+            return dict(value)
+        case "enum" | "model":
+            cls = _get_class(obj[_CLASS_TAG])
+            if issubclass(cls, BaseModel):
+                return cls.model_validate(value, by_name=True)
+            return cls(value)
+        case _:
+            return _DECODERS[type_name](value)
+
+
+def dumps(task_schedule: TaskScheduleModel) -> bytes:
+    # NOTE: only the values which are not typed by the model require tagging
+    data = task_schedule.model_dump(mode="json", exclude={"start_context", "result"})
+    data["start_context"] = _encode(task_schedule.start_context)
+    if task_schedule.result is not None:
+        data["result"] = task_schedule.result.model_dump(mode="json", exclude={"value"})
+        if isinstance(task_schedule.result, TaskResultSuccess):
+            data["result"]["value"] = _encode(task_schedule.result.value)
+    return _HEADER_V1 + json_dumps(data).encode()
+
+
+def loads(data: bytes) -> TaskScheduleModel:
+    if not data.startswith(_HEADER_V1):
+        # NOTE: legacy entries were pickled
+        task_schedule = pickle.loads(data)  # noqa: S301
+        assert isinstance(task_schedule, TaskScheduleModel)  # nosec
+        return task_schedule
+
+    decoded = json_loads(data[len(_HEADER_V1) :])
+    decoded["start_context"] = _decode(decoded["start_context"])
+    if (result := decoded.get("result")) and "value" in result:
+        result["value"] = _decode(result["value"])
+    return TaskScheduleModel.model_validate(decoded)
@@ -9,11 +9,11 @@ from settings_library.redis import RedisDatabase, RedisSettings
 
 from ..redis._client import RedisClientSDK
 from ..redis._utils import handle_redis_returns_union_types
-from ..utils import limited_gather, load_script
+from ..utils import load_script
 from .models import LRTNamespace, TaskData, TaskId
 
 _STORE_TYPE_TASK_DATA: Final[str] = "TD"
-_LIST_CONCURRENCY: Final[int] = 3
+_STORE_TYPE_INDEX: Final[str] = "INDEX"
 _MARKED_FOR_REMOVAL_AT_FIELD: Final[str] = "marked_for_removal_at"
 
 
@@ -59,6 +59,7 @@ class RedisStore:
         )
         await self._client.setup()
         self._register_scripts(self._client)
+        await self._index_existing_tasks_data()
 
     async def shutdown(self) -> None:
         if self._client:
@@ -75,6 +76,16 @@ class RedisStore:
     def _get_redis_task_data_key(self, task_id: TaskId) -> str:
         return f"{self.redis_namespace}:{_STORE_TYPE_TASK_DATA}:{task_id}"
 
+    def _get_redis_task_data_index_key(self) -> str:
+        # NOTE: SET of the keys of all the task data hashes of the namespace (avoids SCANning the keyspace)
+        return f"{self.redis_namespace}:{_STORE_TYPE_INDEX}:{_STORE_TYPE_TASK_DATA}"
+
+    async def _index_existing_tasks_data(self) -> None:
+        # NOTE: indexes the entries created before the index existed, this SCANs the keyspace once on setup
+        hash_keys: list[str] = [x async for x in self._redis.scan_iter(self._get_redis_key_task_data_match())]
+        if hash_keys:
+            await handle_redis_returns_union_types(self._redis.sadd(self._get_redis_task_data_index_key(), *hash_keys))
+
     async def get_task_data(self, task_id: TaskId) -> TaskData | None:
         result: dict[str, Any] = await handle_redis_returns_union_types(
             self._redis.hgetall(
@@ -84,12 +95,11 @@ class RedisStore:
         return TypeAdapter(TaskData).validate_python(_load_from_redis_hash(result)) if result and len(result) else None
 
     async def add_task_data(self, task_id: TaskId, value: TaskData) -> None:
-        await handle_redis_returns_union_types(
-            self._redis.hset(
-                self._get_redis_task_data_key(task_id),
-                mapping=_to_redis_hash_mapping(value.model_dump()),
-            )
-        )
+        hash_key = self._get_redis_task_data_key(task_id)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(hash_key, mapping=_to_redis_hash_mapping(value.model_dump()))
+            pipe.sadd(self._get_redis_task_data_index_key(), hash_key)
+            await pipe.execute()
 
     async def update_task_data(
         self,
@@ -103,17 +113,28 @@ class RedisStore:
         )
 
     async def list_tasks_data(self) -> list[TaskData]:
-        hash_keys: list[str] = [x async for x in self._redis.scan_iter(self._get_redis_key_task_data_match())]
+        index_key = self._get_redis_task_data_index_key()
+        hash_keys: list[str] = sorted(await handle_redis_returns_union_types(self._redis.smembers(index_key)))
+        if not hash_keys:
+            return []
 
-        result = await limited_gather(
-            *[handle_redis_returns_union_types(self._redis.hgetall(key)) for key in hash_keys],
-            limit=_LIST_CONCURRENCY,
-        )
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for key in hash_keys:
+                pipe.hgetall(key)
+            result: list[dict[str, str]] = await pipe.execute()
+
+        if stale_keys := [key for key, item in zip(hash_keys, result, strict=True) if not item]:
+            # e.g. removed without going through this store
+            await handle_redis_returns_union_types(self._redis.srem(index_key, *stale_keys))
 
         return [TypeAdapter(TaskData).validate_python(_load_from_redis_hash(item)) for item in result if item]
 
     async def delete_task_data(self, task_id: TaskId) -> None:
-        await handle_redis_returns_union_types(self._redis.delete(self._get_redis_task_data_key(task_id)))
+        hash_key = self._get_redis_task_data_key(task_id)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.delete(hash_key)
+            pipe.srem(self._get_redis_task_data_index_key(), hash_key)
+            await pipe.execute()
 
     async def mark_for_removal(self, task_id: TaskId) -> None:
         await handle_redis_returns_union_types(
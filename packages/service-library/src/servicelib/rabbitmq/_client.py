@@ -1,5 +1,7 @@
 import asyncio
 import logging
+import weakref
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from functools import partial
 from typing import Annotated, Final
@@ -142,10 +144,20 @@ async def _on_message(
         )
 
 
+def _get_exchange_type(topic: str | None) -> aio_pika.ExchangeType:
+    return aio_pika.ExchangeType.FANOUT if topic is None else aio_pika.ExchangeType.TOPIC
+
+
 @dataclass
 class RabbitMQClient(RabbitMQClientBase):
     _connection_pool: aio_pika.pool.Pool | None = field(init=False, default=None)
     _channel_pool: aio_pika.pool.Pool | None = field(init=False, default=None)
+    # NOTE: exchanges declared by each channel of the pool, so that publishing does not re-declare them
+    # (i.e. no extra round-trip to the broker per message). Robust channels re-declare them on reconnection
+    _channels_exchanges: weakref.WeakKeyDictionary[
+        aio_pika.abc.AbstractChannel,
+        dict[tuple[ExchangeName, aio_pika.ExchangeType], aio_pika.abc.AbstractExchange],
+    ] = field(init=False, default_factory=weakref.WeakKeyDictionary)
 
     def __post_init__(self) -> None:
         # recommendations are 1 connection per process
@@ -184,10 +196,36 @@ class RabbitMQClient(RabbitMQClientBase):
         assert self._connection_pool  # nosec
         async with self._connection_pool.acquire() as connection:
             assert isinstance(connection, aio_pika.RobustConnection)  # nosec
-            channel: aio_pika.abc.AbstractChannel = await connection.channel()
+            # NOTE: with publisher confirms, a publish returns once the broker took responsibility of the message
+            channel: aio_pika.abc.AbstractChannel = await connection.channel(publisher_confirms=True)
             channel.close_callbacks.add(self._channel_close_callback)
+            channel.close_callbacks.add(self._clear_channel_exchanges)
             return channel
 
+    def _clear_channel_exchanges(
+        self,
+        sender: aio_pika.abc.AbstractChannel,
+        exc: BaseException | None,  # pylint: disable=unused-argument  # noqa: ARG002
+    ) -> None:
+        self._channels_exchanges.pop(sender, None)
+
+    async def _get_publish_exchange(
+        self,
+        channel: aio_pika.abc.AbstractChannel,
+        exchange_name: ExchangeName,
+        exchange_type: aio_pika.ExchangeType,
+    ) -> aio_pika.abc.AbstractExchange:
+        channel_exchanges = self._channels_exchanges.setdefault(channel, {})
+        if (exchange := channel_exchanges.get((exchange_name, exchange_type))) is None:
+            exchange = await channel.declare_exchange(
+                exchange_name,
+                exchange_type,
+                durable=True,
+                timeout=_DEFAULT_RABBITMQ_EXECUTION_TIMEOUT_S,
+            )
+            channel_exchanges[(exchange_name, exchange_type)] = exchange
+        return exchange
+
     async def _create_consumer_tag(self, exchange_name) -> ConsumerTag:
         return ConsumerTag(f"{get_rabbitmq_client_unique_name(self.client_name)}_{exchange_name}_{uuid4()}")
 
@@ -370,19 +408,34 @@ class RabbitMQClient(RabbitMQClientBase):
 
         NOTE: changing the type of Exchange will create issues if the name is not changed!
         """
+        await self.publish_batch(exchange_name, [message])
+
+    async def publish_batch(self, exchange_name: ExchangeName, messages: Sequence[RabbitMessage]) -> None:
+        """publish all the messages in the exchange exchange_name (see publish)
+
+        The messages are pipelined on one channel and the call returns once the broker confirmed
+        all of them, i.e. one round-trip per batch instead of one per message.
+
+        Raises:
+            aio_pika.exceptions.DeliveryError: if the broker did not accept one of the messages
+        """
+        if not messages:
+            return
         assert self._channel_pool  # nosec
-        topic = message.routing_key()
 
         async with self._channel_pool.acquire() as channel:
-            exchange = await channel.declare_exchange(
-                exchange_name,
-                (aio_pika.ExchangeType.FANOUT if topic is None else aio_pika.ExchangeType.TOPIC),
-                durable=True,
-                timeout=_DEFAULT_RABBITMQ_EXECUTION_TIMEOUT_S,
-            )
-            await exchange.publish(
-                aio_pika.Message(message.body()),
-                routing_key=message.routing_key() or "",
+            topics = [message.routing_key() for message in messages]
+            exchanges = {
+                exchange_type: await self._get_publish_exchange(channel, exchange_name, exchange_type)
+                for exchange_type in {_get_exchange_type(topic) for topic in topics}
+            }
+            await asyncio.gather(
+                *(
+                    exchanges[_get_exchange_type(topic)].publish(
+                        aio_pika.Message(message.body()), routing_key=topic or ""
+                    )
+                    for message, topic in zip(messages, topics, strict=True)
+                )
             )
 
     async def unsubscribe_consumer(self, queue_name: QueueName, consumer_tag: ConsumerTag) -> None:
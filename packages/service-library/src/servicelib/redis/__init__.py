@@ -17,6 +17,7 @@ from ._project_document_version import (
 )
 from ._project_lock import (
     get_project_locked_state,
+    get_projects_locked_states,
     is_project_locked,
     with_project_locked,
 )
@@ -37,6 +38,7 @@ __all__: tuple[str, ...] = (
     "SemaphoreNotAcquiredError",
     "exclusive",
     "get_project_locked_state",
+    "get_projects_locked_states",
     "handle_redis_returns_union_types",
     "increment_and_return_project_document_version",
     "is_project_locked",
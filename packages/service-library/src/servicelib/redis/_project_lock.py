@@ -1,6 +1,6 @@
 import functools
 import logging
-from collections.abc import Awaitable, Callable, Coroutine
+from collections.abc import Awaitable, Callable, Coroutine, Sequence
 from typing import Any, Final, ParamSpec, TypeVar
 
 from models_library.projects import ProjectID
@@ -95,3 +95,20 @@ async def get_project_locked_state(redis_client: RedisClientSDK, project_uuid: s
     ):
         return ProjectLocked.model_validate_json(lock_value)
     return None
+
+
+async def get_projects_locked_states(
+    redis_client: RedisClientSDK, project_uuids: Sequence[str | ProjectID]
+) -> list[ProjectLocked | None]:
+    """bulk version of get_project_locked_state, reads all the project locks in one round-trip
+
+    Returns:
+        for each project_uuid (same order), its ProjectLocked object if it is locked or None otherwise
+    """
+    if not project_uuids:
+        return []
+    # NOTE: a lock is held as long as its key exists, its value is the ProjectLocked
+    lock_values = await redis_client.redis.mget(
+        [_PROJECT_REDIS_LOCK_KEY.format(project_uuid) for project_uuid in project_uuids]
+    )
+    return [ProjectLocked.model_validate_json(value) if value else None for value in lock_values]
@@ -355,6 +355,7 @@ async def test_deferred_manager_task_is_present(
     task_uid = TaskUID(mocks[MockKeys.ON_DEFERRED_CREATED].call_args_list[0].args[0])
 
     assert await mocked_deferred_handler.is_present(task_uid) is True
+    assert await mocked_deferred_handler.are_present([task_uid, TaskUID("missing")]) == [True, False]
 
     async for attempt in AsyncRetrying(
         wait=wait_fixed(0.01),
@@ -364,6 +365,7 @@ async def test_deferred_manager_task_is_present(
     ):
         with attempt:
             assert await mocked_deferred_handler.is_present(task_uid) is False
+            assert await mocked_deferred_handler.are_present([task_uid]) == [False]
 
     if fail:
         await _assert_mock_call(mocks, key=MockKeys.ON_FINISHED_WITH_ERROR, count=1)
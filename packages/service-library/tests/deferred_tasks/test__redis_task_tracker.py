@@ -2,6 +2,7 @@
 # pylint:disable=unused-argument
 
 
+import pickle
 from datetime import timedelta
 
 import pytest
@@ -44,9 +45,11 @@ async def test_task_tracker_workflow(
 
     await task_tracker.save(task_uid, task_schedule)
     assert await task_tracker.get(task_uid) == task_schedule
+    assert await task_tracker.are_present([task_uid, TaskUID("missing")]) == [True, False]
 
     await task_tracker.remove(task_uid)
     assert await task_tracker.get(task_uid) is None
+    assert await task_tracker.are_present([task_uid]) == [False]
 
 
 @pytest.mark.parametrize("count", [0, 1, 10, 100])
@@ -66,3 +69,20 @@ async def test_task_tracker_list_all_entries(
     entries = await task_tracker.all()
     assert len(entries) == count
     assert entries == [task_schedule for _ in range(count)]
+
+
+async def test_task_tracker_indexes_existing_entries_on_setup(
+    redis_client_sdk_deferred_tasks: RedisClientSDK,
+    task_schedule: TaskScheduleModel,
+):
+    # entries stored before the index existed
+    await redis_client_sdk_deferred_tasks.redis.set("mm:legacy", pickle.dumps(task_schedule))
+
+    task_tracker = RedisTaskTracker(redis_client_sdk_deferred_tasks)
+    assert await task_tracker.all() == []
+
+    await task_tracker.setup()
+    assert await task_tracker.all() == [task_schedule]
+
+    await task_tracker.remove(TaskUID("legacy"))
+    assert await task_tracker.all() == []
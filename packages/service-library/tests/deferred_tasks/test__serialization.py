@@ -0,0 +1,83 @@
+# pylint:disable=redefined-outer-name
+
+import pickle
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+import arrow
+import pytest
+from models_library.api_schemas_webserver.projects_nodes import NodeGetIdle
+from models_library.projects_nodes_io import NodeID
+from pydantic import TypeAdapter
+from servicelib.deferred_tasks._models import TaskResultError, TaskResultSuccess
+from servicelib.deferred_tasks._serialization import dumps, loads
+from servicelib.deferred_tasks._task_schedule import TaskScheduleModel, TaskState
+
+
+@pytest.fixture
+def task_schedule() -> TaskScheduleModel:
+    return TypeAdapter(TaskScheduleModel).validate_python(
+        {
+            "timeout": timedelta(seconds=1, microseconds=3),
+            "total_attempts": 1,
+            "execution_attempts": 2,
+            "class_unique_reference": "mock",
+            "start_context": {},
+            "state": TaskState.WORKER,
+            "wait_cancellation_until": arrow.utcnow().datetime,
+            "result": None,
+        },
+    )
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        1,
+        1.34,
+        "str",
+        [12, 35, 7, "str", 455.66],
+        {"nested": {"$type": "not a tag", 1: (1, 2)}},
+        {1, 2},
+        frozenset({"a"}),
+        uuid4(),
+        arrow.utcnow().datetime,
+        arrow.utcnow().date(),
+        timedelta(days=1, microseconds=1),
+        Path("/a/path"),
+        b"\x00\x80bytes",
+        TaskState.SCHEDULED,
+        NodeGetIdle.from_node_id(NodeID(f"{uuid4()}")),
+    ],
+)
+def test_values_round_trip(task_schedule: TaskScheduleModel, value: Any):
+    task_schedule.start_context = {"value": value}
+    task_schedule.result = TaskResultSuccess(value=value)
+
+    data = dumps(task_schedule)
+    assert data.startswith(b"v1:")
+    decoded = loads(data)
+    assert decoded == task_schedule
+    assert type(decoded.start_context["value"]) is type(value)
+    assert decoded.result
+    assert isinstance(decoded.result, TaskResultSuccess)
+    assert type(decoded.result.value) is type(value)
+
+
+def test_encoding_is_compact(task_schedule: TaskScheduleModel):
+    task_schedule.result = TaskResultError(error="error", str_traceback="traceback")
+    assert loads(dumps(task_schedule)) == task_schedule
+    assert len(dumps(task_schedule)) < len(pickle.dumps(task_schedule))
+
+
+def test_unsupported_values_are_not_encoded(task_schedule: TaskScheduleModel):
+    task_schedule.start_context = {"value": object()}
+    with pytest.raises(TypeError):
+        dumps(task_schedule)
+
+
+def test_legacy_pickled_entries_are_loaded(task_schedule: TaskScheduleModel):
+    assert loads(pickle.dumps(task_schedule)) == task_schedule
@@ -106,3 +106,22 @@ async def test_workflow_multiple_redis_stores_with_different_namespaces(
 
     for store in redis_stores:
         assert await store.list_tasks_data() == []
+
+
+async def test_list_tasks_data_uses_the_index(store: RedisStore, task_data: TaskData) -> None:
+    await store.add_task_data(task_data.task_id, task_data)
+    index_key = store._get_redis_task_data_index_key()  # noqa: SLF001
+    assert await store._redis.smembers(index_key) == {  # noqa: SLF001
+        store._get_redis_task_data_key(task_data.task_id)  # noqa: SLF001
+    }
+
+    # entries created before the index existed are indexed on setup
+    await store._redis.delete(index_key)  # noqa: SLF001
+    assert await store.list_tasks_data() == []
+    await store._index_existing_tasks_data()  # noqa: SLF001
+    assert await store.list_tasks_data() == [task_data]
+
+    # entries removed behind the back of the store are dropped from the index
+    await store._redis.delete(store._get_redis_task_data_key(task_data.task_id))  # noqa: SLF001
+    assert await store.list_tasks_data() == []
+    assert await store._redis.smembers(index_key) == set()  # noqa: SLF001
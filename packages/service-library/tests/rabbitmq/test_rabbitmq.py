@@ -406,6 +406,39 @@ async def test_rabbit_client_pub_sub(
     await _assert_message_received(mocked_message_parser, 1, message)
 
 
+async def test_rabbit_client_publish_batch(
+    create_rabbitmq_client: Callable[[str], RabbitMQClient],
+    random_exchange_name: Callable[[], str],
+    mocked_message_parser: mock.AsyncMock,
+    random_rabbit_message: Callable[..., PytestRabbitMessage],
+    mocker: MockerFixture,
+):
+    consumer = create_rabbitmq_client("consumer")
+    publisher = create_rabbitmq_client("publisher")
+    messages = [random_rabbit_message() for _ in range(50)]
+
+    exchange_name = random_exchange_name()
+    await consumer.subscribe(exchange_name, mocked_message_parser)
+    spied_declare_exchange = mocker.spy(aio_pika.RobustChannel, "declare_exchange")
+    await publisher.publish_batch(exchange_name, messages)
+    await publisher.publish_batch(exchange_name, [])
+    await publisher.publish(exchange_name, messages[0])
+    # the exchange is declared once and then cached
+    assert spied_declare_exchange.call_count == 1
+
+    async for attempt in AsyncRetrying(
+        wait=wait_fixed(0.1),
+        stop=stop_after_delay(5),
+        retry=retry_if_exception_type(AssertionError),
+        reraise=True,
+    ):
+        with attempt:
+            assert mocked_message_parser.call_count == len(messages) + 1
+    assert sorted(call.args[0] for call in mocked_message_parser.call_args_list) == sorted(
+        message.body() for message in [*messages, messages[0]]
+    )
+
+
 @pytest.mark.parametrize("num_subs", [10])
 async def test_rabbit_client_pub_many_subs(
     create_rabbitmq_client: Callable[[str], RabbitMQClient],
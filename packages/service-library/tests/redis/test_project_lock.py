@@ -19,6 +19,7 @@ from servicelib.redis import (
     ProjectLockError,
     RedisClientSDK,
     get_project_locked_state,
+    get_projects_locked_states,
     is_project_locked,
     with_project_locked,
 )
@@ -65,10 +66,13 @@ def mocked_notification_cb() -> mock.AsyncMock:
 async def test_with_project_locked(
     redis_client_sdk: RedisClientSDK,
     project_uuid: ProjectID,
+    faker: Faker,
     owner: Owner,
     project_status: ProjectStatus,
     mocked_notification_cb: mock.AsyncMock,
 ):
+    other_project_uuid = cast(UUID, faker.uuid4(cast_to=None))
+
     @with_project_locked(
         redis_client_sdk,
         project_uuid=project_uuid,
@@ -86,6 +90,10 @@ async def test_with_project_locked(
             owner=owner,
             status=project_status,
         )
+        assert await get_projects_locked_states(redis_client_sdk, [project_uuid, other_project_uuid]) == [
+            locked_state,
+            None,
+        ]
         # check lock name formatting is correct
         redis_lock = await redis_client_sdk.redis.get(_PROJECT_REDIS_LOCK_KEY.format(project_uuid))
         assert redis_lock
@@ -97,6 +105,7 @@ async def test_with_project_locked(
 
     mocked_notification_cb.assert_not_called()
     assert await get_project_locked_state(redis_client_sdk, project_uuid) is None
+    assert await get_projects_locked_states(redis_client_sdk, [project_uuid]) == [None]
     assert await is_project_locked(redis_client_sdk, project_uuid) is False
     await _locked_fct()
     assert await is_project_locked(redis_client_sdk, project_uuid) is False
@@ -1,13 +1,16 @@
 # pylint: disable=redefined-outer-name
 # pylint: disable=unused-argument
 
+import asyncio
 import secrets
+import zipfile
 from collections.abc import AsyncIterable
 from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
 from faker import Faker
+from pytest_benchmark.plugin import BenchmarkFixture
 from pytest_mock import MockerFixture
 from pytest_simcore.helpers.comparing import (
     assert_same_contents,
@@ -16,11 +19,15 @@ from pytest_simcore.helpers.comparing import (
 )
 from servicelib.archiving_utils import unarchive_dir
 from servicelib.bytes_iters import (
+    DEFAULT_COMPRESSION_POLICY,
+    DEFLATE_ALL_COMPRESSION_POLICY,
     ArchiveEntries,
+    CompressionPolicy,
     DiskStreamReader,
     DiskStreamWriter,
     get_zip_bytes_iter,
 )
+from servicelib.bytes_iters._compression_policy import STORE_COMPRESSION_LEVEL
 from servicelib.file_utils import remove_directory
 from servicelib.progress_bar import ProgressBarData
 from servicelib.s3_utils import FileLikeBytesIterReader
@@ -131,3 +138,74 @@ async def test_get_zip_bytes_iter(
         get_files_info_from_path(local_files_dir),
         get_files_info_from_path(local_unpacked_archive),
     )
+
+
+@pytest.mark.parametrize(
+    "file_name, first_chunk, expected_level",
+    [
+        ("archive.zip", b"a" * 1000, STORE_COMPRESSION_LEVEL),
+        ("IMAGE.PNG", b"a" * 1000, STORE_COMPRESSION_LEVEL),
+        ("random.bin", secrets.token_bytes(100_000), STORE_COMPRESSION_LEVEL),
+        ("text.txt", b"some repeated text " * 1000, DEFAULT_COMPRESSION_POLICY.deflate_level),
+        ("empty.txt", b"", DEFAULT_COMPRESSION_POLICY.deflate_level),
+    ],
+)
+def test_compression_policy_select_compression_level(file_name: str, first_chunk: bytes, expected_level: int):
+    assert DEFAULT_COMPRESSION_POLICY.select_compression_level(file_name, first_chunk) == expected_level
+    assert (
+        DEFLATE_ALL_COMPRESSION_POLICY.select_compression_level(file_name, first_chunk)
+        == DEFLATE_ALL_COMPRESSION_POLICY.deflate_level
+    )
+
+
+@pytest.fixture
+def mixed_content_files_dir(local_files_dir: Path, faker: Faker) -> Path:
+    # already compressed/random content mixed with compressible content
+    for i in range(5):
+        (local_files_dir / f"random_{i}.bin").write_bytes(secrets.token_bytes(2 * 1024 * 1024))
+        (local_files_dir / f"data_{i}.zip").write_bytes(secrets.token_bytes(1024 * 1024))
+        (local_files_dir / f"text_{i}.txt").write_text(faker.text(max_nb_chars=10_000) * 100)
+    return local_files_dir
+
+
+async def _zip_files_dir(files_dir: Path, archive_path: Path, compression_policy: CompressionPolicy) -> None:
+    archive_files: ArchiveEntries = [
+        (get_relative_to(files_dir, file), DiskStreamReader(file).get_bytes_streamer())
+        for file in files_dir.rglob("*")
+        if file.is_file()
+    ]
+    await DiskStreamWriter(archive_path).write_from_bytes_iter(
+        get_zip_bytes_iter(archive_files, chunk_size=1024 * 1024, compression_policy=compression_policy)
+    )
+
+
+@pytest.mark.parametrize("compression_policy", [DEFAULT_COMPRESSION_POLICY, DEFLATE_ALL_COMPRESSION_POLICY])
+async def test_get_zip_bytes_iter_with_compression_policy(
+    mixed_content_files_dir: Path, local_archive_path: Path, compression_policy: CompressionPolicy
+):
+    await _zip_files_dir(mixed_content_files_dir, local_archive_path, compression_policy)
+
+    with zipfile.ZipFile(local_archive_path) as archive:
+        assert archive.testzip() is None
+        for info in archive.infolist():
+            original_file = mixed_content_files_dir / info.filename
+            assert archive.read(info) == original_file.read_bytes()
+            if original_file.suffix == ".txt":
+                assert info.compress_size < info.file_size
+
+
+@pytest.mark.skip(reason="manual testing")
+@pytest.mark.parametrize("compression_policy", [DEFAULT_COMPRESSION_POLICY, DEFLATE_ALL_COMPRESSION_POLICY])
+def test_get_zip_bytes_iter_compression_policy_performance(
+    benchmark: BenchmarkFixture,
+    mixed_content_files_dir: Path,
+    local_archive_path: Path,
+    compression_policy: CompressionPolicy,
+):
+    def run_async_test() -> None:
+        asyncio.run(_zip_files_dir(mixed_content_files_dir, local_archive_path, compression_policy))
+
+    benchmark.pedantic(run_async_test, rounds=3)
+
+    with zipfile.ZipFile(local_archive_path) as archive:
+        assert archive.testzip() is None
@@ -11,6 +11,7 @@ from models_library.api_schemas_storage.storage_schemas import (
     FileUploadCompletionBody,
     UploadedPart,
 )
+from models_library.basic_types import SHA256Str
 from models_library.generics import Envelope
 from models_library.projects_nodes_io import LocationID, LocationName
 from models_library.users import UserID
@@ -82,6 +83,7 @@ async def complete_upload(
     parts: list[UploadedPart],
     *,
     is_directory: bool,
+    sha256_checksum: SHA256Str | None = None,
 ) -> CompletedUpload | None:
     """completes a potentially multipart upload in AWS
     NOTE: it can take several minutes to finish, see [AWS documentation](https://docs.aws.amazon.com/AmazonS3/latest/API/API_CompleteMultipartUpload.html)
@@ -91,7 +93,7 @@ async def complete_upload(
     """
     async with session.post(
         _get_https_link_if_storage_secure(f"{upload_completion_link}"),
-        json=jsonable_encoder(FileUploadCompletionBody(parts=parts)),
+        json=jsonable_encoder(FileUploadCompletionBody(parts=parts, sha256_checksum=sha256_checksum)),
         auth=get_basic_auth(),
     ) as resp:
         resp.raise_for_status()
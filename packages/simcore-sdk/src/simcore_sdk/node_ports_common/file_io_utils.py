@@ -1,6 +1,8 @@
 import asyncio
+import hashlib
 import logging
-from collections.abc import AsyncGenerator, Coroutine
+from collections import defaultdict
+from collections.abc import AsyncGenerator, AsyncIterator, Coroutine
 from contextlib import AsyncExitStack
 from dataclasses import dataclass
 from pathlib import Path
@@ -24,7 +26,7 @@ from models_library.api_schemas_storage.storage_schemas import (
 )
 from models_library.basic_types import SHA256Str
 from multidict import MultiMapping
-from pydantic import AnyUrl, NonNegativeInt
+from pydantic import AnyUrl, ByteSize, NonNegativeInt, TypeAdapter
 from servicelib.aiohttp import status
 from servicelib.logging_utils import log_catch
 from servicelib.progress_bar import ProgressBarData
@@ -47,6 +49,7 @@ _logger = logging.getLogger(__name__)
 
 _CONCURRENT_MULTIPART_UPLOADS_COUNT: Final[NonNegativeInt] = 10
 _VALID_HTTP_STATUS_CODES: Final[NonNegativeInt] = 299
+_MAX_INLINE_CHECKSUM_BUFFER_SIZE: Final[ByteSize] = TypeAdapter(ByteSize).validate_python("64MiB")
 
 
 @dataclass(frozen=True)
@@ -57,6 +60,87 @@ class UploadableFileObject:
     sha256_checksum: SHA256Str | None = None
 
 
+class InlineSha256Checksum:
+    """Computes the SHA-256 of a file from the chunks read to upload it, so that the file is read only once.
+
+    Parts are uploaded concurrently but the digest must be computed in order: chunks of parts
+    that arrive before their turn are buffered up to `max_buffer_size`. If that limit is exceeded,
+    or if a part that was already (partially) hashed is re-sent, the checksum cannot be computed
+    inline anymore and `hexdigest` returns None (the caller then needs to compute it separately).
+    """
+
+    def __init__(self, *, max_buffer_size: int = _MAX_INLINE_CHECKSUM_BUFFER_SIZE) -> None:
+        self._sha256 = hashlib.sha256()  # nosec
+        self._max_buffer_size = max_buffer_size
+        self._next_part_index = 0
+        self._next_part_started_hashing = False
+        self._buffered_chunks: defaultdict[int, list[bytes]] = defaultdict(list)
+        self._buffer_size = 0
+        self._completed_parts: set[int] = set()
+        self._failed = False
+
+    def _fail(self, reason: str) -> None:
+        _logger.debug("inline checksum cannot be computed: %s", reason)
+        self._failed = True
+        self._buffered_chunks.clear()
+        self._buffer_size = 0
+
+    def _drop_buffered_chunks(self, part_index: int) -> list[bytes]:
+        chunks = self._buffered_chunks.pop(part_index, [])
+        self._buffer_size -= sum(len(c) for c in chunks)
+        return chunks
+
+    def start_part(self, part_index: int) -> None:
+        if self._failed:
+            return
+        if part_index < self._next_part_index or (
+            part_index == self._next_part_index and self._next_part_started_hashing
+        ):
+            self._fail(f"part {part_index} was re-sent after being hashed")
+            return
+        # the part is (re-)sent from its beginning
+        self._drop_buffered_chunks(part_index)
+        self._completed_parts.discard(part_index)
+
+    def update(self, part_index: int, chunk: bytes) -> None:
+        if self._failed:
+            return
+        if part_index == self._next_part_index:
+            self._sha256.update(chunk)
+            self._next_part_started_hashing = True
+            return
+        self._buffered_chunks[part_index].append(chunk)
+        self._buffer_size += len(chunk)
+        if self._buffer_size > self._max_buffer_size:
+            self._fail(f"more than {self._max_buffer_size} bytes of out-of-order parts")
+
+    def complete_part(self, part_index: int) -> None:
+        if self._failed:
+            return
+        self._completed_parts.add(part_index)
+        while self._next_part_index in self._completed_parts:
+            self._completed_parts.remove(self._next_part_index)
+            self._next_part_index += 1
+            # catch up with what was already received for the new current part
+            chunks = self._drop_buffered_chunks(self._next_part_index)
+            for chunk in chunks:
+                self._sha256.update(chunk)
+            self._next_part_started_hashing = bool(chunks)
+
+    def hexdigest(self, *, num_parts: int) -> SHA256Str | None:
+        if self._failed or self._next_part_index != num_parts:
+            return None
+        return self._sha256.hexdigest()
+
+
+async def _hashed_chunks(
+    chunks: AsyncIterator[bytes], *, part_index: int, checksum: InlineSha256Checksum
+) -> AsyncGenerator[bytes]:
+    async for chunk in chunks:
+        checksum.update(part_index, chunk)
+        yield chunk
+
+
 class _ExtendedClientResponseError(ClientResponseError):
     def __init__(
         self,
@@ -275,18 +359,25 @@ async def _upload_file_part(
     *,
     io_log_redirect_cb: LogRedirectCB | None,
     progress_bar: ProgressBarData,
+    sha256_checksum: InlineSha256Checksum | None,
 ) -> tuple[int, ETag]:
-    file_uploader = _file_chunk_reader(
-        file_to_upload,  # type: ignore
-        offset=file_offset,
-        total_bytes_to_read=file_part_size,
-    )
-    if isinstance(file_to_upload, UploadableFileObject):
-        file_uploader = _file_object_chunk_reader(
-            file_to_upload.file_object,
-            offset=file_offset,
-            total_bytes_to_read=file_part_size,
+    def _create_file_uploader() -> AsyncGenerator[bytes]:
+        file_uploader = (
+            _file_object_chunk_reader(
+                file_to_upload.file_object,
+                offset=file_offset,
+                total_bytes_to_read=file_part_size,
+            )
+            if isinstance(file_to_upload, UploadableFileObject)
+            else _file_chunk_reader(
+                file_to_upload,
+                offset=file_offset,
+                total_bytes_to_read=file_part_size,
+            )
         )
+        if sha256_checksum is None:
+            return file_uploader
+        return _hashed_chunks(file_uploader, part_index=part_index, checksum=sha256_checksum)
 
     async for attempt in AsyncRetrying(
         reraise=True,
@@ -297,6 +388,8 @@ async def _upload_file_part(
         after=after_log(_logger, log_level=logging.ERROR),
     ):
         with attempt:
+            if sha256_checksum is not None:
+                sha256_checksum.start_part(part_index)
             received_e_tag = await _session_put(
                 session=session,
                 file_part_size=file_part_size,
@@ -304,8 +397,11 @@ async def _upload_file_part(
                 pbar=pbar,
                 io_log_redirect_cb=io_log_redirect_cb,
                 progress_bar=progress_bar,
-                file_uploader=file_uploader,
+                file_uploader=_create_file_uploader(),
             )
+            if sha256_checksum is not None:
+                # NOTE: the uploader is not necessarily exhausted once file_part_size bytes were sent
+                sha256_checksum.complete_part(part_index)
             return (part_index, received_e_tag)
     msg = f"Unexpected error while transferring {file_to_upload} to {upload_url}"
     raise exceptions.S3TransferError(msg)
@@ -357,7 +453,12 @@ async def upload_file_to_presigned_links(
     num_retries: int,
     io_log_redirect_cb: LogRedirectCB | None,
     progress_bar: ProgressBarData,
+    sha256_checksum: InlineSha256Checksum | None = None,
 ) -> list[UploadedPart]:
+    """uploads the file to the presigned links
+
+    if sha256_checksum is passed, it is fed with the uploaded chunks (see InlineSha256Checksum)
+    """
     file_size, file_name = _get_file_size_and_name(file_to_upload)
 
     # NOTE: when the file object is already created it cannot be duplicated so
@@ -398,6 +499,7 @@ async def upload_file_to_presigned_links(
                         num_retries=num_retries,
                         io_log_redirect_cb=io_log_redirect_cb,
                         progress_bar=sub_progress,
+                        sha256_checksum=sha256_checksum,
                     )
                 )
             results.extend(
@@ -33,6 +33,7 @@ from ..node_ports_common.client_session_manager import ClientSessionContextManag
 from . import _filemanager_utils, exceptions, r_clone, storage_client
 from ._filemanager_utils import CompletedUpload
 from .file_io_utils import (
+    InlineSha256Checksum,
     LogRedirectCB,
     UploadableFileObject,
     download_link_to_file,
@@ -374,7 +375,12 @@ async def _upload_path(  # pylint: disable=too-many-arguments
         msg = f"Requested to upload directory {path_to_upload}, but no rclone support was detected"
         raise exceptions.NodeportsError(msg)
 
-    checksum: SHA256Str | None = await _generate_checksum(path_to_upload, is_directory=is_directory)
+    # NOTE: the checksum of a local file is computed while uploading it (see _upload_to_s3)
+    # and is reported when completing the upload, storage then keeps it in file_meta_data.
+    # Only a checksum known upfront is also written in the S3 object metadata.
+    checksum: SHA256Str | None = (
+        path_to_upload.sha256_checksum if isinstance(path_to_upload, UploadableFileObject) else None
+    )
     if io_log_redirect_cb:
         await io_log_redirect_cb(f"uploading {path_to_upload}, please wait...")
 
@@ -406,6 +412,7 @@ async def _upload_path(  # pylint: disable=too-many-arguments
                 is_directory=is_directory,
                 session=session,
                 exclude_patterns=exclude_patterns,
+                sha256_checksum=checksum,
             )
         except (
             r_clone.RCloneFailedError,
@@ -442,6 +449,7 @@ async def _upload_to_s3(
     is_directory: bool,
     session: ClientSession,
     exclude_patterns: set[str] | None,
+    sha256_checksum: SHA256Str | None,
 ) -> tuple[CompletedUpload | None, FileUploadSchema]:
     uploaded_parts: list[UploadedPart] = []
     if is_directory:
@@ -459,6 +467,7 @@ async def _upload_to_s3(
             msg = "Unexpected configuration"
             raise RuntimeError(msg)
     else:
+        inline_checksum = InlineSha256Checksum() if sha256_checksum is None else None
         uploaded_parts = await upload_file_to_presigned_links(
             session,
             upload_links,
@@ -466,13 +475,20 @@ async def _upload_to_s3(
             num_retries=NodePortsSettings.create_from_envs().NODE_PORTS_IO_NUM_RETRY_ATTEMPTS,
             io_log_redirect_cb=io_log_redirect_cb,
             progress_bar=progress_bar,
+            sha256_checksum=inline_checksum,
         )
+        if inline_checksum is not None:
+            sha256_checksum = inline_checksum.hexdigest(num_parts=len(uploaded_parts))
+            if sha256_checksum is None:
+                # NOTE: the file could not be hashed while uploading, it is read once more
+                sha256_checksum = await _generate_checksum(path_to_upload, is_directory=is_directory)
     # complete the upload
     completed = await _filemanager_utils.complete_upload(
         session,
         upload_links.links.complete_upload,
         uploaded_parts,
         is_directory=is_directory,
+        sha256_checksum=sha256_checksum,
     )
     return completed, upload_links
 
@@ -3,6 +3,7 @@
 # pylint: disable=protected-access
 
 import asyncio
+import hashlib
 from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable
 from dataclasses import dataclass
 from pathlib import Path
@@ -25,6 +26,7 @@ from servicelib.aiohttp import status
 from servicelib.progress_bar import ProgressBarData
 from simcore_sdk.node_ports_common.exceptions import AwsS3BadRequestRequestTimeoutError
 from simcore_sdk.node_ports_common.file_io_utils import (
+    InlineSha256Checksum,
     _check_for_aws_http_errors,
     _ExtendedClientResponseError,
     _process_batch,
@@ -275,3 +277,98 @@ async def test_upload_file_to_presigned_links(
         )
     assert progress_bar._current_steps == pytest.approx(1)  # noqa: SLF001
     assert uploaded_parts
+
+
+def _feed_part(checksum: InlineSha256Checksum, part_index: int, chunks: list[bytes]) -> None:
+    checksum.start_part(part_index)
+    for chunk in chunks:
+        checksum.update(part_index, chunk)
+    checksum.complete_part(part_index)
+
+
+@pytest.mark.parametrize(
+    "parts_order",
+    [
+        pytest.param([0, 1, 2, 3], id="in order"),
+        pytest.param([3, 2, 1, 0], id="reversed"),
+        pytest.param([1, 0, 3, 2], id="shuffled"),
+    ],
+)
+def test_inline_sha256_checksum(faker: Faker, parts_order: list[int]):
+    parts = [[faker.binary(length=128) for _ in range(3)] for _ in parts_order]
+    checksum = InlineSha256Checksum()
+    for part_index in parts_order:
+        _feed_part(checksum, part_index, parts[part_index])
+
+    expected = hashlib.sha256(b"".join(b"".join(part) for part in parts)).hexdigest()
+    assert checksum.hexdigest(num_parts=len(parts)) == expected
+    assert checksum.hexdigest(num_parts=len(parts) + 1) is None
+
+
+def test_inline_sha256_checksum_interleaved_parts(faker: Faker):
+    parts = [[faker.binary(length=64) for _ in range(4)] for _ in range(2)]
+    checksum = InlineSha256Checksum()
+    checksum.start_part(0)
+    checksum.start_part(1)
+    for chunk_0, chunk_1 in zip(*parts, strict=True):
+        checksum.update(1, chunk_1)
+        checksum.update(0, chunk_0)
+    checksum.complete_part(1)
+    checksum.complete_part(0)
+
+    expected = hashlib.sha256(b"".join(parts[0] + parts[1])).hexdigest()
+    assert checksum.hexdigest(num_parts=2) == expected
+
+
+def test_inline_sha256_checksum_retried_part(faker: Faker):
+    parts = [[faker.binary(length=64)] for _ in range(3)]
+    checksum = InlineSha256Checksum()
+    # a part that was not yet hashed can be retried
+    checksum.start_part(2)
+    checksum.update(2, faker.binary(length=16))
+    _feed_part(checksum, 2, parts[2])
+    _feed_part(checksum, 0, parts[0])
+    _feed_part(checksum, 1, parts[1])
+    expected = hashlib.sha256(b"".join(p[0] for p in parts)).hexdigest()
+    assert checksum.hexdigest(num_parts=3) == expected
+
+    # re-sending an already hashed part cannot be recovered
+    checksum = InlineSha256Checksum()
+    checksum.start_part(0)
+    checksum.update(0, faker.binary(length=16))
+    _feed_part(checksum, 0, parts[0])
+    _feed_part(checksum, 1, parts[1])
+    _feed_part(checksum, 2, parts[2])
+    assert checksum.hexdigest(num_parts=3) is None
+
+
+def test_inline_sha256_checksum_buffer_overflow(faker: Faker):
+    checksum = InlineSha256Checksum(max_buffer_size=100)
+    _feed_part(checksum, 1, [faker.binary(length=64), faker.binary(length=64)])
+    _feed_part(checksum, 0, [faker.binary(length=64)])
+    assert checksum.hexdigest(num_parts=2) is None
+
+
+async def test_upload_file_to_presigned_links_computes_inline_checksum(
+    client_session: ClientSession,
+    create_upload_links: Callable[[int, ByteSize], Awaitable[FileUploadSchema]],
+    create_file_of_size: Callable[[ByteSize], Path],
+):
+    chunk_size = TypeAdapter(ByteSize).validate_python("5MiB")
+    num_links = 3
+    local_file = create_file_of_size(TypeAdapter(ByteSize).validate_python(chunk_size * (num_links - 1) + 1024))
+    upload_links = await create_upload_links(num_links, chunk_size)
+
+    checksum = InlineSha256Checksum()
+    async with ProgressBarData(num_steps=1, description="") as progress_bar:
+        uploaded_parts = await upload_file_to_presigned_links(
+            session=client_session,
+            file_upload_links=upload_links,
+            file_to_upload=local_file,
+            num_retries=0,
+            io_log_redirect_cb=None,
+            progress_bar=progress_bar,
+            sha256_checksum=checksum,
+        )
+    assert len(uploaded_parts) == num_links
+    assert checksum.hexdigest(num_parts=len(uploaded_parts)) == hashlib.sha256(local_file.read_bytes()).hexdigest()
@@ -188,11 +188,18 @@ class StorageApi(BaseServiceClientApi):
         return enveloped_data.data
 
     @_exception_mapper(http_status_map={})
-    async def complete_file_upload(self, *, user_id: int, file: File, uploaded_parts: list[UploadedPart]) -> ETag:
+    async def complete_file_upload(
+        self,
+        *,
+        user_id: int,
+        file: File,
+        uploaded_parts: list[UploadedPart],
+        sha256_checksum: SHA256Str | None = None,
+    ) -> ETag:
         response = await self.client.post(
             f"/locations/{self.SIMCORE_S3_ID}/files/{file.storage_file_id}:complete",
             params={"user_id": f"{user_id}"},
-            json=jsonable_encoder(FileUploadCompletionBody(parts=uploaded_parts)),
+            json=jsonable_encoder(FileUploadCompletionBody(parts=uploaded_parts, sha256_checksum=sha256_checksum)),
         )
         response.raise_for_status()
         file_upload_complete_response = Envelope[FileUploadCompleteResponse].model_validate_json(response.text)
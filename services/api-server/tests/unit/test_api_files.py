@@ -257,6 +257,27 @@ async def test_get_upload_links(
         raise AssertionError
 
 
+async def test_complete_upload_forwards_sha256_checksum(
+    client: AsyncClient,
+    auth: httpx.BasicAuth,
+    mocked_storage_rest_api_base: MockRouter,
+):
+    uploaded_parts = DummyFileData.uploaded_parts().model_copy(update={"sha256_checksum": DummyFileData.checksum()})
+    body = {
+        "client_file": jsonable_encoder(DummyFileData.client_file()),
+        "uploaded_parts": jsonable_encoder(uploaded_parts),
+    }
+    response = await client.post(f"{API_VTAG}/files/{DummyFileData.file().id}:complete", json=body, auth=auth)
+    assert response.status_code == status.HTTP_200_OK
+
+    complete_upload_route = mocked_storage_rest_api_base.routes[
+        "complete_upload_file_v0_locations__location_id__files__file_id__complete_post"
+    ]
+    assert complete_upload_route.called
+    storage_body = FileUploadCompletionBody.model_validate_json(complete_upload_route.calls.last.request.content)
+    assert storage_body.sha256_checksum == DummyFileData.checksum()
+
+
 async def test_get_upload_links_timeout(
     client: AsyncClient,
     auth: httpx.BasicAuth,
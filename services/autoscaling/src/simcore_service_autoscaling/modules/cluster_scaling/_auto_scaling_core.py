@@ -2,7 +2,6 @@ import asyncio
 import collections
 import dataclasses
 import datetime
-import functools
 import itertools
 import logging
 from typing import Final, cast
@@ -23,12 +22,11 @@ from aws_library.ec2._models import AWSTagKey
 from aws_library.ssm._errors import SSMAccessError
 from common_library.logging.logging_errors import create_troubleshooting_log_kwargs
 from fastapi import FastAPI
-from models_library.docker import DockerLabelKey
 from models_library.generated_models.docker_rest_api import Node
-from models_library.products import ProductName
 from models_library.rabbitmq_messages import ProgressType
 from servicelib.logging_utils import log_catch, log_context
 from servicelib.tracing import traced
+from servicelib.utils import limited_gather
 from servicelib.utils_formatting import timedelta_as_minute_second
 from types_aiobotocore_ec2.literals import InstanceTypeType
 
@@ -43,13 +41,9 @@ from ...constants import (
 from ...core.errors import (
     Ec2InvalidDnsNameError,
     Ec2TagDeserializationError,
-    TaskBestFittingInstanceNotFoundError,
-    TaskRequirementsAboveRequiredEC2InstanceTypeError,
-    TaskRequiresUnauthorizedEC2InstanceTypeError,
 )
 from ...core.settings import ApplicationSettings, get_application_settings
 from ...models import (
-    AssignedTasksToInstanceType,
     AssociatedInstance,
     Cluster,
     InstanceToLaunch,
@@ -65,7 +59,6 @@ from ...utils.capacity_distribution import cap_needed_instances
 from ...utils.cluster_scaling import (
     associate_ec2_instances_with_nodes,
     ec2_startup_script,
-    find_selected_instance_type_for_task,
     sort_drained_nodes,
 )
 from ...utils.rabbitmq import (
@@ -73,6 +66,7 @@ from ...utils.rabbitmq import (
     post_tasks_log_message,
     post_tasks_progress_message,
 )
+from ...utils.task_placement import PendingTask, plan_task_placement
 from ...utils.warm_buffer_machines import (
     get_activated_warm_buffer_ec2_tags,
     get_warm_buffer_ec2_instances,
@@ -200,7 +194,8 @@ async def _analyze_current_cluster(
             f"{[_.id for _ in broken_ec2s]}",
         )
     # remove the broken ec2s from the pending ones
-    pending_ec2s = [instance for instance in pending_ec2s if instance not in broken_ec2s]
+    broken_ec2_ids = {instance.id for instance in broken_ec2s}
+    pending_ec2s = [instance for instance in pending_ec2s if instance.id not in broken_ec2_ids]
 
     # analyse attached ec2s
     active_nodes, pending_nodes, all_drained_nodes, retired_nodes = [], [], [], []
@@ -591,85 +586,26 @@ async def _try_start_warm_buffer_instances(
     )
 
 
-def _try_assign_task_to_ec2_instance(
-    task,
-    *,
-    instances: list[AssociatedInstance] | list[NonAssociatedInstance],
-    task_required_ec2_instance: InstanceTypeType | None,
-    task_required_resources: Resources,
-    task_required_docker_node_labels: dict[DockerLabelKey, str],
-    task_product_name: ProductName | None,
-) -> bool:
-    for instance in instances:
-        # Check EC2 instance type
-        if task_required_ec2_instance and (task_required_ec2_instance != instance.ec2_instance.type):
-            continue
-
-        # Combine current node labels + pending labels from assigned tasks to check for compatibility
-        current_labels = instance.osparc_custom_node_labels
-        pending_labels = instance.tasks_required_pending_labels()
-        effective_labels = current_labels | pending_labels
-        if (
-            task_required_docker_node_labels
-            and effective_labels
-            and any(
-                effective_labels.get(label_key) != label_value
-                for label_key, label_value in task_required_docker_node_labels.items()
-            )
-        ):
-            continue
-
-        # Check resources
-        if instance.has_resources_for_task(task_required_resources):
-            instance.assign_task(task, task_required_resources, task_required_docker_node_labels, task_product_name)
-            _logger.debug(
-                "%s",
-                f"assigned task with {task_required_resources=}, {task_required_ec2_instance=}, "
-                f"{task_required_docker_node_labels=} to {instance.ec2_instance.id=}:{instance.ec2_instance.type=}, "
-                f"{instance.available_resources=}, {instance.ec2_instance.resources=}",
-            )
-            return True
-    return False
+_MAX_CONCURRENT_PENDING_TASKS_EVALUATIONS: Final[int] = 20
 
 
-def _try_assign_task_to_ec2_instance_type(
-    task,
-    *,
-    instances: list[AssignedTasksToInstanceType],
-    task_required_ec2_instance: InstanceTypeType | None,
-    task_required_resources: Resources,
-    task_required_labels: dict[DockerLabelKey, str],
-    task_product_name: ProductName | None = None,
-) -> bool:
-    """Try to assign task to an existing instance being created.
-
-    Returns True if task was assigned, False otherwise.
-    Task can only be assigned if:
-    - Instance type matches (if specified)
-    - Resources are available
-    - Labels are compatible (no conflicting label values)
-    """
-    for instance in instances:
-        if task_required_ec2_instance and (task_required_ec2_instance != instance.instance_type.name):
-            continue
-        if not instance.has_resources_for_task(task_required_resources):
-            continue
-
-        # Check label compatibility
-        if not instance.has_compatible_labels(task_required_labels):
-            continue
-
-        # Compatible! Assign task and merge labels
-        instance.assign_task(task, task_required_resources, task_required_labels, task_product_name)
-        _logger.debug(
-            "%s",
-            f"assigned task with {task_required_resources=}, {task_required_ec2_instance=},"
-            f" labels={task_required_labels} to "
-            f"{instance.instance_type=}, "
-            f"{instance.available_resources=}, instance_labels={instance.osparc_custom_node_labels}",
+async def _get_pending_tasks(app: FastAPI, tasks: list, auto_scaling_mode: AutoscalingProvider) -> list[PendingTask]:
+    async def _get_pending_task(task) -> PendingTask:
+        required_instance_type, required_node_labels = await asyncio.gather(
+            auto_scaling_mode.get_task_defined_instance(app, task),
+            auto_scaling_mode.get_task_instance_required_docker_tags(app, task),
+        )
+        return PendingTask(
+            task=task,
+            required_resources=auto_scaling_mode.get_task_required_resources(task),
+            required_instance_type=required_instance_type,
+            required_node_labels=required_node_labels,
+            product_name=auto_scaling_mode.get_task_product_name(task),
         )
-        return True
-    return False
+
+    return await limited_gather(
+        *(_get_pending_task(task) for task in tasks), limit=_MAX_CONCURRENT_PENDING_TASKS_EVALUATIONS
+    )
 
 
 async def _assign_tasks_to_current_cluster(
@@ -689,37 +625,25 @@ async def _assign_tasks_to_current_cluster(
                 be fulfilled by the available machines in the cluster).
             - The same cluster instance passed as input.
     """
-    unassigned_tasks = []
-    assignment_predicates = [
-        functools.partial(_try_assign_task_to_ec2_instance, instances=instances)
-        for instances in (
+    plan = plan_task_placement(
+        await _get_pending_tasks(app, tasks, auto_scaling_mode),
+        cluster_instances=(
             cluster.active_nodes,
             cluster.drained_nodes + cluster.hot_buffer_drained_nodes,
             cluster.pending_nodes,
             cluster.pending_ec2s,
             cluster.warm_buffer_ec2s,
+        ),
+        available_ec2_types=None,
+    )
+    for pending_task, instance in plan.assigned_to_cluster:
+        instance.assign_task(
+            pending_task.task,
+            pending_task.required_resources,
+            pending_task.required_node_labels,
+            pending_task.product_name,
         )
-    ]
-
-    for task in tasks:
-        task_required_resources = auto_scaling_mode.get_task_required_resources(task)
-        task_required_ec2_instance = await auto_scaling_mode.get_task_defined_instance(app, task)
-        task_required_labels = await auto_scaling_mode.get_task_instance_required_docker_tags(app, task)
-        task_product_name = auto_scaling_mode.get_task_product_name(task)
-
-        if any(
-            is_assigned(
-                task,
-                task_required_ec2_instance=task_required_ec2_instance,
-                task_required_resources=task_required_resources,
-                task_required_docker_node_labels=task_required_labels,
-                task_product_name=task_product_name,
-            )
-            for is_assigned in assignment_predicates
-        ):
-            _logger.debug("task %s is assigned to one instance available in cluster", task)
-        else:
-            unassigned_tasks.append(task)
+    unassigned_tasks = [pending_task.task for pending_task in plan.unassigned]
 
     if unassigned_tasks:
         _logger.info(
@@ -739,69 +663,13 @@ async def _find_needed_instances(
     auto_scaling_mode: AutoscalingProvider,
 ) -> dict[InstanceToLaunch, int]:
     # 1. check first the pending task needs
-    # Track which tasks get assigned to which new instances
-    needed_new_instance_types_for_tasks: list[AssignedTasksToInstanceType] = []
-
     with log_context(_logger, logging.DEBUG, msg="finding needed instances"):
-        for task in unassigned_tasks:
-            task_required_resources = auto_scaling_mode.get_task_required_resources(task)
-            task_required_ec2 = await auto_scaling_mode.get_task_defined_instance(app, task)
-            task_required_labels = await auto_scaling_mode.get_task_instance_required_docker_tags(app, task)
-            task_product_name = auto_scaling_mode.get_task_product_name(task)
-
-            # first check if we can assign the task to one of the newly tobe created instances
-            if _try_assign_task_to_ec2_instance_type(
-                task,
-                instances=needed_new_instance_types_for_tasks,
-                task_required_ec2_instance=task_required_ec2,
-                task_required_resources=task_required_resources,
-                task_required_labels=task_required_labels,
-                task_product_name=task_product_name,
-            ):
-                continue
-
-            # so we need to find what we can create now
-            try:
-                # check if exact instance type is needed first
-                if task_required_ec2:
-                    defined_ec2 = find_selected_instance_type_for_task(
-                        task_required_ec2,
-                        available_ec2_types,
-                        task,
-                        task_required_resources,
-                    )
-                    needed_new_instance_types_for_tasks.append(
-                        AssignedTasksToInstanceType(
-                            instance_type=defined_ec2,
-                            assigned_tasks=[task],
-                            available_resources=defined_ec2.resources - task_required_resources,
-                            osparc_custom_node_labels=task_required_labels,
-                            _assigned_task_product_names={task_product_name} if task_product_name else set(),
-                        )
-                    )
-                else:
-                    # we go for best fitting type
-                    best_ec2_instance = utils_ec2.find_best_fitting_ec2_instance(
-                        available_ec2_types,
-                        task_required_resources,
-                        score_type=utils_ec2.closest_instance_policy,
-                    )
-                    needed_new_instance_types_for_tasks.append(
-                        AssignedTasksToInstanceType(
-                            instance_type=best_ec2_instance,
-                            assigned_tasks=[task],
-                            available_resources=best_ec2_instance.resources - task_required_resources,
-                            osparc_custom_node_labels=task_required_labels,
-                            _assigned_task_product_names={task_product_name} if task_product_name else set(),
-                        )
-                    )
-            except TaskBestFittingInstanceNotFoundError:
-                _logger.exception("Task %s needs more resources: ", f"{task}")
-            except (
-                TaskRequirementsAboveRequiredEC2InstanceTypeError,
-                TaskRequiresUnauthorizedEC2InstanceTypeError,
-            ):
-                _logger.exception("Unexpected error:")
+        plan = plan_task_placement(
+            await _get_pending_tasks(app, unassigned_tasks, auto_scaling_mode),
+            cluster_instances=(),
+            available_ec2_types=available_ec2_types,
+        )
+    needed_new_instance_types_for_tasks = plan.new_instances
 
     _logger.info(
         "found %d required instances: %s",
@@ -1540,26 +1408,29 @@ async def auto_scale_cluster(*, app: FastAPI, auto_scaling_mode: AutoscalingProv
     """Check that there are no pending tasks requiring additional resources in the cluster (docker swarm)
     If there are such tasks, this method will allocate new machines in AWS to cope with
     the additional load.
+
+    NOTE: the cluster state (e.g. the docker tasks) used to compute resources is queried once per call
     """
-    # current state
-    allowed_instance_types = await _sorted_allowed_instance_types(app, auto_scaling_mode)
+    async with auto_scaling_mode.cluster_snapshot_scope(app):
+        # current state
+        allowed_instance_types = await _sorted_allowed_instance_types(app, auto_scaling_mode)
 
-    cluster = await _analyze_current_cluster(app, auto_scaling_mode, allowed_instance_types)
+        cluster = await _analyze_current_cluster(app, auto_scaling_mode, allowed_instance_types)
 
-    # cleanup
-    cluster = await _cleanup_disconnected_nodes(app, cluster)
-    cluster = await _terminate_broken_ec2s(app, cluster)
-    cluster = await _try_attach_pending_ec2s(app, cluster, auto_scaling_mode)
-    cluster = await _drain_retired_nodes(app, cluster)
+        # cleanup
+        cluster = await _cleanup_disconnected_nodes(app, cluster)
+        cluster = await _terminate_broken_ec2s(app, cluster)
+        cluster = await _try_attach_pending_ec2s(app, cluster, auto_scaling_mode)
+        cluster = await _drain_retired_nodes(app, cluster)
 
-    # desired state
-    cluster = await _autoscale_cluster(app, cluster, auto_scaling_mode, allowed_instance_types)
+        # desired state
+        cluster = await _autoscale_cluster(app, cluster, auto_scaling_mode, allowed_instance_types)
 
-    # keep hot buffer EC2 tag in sync for easy identification
-    await _sync_hot_buffer_ec2_tags(app, cluster)
+        # keep hot buffer EC2 tag in sync for easy identification
+        await _sync_hot_buffer_ec2_tags(app, cluster)
 
-    # take care of hot buffer pre-pulling
-    await _pre_pull_docker_images_on_idle_hot_buffers(app, cluster)
-    # notify
-    await _notify_machine_creation_progress(app, cluster)
-    await _notify_autoscaling_status(app, cluster, auto_scaling_mode)
+        # take care of hot buffer pre-pulling
+        await _pre_pull_docker_images_on_idle_hot_buffers(app, cluster)
+        # notify
+        await _notify_machine_creation_progress(app, cluster)
+        await _notify_autoscaling_status(app, cluster, auto_scaling_mode)
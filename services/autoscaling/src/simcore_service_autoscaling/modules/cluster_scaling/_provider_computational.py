@@ -1,6 +1,8 @@
 import collections
+import contextlib
 import dataclasses
 import logging
+from collections.abc import AsyncIterator
 from typing import Any, cast
 
 from aws_library.ec2 import EC2InstanceData, EC2Tags, Resources
@@ -48,6 +50,13 @@ def _scheduler_auth(app: FastAPI) -> ClusterAuthentication:
 
 
 class ComputationalAutoscalingProvider:
+    @contextlib.asynccontextmanager
+    async def cluster_snapshot_scope(self, app: FastAPI) -> AsyncIterator[None]:
+        assert self  # nosec
+        assert app  # nosec
+        # NOTE: used resources come from the dask scheduler, nothing to share
+        yield
+
     async def get_monitored_nodes(self, app: FastAPI) -> list[Node]:
         assert self  # nosec
         return await utils_docker.get_worker_nodes(get_docker_client(app))
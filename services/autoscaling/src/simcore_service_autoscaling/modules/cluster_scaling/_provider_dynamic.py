@@ -1,4 +1,7 @@
+import asyncio
+import contextlib
 import dataclasses
+from collections.abc import AsyncIterator
 
 from aws_library.ec2 import EC2InstanceData, EC2Tags, Resources
 from aws_library.ec2._models import EC2InstanceType
@@ -17,6 +20,31 @@ from ..docker import get_docker_client
 
 
 class DynamicAutoscalingProvider:
+    def __init__(self) -> None:
+        self._in_snapshot_scope = False
+        self._tasks_snapshot: utils_docker.ClusterTasksSnapshot | None = None
+        self._tasks_snapshot_lock = asyncio.Lock()
+
+    @contextlib.asynccontextmanager
+    async def cluster_snapshot_scope(self, app: FastAPI) -> AsyncIterator[None]:
+        assert app  # nosec
+        self._in_snapshot_scope = True
+        try:
+            yield
+        finally:
+            self._in_snapshot_scope = False
+            self._tasks_snapshot = None
+
+    async def _get_tasks_snapshot(self, app: FastAPI) -> utils_docker.ClusterTasksSnapshot | None:
+        # NOTE: outside of a scope, every call queries docker
+        if not self._in_snapshot_scope:
+            return None
+        # NOTE: the pending tasks are evaluated concurrently, the snapshot is only taken once
+        async with self._tasks_snapshot_lock:
+            if self._tasks_snapshot is None:
+                self._tasks_snapshot = await utils_docker.create_cluster_tasks_snapshot(get_docker_client(app))
+        return self._tasks_snapshot
+
     async def get_monitored_nodes(self, app: FastAPI) -> list[Node]:
         assert self  # nosec
         app_settings = get_application_settings(app)
@@ -43,6 +71,7 @@ class DynamicAutoscalingProvider:
         return await utils_docker.pending_service_tasks_with_insufficient_resources(
             get_docker_client(app),
             service_labels=app_settings.AUTOSCALING_NODES_MONITORING.NODES_MONITORING_SERVICE_LABELS,
+            tasks_snapshot=await self._get_tasks_snapshot(app),
         )
 
     def get_task_required_resources(self, task) -> Resources:
@@ -51,11 +80,15 @@ class DynamicAutoscalingProvider:
 
     async def get_task_defined_instance(self, app: FastAPI, task) -> InstanceTypeType | None:
         assert self  # nosec
-        return await utils_docker.get_task_instance_restriction(get_docker_client(app), task)
+        return await utils_docker.get_task_instance_restriction(
+            get_docker_client(app), task, tasks_snapshot=await self._get_tasks_snapshot(app)
+        )
 
     async def get_task_instance_required_docker_tags(self, app: FastAPI, task) -> dict[DockerLabelKey, str]:
         assert self  # nosec
-        return await utils_docker.get_task_osparc_custom_docker_placement_constraints(get_docker_client(app), task)
+        return await utils_docker.get_task_osparc_custom_docker_placement_constraints(
+            get_docker_client(app), task, tasks_snapshot=await self._get_tasks_snapshot(app)
+        )
 
     def get_task_product_name(self, task) -> ProductName | None:
         assert self  # nosec
@@ -70,12 +103,17 @@ class DynamicAutoscalingProvider:
             docker_client,
             instance.node,
             service_labels=app_settings.AUTOSCALING_NODES_MONITORING.NODES_MONITORING_SERVICE_LABELS,
+            tasks_snapshot=await self._get_tasks_snapshot(app),
         )
 
     async def compute_cluster_used_resources(self, app: FastAPI, instances: list[AssociatedInstance]) -> Resources:
         assert self  # nosec
         docker_client = get_docker_client(app)
-        return await utils_docker.compute_cluster_used_resources(docker_client, [i.node for i in instances])
+        return await utils_docker.compute_cluster_used_resources(
+            docker_client,
+            [i.node for i in instances],
+            tasks_snapshot=await self._get_tasks_snapshot(app) if instances else None,
+        )
 
     async def compute_cluster_total_resources(self, app: FastAPI, instances: list[AssociatedInstance]) -> Resources:
         assert self  # nosec
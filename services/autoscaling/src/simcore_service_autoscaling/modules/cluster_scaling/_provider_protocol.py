@@ -1,3 +1,4 @@
+from contextlib import AbstractAsyncContextManager
 from typing import Protocol
 
 from aws_library.ec2 import EC2InstanceData, EC2Tags, Resources
@@ -12,6 +13,10 @@ from ...models import AssociatedInstance
 
 
 class AutoscalingProvider(Protocol):
+    def cluster_snapshot_scope(self, app: FastAPI) -> AbstractAsyncContextManager[None]:
+        """within this scope, the cluster state used to compute resources is queried once and shared"""
+        ...
+
     async def get_monitored_nodes(self, app: FastAPI) -> list[DockerNode]: ...
 
     def get_ec2_tags(self, app: FastAPI) -> EC2Tags: ...
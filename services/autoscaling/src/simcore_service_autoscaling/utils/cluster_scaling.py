@@ -27,14 +27,17 @@ _logger = logging.getLogger(__name__)
 def associate_ec2_instances_with_nodes(
     nodes: list[Node], ec2_instances: list[EC2InstanceData]
 ) -> tuple[list[AssociatedInstance], list[EC2InstanceData]]:
-    """returns the associated and non-associated instances"""
-    associated_instances: list[AssociatedInstance] = []
-    non_associated_instances: list[EC2InstanceData] = []
+    """returns the associated and non-associated instances
 
-    def _find_node_with_name(node: Node) -> bool:
-        assert node.description  # nosec
-        return bool(node.description.hostname == docker_node_name)
+    NOTE: the nodes are indexed by host name, so that this stays linear with the size of the cluster
+    """
+    nodes_by_host_name: dict[str, Node] = {}
+    for node in nodes:
+        if node.description and node.description.hostname:
+            nodes_by_host_name.setdefault(node.description.hostname, node)
 
+    associated_instances: list[AssociatedInstance] = []
+    non_associated_instances: list[EC2InstanceData] = []
     for instance_data in ec2_instances:
         try:
             docker_node_name = utils_ec2.node_host_name_from_ec2_private_dns(instance_data)
@@ -43,7 +46,7 @@ def associate_ec2_instances_with_nodes(
             non_associated_instances.append(instance_data)
             continue
 
-        if node := next(iter(filter(_find_node_with_name, nodes)), None):
+        if node := nodes_by_host_name.get(docker_node_name):
             associated_instances.append(
                 AssociatedInstance(
                     node=node,
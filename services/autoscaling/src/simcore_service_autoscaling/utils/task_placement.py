@@ -0,0 +1,371 @@
+"""Placement of pending tasks onto the cluster instances and onto the instances to launch
+
+The planner is pure and synchronous: it works on a snapshot of the pending tasks,
+of the cluster instances and of the allowed EC2 instance types and does not
+modify any of them. Tasks are placed best-fit-decreasing over resource vectors:
+the largest tasks first, each one on the instance it fills the most.
+
+NOTE: like the rest of the autoscaling, this is only an estimation, the actual
+scheduling is done by Dask/Docker (depending on the mode)
+"""
+
+import logging
+import math
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Final
+
+from aws_library.ec2 import EC2InstanceType, Resources
+from models_library.docker import DockerLabelKey
+from models_library.products import ProductName
+from pydantic import ByteSize
+from types_aiobotocore_ec2.literals import InstanceTypeType
+
+from ..core.errors import (
+    TaskBestFittingInstanceNotFoundError,
+    TaskRequirementsAboveRequiredEC2InstanceTypeError,
+    TaskRequiresUnauthorizedEC2InstanceTypeError,
+)
+from ..models import AssignedTasksToInstanceType, AssociatedInstance, NonAssociatedInstance
+from .cluster_scaling import find_selected_instance_type_for_task
+from .utils_ec2 import closest_instance_policy, find_best_fitting_ec2_instance
+
+_logger = logging.getLogger(__name__)
+
+type ClusterInstance = AssociatedInstance | NonAssociatedInstance
+type _Vector = tuple[float, ...]
+type _GenericResourcesKey = tuple[tuple[str, Any], ...]
+type _LabelsKey = tuple[tuple[DockerLabelKey, str], ...]
+
+_NEW_INSTANCES_TIER: Final[int] = -1
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class PendingTask:
+    task: Any
+    required_resources: Resources
+    required_instance_type: InstanceTypeType | None
+    required_node_labels: dict[DockerLabelKey, str]
+    product_name: ProductName | None
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class TaskPlacementPlan:
+    assigned_to_cluster: list[tuple[PendingTask, ClusterInstance]]
+    new_instances: list[AssignedTasksToInstanceType]
+    unassigned: list[PendingTask]
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class _TaskShape:
+    """what identical pending tasks have in common"""
+
+    demand: _Vector
+    generic_resources: _GenericResourcesKey
+    required_instance_type: InstanceTypeType | None
+    required_node_labels: _LabelsKey
+
+
+@dataclass(kw_only=True, slots=True)
+class _Bin:
+    tier: int
+    instance_type_name: str
+    available: list[float]
+    generic_resources: _GenericResourcesKey
+    labels: dict[DockerLabelKey, str]
+    # existing instances must already define the labels required by a task, new ones only must not conflict
+    requires_defined_labels: bool
+    pending_labels: dict[DockerLabelKey, str] = field(default_factory=dict)
+    cluster_instance: ClusterInstance | None = None
+    instance_type: EC2InstanceType | None = None
+    tasks: list[PendingTask] = field(default_factory=list)
+
+
+def _numeric_generic_keys(resources: Iterable[Resources]) -> tuple[str, ...]:
+    return tuple(
+        sorted(
+            {
+                key
+                for resource in resources
+                for key, value in resource.generic_resources.items()
+                if isinstance(value, int | float)
+            }
+        )
+    )
+
+
+def _as_vector(resources: Resources, numeric_keys: tuple[str, ...]) -> _Vector:
+    generic_values = (resources.generic_resources.get(key, 0) for key in numeric_keys)
+    return (
+        float(resources.cpus),
+        float(resources.ram),
+        *(float(value) if isinstance(value, int | float) else 0.0 for value in generic_values),
+    )
+
+
+def _as_resources(vector: Sequence[float], numeric_keys: tuple[str, ...], *, template: Resources) -> Resources:
+    return Resources(
+        cpus=max(vector[0], 0),
+        ram=ByteSize(max(int(vector[1]), 0)),
+        generic_resources=template.generic_resources
+        | {key: value for key, value in zip(numeric_keys, vector[2:], strict=True)},
+    )
+
+
+def _generic_resources_key(resources: Resources) -> _GenericResourcesKey:
+    return tuple(sorted(resources.generic_resources.items()))
+
+
+class _GenericResourcesCompatibility:
+    """the vectors only hold the numeric resources, this checks the rest (e.g. resources only defined on some
+    instances or string resources) the same way `Resources` does"""
+
+    def __init__(self) -> None:
+        self._cache: dict[tuple[_GenericResourcesKey, _GenericResourcesKey], bool] = {}
+
+    def is_compatible(self, task_generic: _GenericResourcesKey, bin_generic: _GenericResourcesKey) -> bool:
+        if not task_generic:
+            return True
+        cache_key = (task_generic, bin_generic)
+        if (compatible := self._cache.get(cache_key)) is None:
+            compatible = Resources(cpus=0, ram=ByteSize(0), generic_resources=dict(bin_generic)) >= Resources(
+                cpus=0,
+                ram=ByteSize(0),
+                generic_resources={
+                    key: 0 if isinstance(value, int | float) else value for key, value in task_generic
+                },
+            )
+            self._cache[cache_key] = compatible
+        return compatible
+
+
+def _has_compatible_labels(bin_: _Bin, required_labels: _LabelsKey) -> bool:
+    if not required_labels or not bin_.labels:
+        return True
+    if bin_.requires_defined_labels:
+        return all(bin_.labels.get(key) == value for key, value in required_labels)
+    return all(bin_.labels.get(key, value) == value for key, value in required_labels)
+
+
+def _fit_count(available: Sequence[float], demand: _Vector) -> int | None:
+    """how many tasks of `demand` fit in `available`, None means unbounded"""
+    count: int | None = None
+    for free, needed in zip(available, demand, strict=True):
+        if needed <= 0:
+            if free < needed:
+                return 0
+            continue
+        fitting = math.floor(free / needed) if free >= needed else 0
+        count = fitting if count is None else min(count, fitting)
+        if count == 0:
+            return 0
+    return count
+
+
+class _Planner:
+    def __init__(
+        self,
+        pending_tasks: Sequence[PendingTask],
+        cluster_instances: Sequence[Sequence[ClusterInstance]],
+        available_ec2_types: Sequence[EC2InstanceType] | None,
+    ) -> None:
+        self._pending_tasks = pending_tasks
+        self._available_ec2_types = list(available_ec2_types) if available_ec2_types is not None else None
+
+        self._numeric_keys = _numeric_generic_keys(task.required_resources for task in pending_tasks)
+        self._generic_compatibility = _GenericResourcesCompatibility()
+        self._bins: list[_Bin] = [
+            self._create_cluster_instance_bin(tier, instance)
+            for tier, instances in enumerate(cluster_instances)
+            for instance in instances
+        ]
+
+        # NOTE: scales the resources to compare e.g. CPUs with bytes of RAM
+        capacities = [
+            _as_vector(instance.ec2_instance.resources, self._numeric_keys)
+            for instances in cluster_instances
+            for instance in instances
+        ] + [_as_vector(ec2_type.resources, self._numeric_keys) for ec2_type in self._available_ec2_types or []]
+        self._scale: _Vector = tuple(
+            max((capacity[dim] for capacity in capacities), default=0) or 1.0
+            for dim in range(2 + len(self._numeric_keys))
+        )
+        self._selected_instance_types: dict[_TaskShape, EC2InstanceType] = {}
+
+    def _create_cluster_instance_bin(self, tier: int, instance: ClusterInstance) -> _Bin:
+        assert instance.available_resources is not None  # nosec
+        return _Bin(
+            tier=tier,
+            instance_type_name=instance.ec2_instance.type,
+            available=list(_as_vector(instance.available_resources, self._numeric_keys)),
+            generic_resources=_generic_resources_key(instance.ec2_instance.resources),
+            labels=instance.osparc_custom_node_labels | instance.tasks_required_pending_labels(),
+            requires_defined_labels=True,
+            cluster_instance=instance,
+        )
+
+    def _task_shape(self, pending_task: PendingTask) -> _TaskShape:
+        return _TaskShape(
+            demand=_as_vector(pending_task.required_resources, self._numeric_keys),
+            generic_resources=_generic_resources_key(pending_task.required_resources),
+            required_instance_type=pending_task.required_instance_type,
+            required_node_labels=tuple(sorted(pending_task.required_node_labels.items())),
+        )
+
+    def _size(self, demand: _Vector) -> float:
+        return sum(needed / scale for needed, scale in zip(demand, self._scale, strict=True))
+
+    def _is_compatible(self, bin_: _Bin, shape: _TaskShape) -> bool:
+        return (
+            (shape.required_instance_type is None or shape.required_instance_type == bin_.instance_type_name)
+            and self._generic_compatibility.is_compatible(shape.generic_resources, bin_.generic_resources)
+            and _has_compatible_labels(bin_, shape.required_node_labels)
+        )
+
+    def _rank_fitting_bins(self, shape: _TaskShape) -> list[tuple[_Bin, int | None]]:
+        """the instances where the task fits with how many of them fit, best fit first: cluster instances tier by
+        tier (in the order they were given), then new instances, each time the one left with the least free resources
+        """
+        ranked: list[tuple[tuple[float, float], _Bin, int | None]] = []
+        for bin_ in self._bins:
+            if not self._is_compatible(bin_, shape) or (count := _fit_count(bin_.available, shape.demand)) == 0:
+                continue
+            tier = bin_.tier if bin_.tier != _NEW_INSTANCES_TIER else math.inf
+            leftover = sum(
+                (free - needed) / scale
+                for free, needed, scale in zip(bin_.available, shape.demand, self._scale, strict=True)
+            )
+            ranked.append(((tier, leftover), bin_, count))
+        ranked.sort(key=lambda entry: entry[0])
+        return [(bin_, count) for _, bin_, count in ranked]
+
+    def _select_instance_type(self, shape: _TaskShape, pending_task: PendingTask) -> EC2InstanceType:
+        assert self._available_ec2_types is not None  # nosec
+        if (selected := self._selected_instance_types.get(shape)) is None:
+            if pending_task.required_instance_type:
+                selected = find_selected_instance_type_for_task(
+                    pending_task.required_instance_type,
+                    self._available_ec2_types,
+                    pending_task.task,
+                    pending_task.required_resources,
+                )
+            else:
+                selected = find_best_fitting_ec2_instance(
+                    self._available_ec2_types,
+                    pending_task.required_resources,
+                    score_type=closest_instance_policy,
+                )
+            self._selected_instance_types[shape] = selected
+        return selected
+
+    def _create_new_instance_bin(self, shape: _TaskShape, pending_task: PendingTask) -> _Bin | None:
+        try:
+            instance_type = self._select_instance_type(shape, pending_task)
+        except TaskBestFittingInstanceNotFoundError:
+            _logger.exception("Task %s needs more resources: ", f"{pending_task.task}")
+            return None
+        except (
+            TaskRequirementsAboveRequiredEC2InstanceTypeError,
+            TaskRequiresUnauthorizedEC2InstanceTypeError,
+        ):
+            _logger.exception("Unexpected error:")
+            return None
+
+        return _Bin(
+            tier=_NEW_INSTANCES_TIER,
+            instance_type_name=instance_type.name,
+            available=list(_as_vector(instance_type.resources, self._numeric_keys)),
+            generic_resources=_generic_resources_key(instance_type.resources),
+            labels=dict(pending_task.required_node_labels),
+            requires_defined_labels=False,
+            instance_type=instance_type,
+        )
+
+    def _place(self, bin_: _Bin, shape: _TaskShape, tasks: list[PendingTask], count: int | None) -> list[PendingTask]:
+        """places up to `count` tasks (all of them if None), returns the ones that were not placed"""
+        placed, remaining = (tasks, []) if count is None else (tasks[:count], tasks[count:])
+        bin_.tasks.extend(placed)
+        bin_.available = [
+            free - needed * len(placed) for free, needed in zip(bin_.available, shape.demand, strict=True)
+        ]
+        if shape.required_node_labels:
+            bin_.pending_labels |= dict(shape.required_node_labels)
+            # NOTE: new instances are created with the labels of the task they were created for
+            if bin_.requires_defined_labels:
+                bin_.labels |= bin_.pending_labels
+        return remaining
+
+    def _place_shape(self, shape: _TaskShape, tasks: list[PendingTask]) -> list[PendingTask]:
+        """places identical tasks, returns the ones that could not be placed"""
+        remaining = tasks
+        # NOTE: a bin is filled with as many identical tasks as fit, so it does not fit anymore afterwards and the
+        # ranking of the others does not change
+        for bin_, count in self._rank_fitting_bins(shape):
+            if not remaining:
+                break
+            remaining = self._place(bin_, shape, remaining, count)
+
+        while remaining and self._available_ec2_types is not None:
+            new_bin = self._create_new_instance_bin(shape, remaining[0])
+            if new_bin is None or (count := _fit_count(new_bin.available, shape.demand)) == 0:
+                break
+            self._bins.append(new_bin)
+            remaining = self._place(new_bin, shape, remaining, count)
+        return remaining
+
+    def plan(self) -> TaskPlacementPlan:
+        tasks_by_shape: dict[_TaskShape, list[PendingTask]] = {}
+        for pending_task in self._pending_tasks:
+            tasks_by_shape.setdefault(self._task_shape(pending_task), []).append(pending_task)
+
+        unassigned_ids: set[int] = set()
+        # NOTE: largest first (the sort is stable, so equally sized tasks keep their order)
+        for shape in sorted(tasks_by_shape, key=lambda s: self._size(s.demand), reverse=True):
+            unassigned_ids.update(id(task) for task in self._place_shape(shape, tasks_by_shape[shape]))
+
+        return TaskPlacementPlan(
+            assigned_to_cluster=[
+                (pending_task, bin_.cluster_instance)
+                for bin_ in self._bins
+                if bin_.cluster_instance is not None
+                for pending_task in bin_.tasks
+            ],
+            new_instances=[
+                AssignedTasksToInstanceType(
+                    instance_type=bin_.instance_type,
+                    assigned_tasks=[pending_task.task for pending_task in bin_.tasks],
+                    available_resources=_as_resources(
+                        bin_.available, self._numeric_keys, template=bin_.instance_type.resources
+                    ),
+                    osparc_custom_node_labels=bin_.labels,
+                    _pending_label_requirements=bin_.pending_labels,
+                    _assigned_task_product_names={
+                        pending_task.product_name for pending_task in bin_.tasks if pending_task.product_name
+                    },
+                )
+                for bin_ in self._bins
+                if bin_.instance_type is not None
+            ],
+            unassigned=[pending_task for pending_task in self._pending_tasks if id(pending_task) in unassigned_ids],
+        )
+
+
+def plan_task_placement(
+    pending_tasks: Sequence[PendingTask],
+    *,
+    cluster_instances: Sequence[Sequence[ClusterInstance]],
+    available_ec2_types: Sequence[EC2InstanceType] | None,
+) -> TaskPlacementPlan:
+    """Places the pending tasks best-fit-decreasing
+
+    Arguments:
+        pending_tasks -- snapshot of the tasks to place
+        cluster_instances -- groups of instances of the cluster, a group is only used once the tasks do not
+                             fit in the previous ones (e.g. active nodes before drained nodes)
+        available_ec2_types -- if given, the tasks that do not fit in the cluster are placed on new instances
+                               of these types, otherwise they are returned as unassigned
+
+    Returns:
+        the plan, nothing is modified (the tasks still need to be assigned to the cluster instances)
+    """
+    return _Planner(pending_tasks, cluster_instances, available_ec2_types).plan()
@@ -8,6 +8,7 @@ import logging
 import re
 from contextlib import suppress
 from copy import deepcopy
+from dataclasses import dataclass
 from typing import Final, cast
 
 import arrow
@@ -36,7 +37,6 @@ from models_library.services_metadata_runtime import (
 from pydantic import ByteSize, TypeAdapter, ValidationError
 from servicelib.docker_utils import to_datetime
 from servicelib.logging_utils import log_context
-from servicelib.utils import logged_gather
 from settings_library.docker_registry import RegistrySettings
 from types_aiobotocore_ec2.literals import InstanceTypeType
 
@@ -159,16 +159,88 @@ def _is_task_waiting_for_resources(task: Task) -> bool:
         )
 
 
-async def _associated_service_has_no_node_placement_constraints(docker_client: AutoscalingDocker, task: Task) -> bool:
+def _match_docker_label_filters(labels: dict[str, str], label_filters: list[DockerLabelKey]) -> bool:
+    # NOTE: same semantics as the docker "label" filter: "key" or "key=value", all must match
+    for label_filter in label_filters:
+        key, has_value, value = label_filter.partition("=")
+        if key not in labels or (has_value and labels[key] != value):
+            return False
+    return True
+
+
+@dataclass(frozen=True, kw_only=True)
+class ClusterTasksSnapshot:
+    """The docker tasks of the whole cluster at a given time, grouped by node
+
+    Taken with a single `tasks.list` (and `services.list` to resolve service labels and placement
+    constraints) instead of one `tasks.list` per node and one `services.inspect` per pending task,
+    so that the load on the swarm manager does not grow with the cluster.
+    """
+
+    tasks_by_node_id: dict[str, list[Task]]
+    service_labels_by_service_id: dict[str, dict[str, str]]
+    service_placement_constraints_by_service_id: dict[str, list[str]]
+
+    def list_node_tasks(self, node_id: str, service_labels: list[DockerLabelKey] | None = None) -> list[Task]:
+        node_tasks = self.tasks_by_node_id.get(node_id, [])
+        if service_labels is None:
+            return node_tasks
+        return [
+            task
+            for task in node_tasks
+            if task.service_id
+            and _match_docker_label_filters(self.service_labels_by_service_id.get(task.service_id, {}), service_labels)
+        ]
+
+
+async def create_cluster_tasks_snapshot(docker_client: AutoscalingDocker) -> ClusterTasksSnapshot:
+    list_tasks, list_services = await asyncio.gather(docker_client.tasks.list(), docker_client.services.list())
+    tasks_by_node_id: dict[str, list[Task]] = collections.defaultdict(list)
+    for task in TypeAdapter(list[Task]).validate_python(list_tasks):
+        if task.node_id:
+            tasks_by_node_id[task.node_id].append(task)
+    services = [service for service in TypeAdapter(list[Service]).validate_python(list_services) if service.id]
+    return ClusterTasksSnapshot(
+        tasks_by_node_id=dict(tasks_by_node_id),
+        service_labels_by_service_id={
+            service.id: (service.spec.labels if service.spec and service.spec.labels else {}) for service in services
+        },
+        service_placement_constraints_by_service_id={
+            service.id: _get_service_placement_constraints(service)
+            for service in services
+            if service.spec and service.spec.task_template
+        },
+    )
+
+
+def _get_service_placement_constraints(service: Service) -> list[str]:
+    assert service.spec  # nosec
+    assert service.spec.task_template  # nosec
+    if not service.spec.task_template.placement or not service.spec.task_template.placement.constraints:
+        return []
+    return service.spec.task_template.placement.constraints
+
+
+async def _get_task_service_placement_constraints(
+    docker_client: AutoscalingDocker, task: Task, *, tasks_snapshot: ClusterTasksSnapshot | None
+) -> list[str]:
+    # NOTE: services created after the snapshot was taken are inspected
     assert task.service_id  # nosec
+    if tasks_snapshot is not None and (
+        placement_constraints := tasks_snapshot.service_placement_constraints_by_service_id.get(task.service_id)
+    ) is not None:
+        return placement_constraints
     service_inspect = TypeAdapter(Service).validate_python(await docker_client.services.inspect(task.service_id))
-    assert service_inspect.spec  # nosec
-    assert service_inspect.spec.task_template  # nosec
+    return _get_service_placement_constraints(service_inspect)
+
 
-    if not service_inspect.spec.task_template.placement or not service_inspect.spec.task_template.placement.constraints:
-        return True
+async def _associated_service_has_no_node_placement_constraints(
+    docker_client: AutoscalingDocker, task: Task, *, tasks_snapshot: ClusterTasksSnapshot | None
+) -> bool:
+    service_placement_constraints = await _get_task_service_placement_constraints(
+        docker_client, task, tasks_snapshot=tasks_snapshot
+    )
     # parse the placement constraints
-    service_placement_constraints = service_inspect.spec.task_template.placement.constraints
     for constraint in service_placement_constraints:
         # is of type node.id==alskjladskjs or node.hostname==thiscomputerhostname or
         # node.role==manager, sometimes with spaces...
@@ -190,9 +262,12 @@ def _by_created_dt(task: Task) -> datetime.datetime:
 async def pending_service_tasks_with_insufficient_resources(
     docker_client: AutoscalingDocker,
     service_labels: list[DockerLabelKey],
+    *,
+    tasks_snapshot: ClusterTasksSnapshot | None = None,
 ) -> list[Task]:
     """
     Returns the docker service tasks that are currently pending due to missing resources.
+    If `tasks_snapshot` is passed, the placement constraints of their services are taken from it.
 
     Tasks pending with insufficient resources are
     - pending
@@ -219,7 +294,9 @@ async def pending_service_tasks_with_insufficient_resources(
         for task in sorted_tasks
         if (
             _is_task_waiting_for_resources(task)
-            and await _associated_service_has_no_node_placement_constraints(docker_client, task)
+            and await _associated_service_has_no_node_placement_constraints(
+                docker_client, task, tasks_snapshot=tasks_snapshot
+            )
         )
     ]
 
@@ -290,28 +367,20 @@ def get_max_resources_from_docker_task(task: Task) -> Resources:
 
 
 async def get_task_osparc_custom_docker_placement_constraints(
-    docker_client: AutoscalingDocker, task: Task
+    docker_client: AutoscalingDocker, task: Task, *, tasks_snapshot: ClusterTasksSnapshot | None = None
 ) -> dict[DockerLabelKey, str]:
     """Extract custom placement labels from task placement constraints.
 
     Returns a dict mapping label keys (from CUSTOM_PLACEMENT_LABEL_KEYS) to their values.
+    If `tasks_snapshot` is passed, the placement constraints of the task service are taken from it.
     """
     custom_labels: dict[DockerLabelKey, str] = {}
 
     with contextlib.suppress(ValidationError):
-        assert task.service_id  # nosec
-        service_inspect = TypeAdapter(Service).validate_python(await docker_client.services.inspect(task.service_id))
-        assert service_inspect.spec  # nosec
-        assert service_inspect.spec.task_template  # nosec
-
-        if (
-            not service_inspect.spec.task_template.placement
-            or not service_inspect.spec.task_template.placement.constraints
-        ):
-            return custom_labels
-
+        service_placement_constraints = await _get_task_service_placement_constraints(
+            docker_client, task, tasks_snapshot=tasks_snapshot
+        )
         # Parse placement constraints to extract custom labels
-        service_placement_constraints = service_inspect.spec.task_template.placement.constraints
         for label_key in OSPARC_CUSTOM_DOCKER_PLACEMENT_CONSTRAINTS_LABEL_KEYS:
             label_prefix = f"node.labels.{label_key}=="
             for constraint in service_placement_constraints:
@@ -331,20 +400,14 @@ def get_task_product_name(task: Task) -> ProductName | None:
     return None
 
 
-async def get_task_instance_restriction(docker_client: AutoscalingDocker, task: Task) -> InstanceTypeType | None:
+async def get_task_instance_restriction(
+    docker_client: AutoscalingDocker, task: Task, *, tasks_snapshot: ClusterTasksSnapshot | None = None
+) -> InstanceTypeType | None:
+    """if `tasks_snapshot` is passed, the placement constraints of the task service are taken from it"""
     with contextlib.suppress(ValidationError):
-        assert task.service_id  # nosec
-        service_inspect = TypeAdapter(Service).validate_python(await docker_client.services.inspect(task.service_id))
-        assert service_inspect.spec  # nosec
-        assert service_inspect.spec.task_template  # nosec
-
-        if (
-            not service_inspect.spec.task_template.placement
-            or not service_inspect.spec.task_template.placement.constraints
-        ):
-            return None
-        # parse the placement constraints
-        service_placement_constraints = service_inspect.spec.task_template.placement.constraints
+        service_placement_constraints = await _get_task_service_placement_constraints(
+            docker_client, task, tasks_snapshot=tasks_snapshot
+        )
         # should be node.labels.{}
         node_label_to_find = f"node.labels.{DOCKER_TASK_EC2_INSTANCE_TYPE_PLACEMENT_CONSTRAINT_KEY}=="
         for constraint in service_placement_constraints:
@@ -366,18 +429,26 @@ async def compute_node_used_resources(
     docker_client: AutoscalingDocker,
     node: Node,
     service_labels: list[DockerLabelKey] | None = None,
+    *,
+    tasks_snapshot: ClusterTasksSnapshot | None = None,
 ) -> Resources:
+    """if `tasks_snapshot` is passed, the node tasks are taken from it instead of querying docker"""
     cluster_resources_counter = collections.Counter({"ram": 0, "cpus": 0})
     assert node.id  # nosec
-    task_filters: dict[str, str | list[DockerLabelKey]] = {"node": node.id}
-    if service_labels is not None:
-        task_filters |= {"label": service_labels}
-    all_tasks_on_node = TypeAdapter(list[Task]).validate_python(await docker_client.tasks.list(filters=task_filters))
+    if tasks_snapshot is not None:
+        all_tasks_on_node = tasks_snapshot.list_node_tasks(node.id, service_labels)
+    else:
+        task_filters: dict[str, str | list[DockerLabelKey]] = {"node": node.id}
+        if service_labels is not None:
+            task_filters |= {"label": service_labels}
+        all_tasks_on_node = TypeAdapter(list[Task]).validate_python(
+            await docker_client.tasks.list(filters=task_filters)
+        )
     _logger.debug(
-        "found following tasks on node %s: %s, using filters %s",
+        "found following tasks on node %s: %s, using service labels %s",
         node.id,
         [task.id for task in all_tasks_on_node],
-        task_filters,
+        service_labels,
     )
     for task in all_tasks_on_node:
         assert task.status  # nosec
@@ -402,11 +473,23 @@ async def compute_node_used_resources(
     return Resources.model_validate(dict(cluster_resources_counter))
 
 
-async def compute_cluster_used_resources(docker_client: AutoscalingDocker, nodes: list[Node]) -> Resources:
-    """Returns the total amount of resources (reservations) used on each of the given nodes"""
-    list_of_used_resources: list[Resources] = await logged_gather(
-        *(compute_node_used_resources(docker_client, node) for node in nodes)
-    )
+async def compute_cluster_used_resources(
+    docker_client: AutoscalingDocker,
+    nodes: list[Node],
+    *,
+    tasks_snapshot: ClusterTasksSnapshot | None = None,
+) -> Resources:
+    """Returns the total amount of resources (reservations) used on each of the given nodes
+
+    NOTE: the tasks of all the nodes are listed at once (or taken from `tasks_snapshot` if passed)
+    """
+    if not nodes:
+        return Resources.create_as_empty()
+    if tasks_snapshot is None:
+        tasks_snapshot = await create_cluster_tasks_snapshot(docker_client)
+    list_of_used_resources: list[Resources] = [
+        await compute_node_used_resources(docker_client, node, tasks_snapshot=tasks_snapshot) for node in nodes
+    ]
     flat_counter: collections.Counter = collections.Counter()
     for result in list_of_used_resources:
         flat_counter.update(result.as_flat_dict())
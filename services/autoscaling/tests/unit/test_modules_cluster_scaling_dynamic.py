@@ -668,6 +668,7 @@ async def _test_cluster_scaling_up_and_down(  # noqa: PLR0915,C901
     mock_compute_node_used_resources.assert_called_once_with(
         get_docker_client(initialized_app),
         fake_attached_node,
+        tasks_snapshot=mock.ANY,
     )
     mock_compute_node_used_resources.reset_mock()
     # check activate call
@@ -120,6 +120,40 @@ async def test_associate_ec2_instances_with_corresponding_nodes(
         assert associated_instance.node.description.hostname in associated_instance.ec2_instance.aws_private_dns
 
 
+async def test_associate_ec2_instances_with_nodes_with_partial_correspondence(
+    fake_ec2_instance_data: Callable[..., EC2InstanceData],
+    node: Callable[..., DockerNode],
+):
+    host_names = [f"ip-10-12-32-{n + 1}" for n in range(10)]
+    # the first node with a given host name is the one associated
+    nodes = [node(Description={"Hostname": host_name}) for host_name in host_names[::2]]
+    nodes += [node(Description={"Hostname": host_name}) for host_name in host_names]
+    shuffle(nodes)
+    ec2_instances = [fake_ec2_instance_data(aws_private_dns=f"{host_name}.internal-data") for host_name in host_names]
+
+    (
+        associated_instances,
+        non_associated_instances,
+    ) = associate_ec2_instances_with_nodes(nodes, ec2_instances)
+
+    assert not non_associated_instances
+    assert [i.ec2_instance for i in associated_instances] == ec2_instances
+    for associated_instance in associated_instances:
+        assert associated_instance.node.description
+        assert associated_instance.node == next(
+            n
+            for n in nodes
+            if n.description and n.description.hostname == associated_instance.node.description.hostname
+        )
+
+    (
+        associated_instances,
+        non_associated_instances,
+    ) = associate_ec2_instances_with_nodes(nodes[:3], ec2_instances)
+    assert len(associated_instances) == len({n.description.hostname for n in nodes[:3] if n.description})
+    assert len(associated_instances) + len(non_associated_instances) == len(ec2_instances)
+
+
 @pytest.fixture
 def minimal_configuration(
     docker_swarm: None,
@@ -55,6 +55,7 @@ from simcore_service_autoscaling.utils.utils_docker import (
     compute_full_list_of_pre_pulled_images,
     compute_node_used_resources,
     compute_tasks_needed_resources,
+    create_cluster_tasks_snapshot,
     find_node_with_name,
     get_docker_login_on_start_bash_command,
     get_docker_pull_images_on_start_bash_command,
@@ -615,6 +616,52 @@ async def test_get_task_instance_restriction(
     assert instance_type_or_none == expected_instance_type
 
 
+async def test_get_task_placement_constraints_with_tasks_snapshot(
+    autoscaling_docker: AutoscalingDocker,
+    host_node: Node,
+    create_service: Callable[
+        [dict[str, Any], dict[DockerLabelKey, str] | None, str, list[str] | None],
+        Awaitable[Service],
+    ],
+    task_template: dict[str, Any],
+    mocker: MockerFixture,
+):
+    placement_constraints = [
+        "node.labels.user-id==5",
+        f"node.labels.{DOCKER_TASK_EC2_INSTANCE_TYPE_PLACEMENT_CONSTRAINT_KEY}==t3.medium",
+    ]
+    service = await create_service(task_template, None, "pending", placement_constraints)
+    assert service.spec
+    service_tasks = TypeAdapter(list[Task]).validate_python(
+        await autoscaling_docker.tasks.list(filters={"service": service.spec.name})
+    )
+    tasks_snapshot = await create_cluster_tasks_snapshot(autoscaling_docker)
+    spied_services_inspect = mocker.spy(autoscaling_docker.services, "inspect")
+
+    # the services in the snapshot are not inspected
+    for _ in range(3):
+        assert await get_task_instance_restriction(
+            autoscaling_docker, service_tasks[0], tasks_snapshot=tasks_snapshot
+        ) == await get_task_instance_restriction(autoscaling_docker, service_tasks[0])
+        assert await get_task_osparc_custom_docker_placement_constraints(
+            autoscaling_docker, service_tasks[0], tasks_snapshot=tasks_snapshot
+        ) == await get_task_osparc_custom_docker_placement_constraints(autoscaling_docker, service_tasks[0])
+    assert spied_services_inspect.call_count == 6
+
+    # services created after the snapshot was taken are inspected
+    spied_services_inspect.reset_mock()
+    new_service = await create_service(task_template, None, "pending", placement_constraints)
+    assert new_service.spec
+    new_service_tasks = TypeAdapter(list[Task]).validate_python(
+        await autoscaling_docker.tasks.list(filters={"service": new_service.spec.name})
+    )
+    assert (
+        await get_task_instance_restriction(autoscaling_docker, new_service_tasks[0], tasks_snapshot=tasks_snapshot)
+        == "t3.medium"
+    )
+    spied_services_inspect.assert_called_once_with(new_service.id)
+
+
 async def test_compute_tasks_needed_resources(
     autoscaling_docker: AutoscalingDocker,
     host_node: Node,
@@ -704,6 +751,48 @@ async def test_compute_node_used_resources_with_service(
     assert node_used_resources == Resources(cpus=host_cpu_count, ram=ByteSize(0))
 
 
+async def test_compute_node_used_resources_with_tasks_snapshot(
+    autoscaling_docker: AutoscalingDocker,
+    host_node: Node,
+    create_service: Callable[[dict[str, Any], dict[DockerLabelKey, str], str], Awaitable[Service]],
+    task_template: dict[str, Any],
+    create_task_reservations: Callable[[int, int], dict[str, Any]],
+    host_cpu_count: int,
+    faker: Faker,
+    mocker: MockerFixture,
+):
+    task_template_with_manageable_resources = task_template | create_task_reservations(1, 0)
+    service_labels = faker.pydict(allowed_types=(str,))
+    await asyncio.gather(
+        *(
+            create_service(task_template_with_manageable_resources, service_labels, "running")
+            for cpu in range(host_cpu_count)
+        )
+    )
+    tasks_snapshot = await create_cluster_tasks_snapshot(autoscaling_docker)
+    spied_tasks_list = mocker.spy(autoscaling_docker.tasks, "list")
+
+    # the snapshot gives the same results as querying docker with the same filters
+    for labels in (
+        None,
+        [DockerLabelKey(faker.pystr())],
+        [random.choice(list(service_labels.keys()))],  # noqa: S311
+        list(service_labels.keys()),
+        [f"{key}={value}" for key, value in service_labels.items()],
+        [f"{key}={faker.pystr()}" for key in service_labels],
+    ):
+        assert await compute_node_used_resources(
+            autoscaling_docker, host_node, service_labels=labels, tasks_snapshot=tasks_snapshot
+        ) == await compute_node_used_resources(autoscaling_docker, host_node, service_labels=labels)
+    assert spied_tasks_list.call_count == 6
+
+    # the cluster is listed once, whatever the number of nodes
+    spied_tasks_list.reset_mock()
+    cluster_used_resources = await compute_cluster_used_resources(autoscaling_docker, [host_node] * 10)
+    assert cluster_used_resources == Resources(cpus=10 * host_cpu_count, ram=ByteSize(0))
+    spied_tasks_list.assert_called_once()
+
+
 async def test_compute_cluster_used_resources_with_no_nodes_returns_0(
     autoscaling_docker: AutoscalingDocker,
     docker_swarm: None,
@@ -0,0 +1,225 @@
+# pylint: disable=no-value-for-parameter
+# pylint: disable=redefined-outer-name
+# pylint: disable=unused-argument
+# pylint: disable=unused-variable
+
+import random
+from collections.abc import Callable
+
+import pytest
+from aws_library.ec2 import EC2InstanceData, EC2InstanceType, Resources
+from models_library.docker import DockerLabelKey
+from pydantic import ByteSize, TypeAdapter
+from pytest_benchmark.plugin import BenchmarkFixture
+from simcore_service_autoscaling.models import NonAssociatedInstance
+from simcore_service_autoscaling.utils.task_placement import (
+    PendingTask,
+    plan_task_placement,
+)
+
+_GiB = 1024**3
+
+
+@pytest.fixture
+def create_pending_task() -> Callable[..., PendingTask]:
+    def _creator(
+        task_id: int,
+        *,
+        cpus: float,
+        ram: int = _GiB,
+        required_instance_type: str | None = None,
+        required_node_labels: dict[str, str] | None = None,
+    ) -> PendingTask:
+        return PendingTask(
+            task=f"task_{task_id}",
+            required_resources=Resources(cpus=cpus, ram=ByteSize(ram)),
+            required_instance_type=required_instance_type,  # type: ignore[arg-type]
+            required_node_labels=TypeAdapter(dict[DockerLabelKey, str]).validate_python(required_node_labels or {}),
+            product_name="osparc",
+        )
+
+    return _creator
+
+
+@pytest.fixture
+def create_cluster_instance(
+    fake_ec2_instance_data: Callable[..., EC2InstanceData],
+) -> Callable[..., NonAssociatedInstance]:
+    def _creator(*, cpus: float, ram: int = 16 * _GiB) -> NonAssociatedInstance:
+        return NonAssociatedInstance(
+            ec2_instance=fake_ec2_instance_data(type="t2.xlarge", resources=Resources(cpus=cpus, ram=ByteSize(ram)))
+        )
+
+    return _creator
+
+
+@pytest.fixture
+def ec2_instance_types() -> list[EC2InstanceType]:
+    return [
+        EC2InstanceType(name="t2.medium", resources=Resources(cpus=2, ram=ByteSize(4 * _GiB))),
+        EC2InstanceType(name="t2.xlarge", resources=Resources(cpus=4, ram=ByteSize(16 * _GiB))),
+        EC2InstanceType(name="t2.2xlarge", resources=Resources(cpus=8, ram=ByteSize(32 * _GiB))),
+    ]
+
+
+def test_plan_task_placement_with_no_tasks(ec2_instance_types: list[EC2InstanceType]):
+    plan = plan_task_placement([], cluster_instances=(), available_ec2_types=ec2_instance_types)
+    assert plan.assigned_to_cluster == []
+    assert plan.new_instances == []
+    assert plan.unassigned == []
+
+
+def test_plan_task_placement_fills_cluster_instances_in_order(
+    create_pending_task: Callable[..., PendingTask],
+    create_cluster_instance: Callable[..., NonAssociatedInstance],
+):
+    active_instance = create_cluster_instance(cpus=4)
+    drained_instance = create_cluster_instance(cpus=4)
+    pending_tasks = [create_pending_task(i, cpus=2) for i in range(5)]
+
+    plan = plan_task_placement(
+        pending_tasks,
+        cluster_instances=([active_instance], [drained_instance]),
+        available_ec2_types=None,
+    )
+
+    assert [instance for _, instance in plan.assigned_to_cluster] == [active_instance] * 2 + [drained_instance] * 2
+    assert plan.unassigned == pending_tasks[4:]
+    assert plan.new_instances == []
+    # the plan does not modify the instances
+    assert active_instance.assigned_tasks == []
+    assert active_instance.available_resources == active_instance.ec2_instance.resources
+
+
+def test_plan_task_placement_places_larger_tasks_first(
+    create_pending_task: Callable[..., PendingTask],
+    create_cluster_instance: Callable[..., NonAssociatedInstance],
+):
+    # NOTE: placed in queue order, the small tasks would take the room needed by one of the large ones
+    instances = [create_cluster_instance(cpus=4), create_cluster_instance(cpus=4)]
+    pending_tasks = [
+        create_pending_task(0, cpus=1),
+        create_pending_task(1, cpus=1),
+        create_pending_task(2, cpus=3),
+        create_pending_task(3, cpus=3),
+    ]
+
+    plan = plan_task_placement(pending_tasks, cluster_instances=(instances,), available_ec2_types=None)
+
+    assert plan.unassigned == []
+    assigned_cpus = {id(instance): 0.0 for instance in instances}
+    for pending_task, instance in plan.assigned_to_cluster:
+        assigned_cpus[id(instance)] += pending_task.required_resources.cpus
+    assert list(assigned_cpus.values()) == [4, 4]
+
+
+def test_plan_task_placement_creates_the_least_new_instances(
+    create_pending_task: Callable[..., PendingTask],
+    ec2_instance_types: list[EC2InstanceType],
+):
+    pending_tasks = [
+        create_pending_task(0, cpus=1),
+        create_pending_task(1, cpus=1),
+        create_pending_task(2, cpus=3),
+        create_pending_task(3, cpus=3),
+    ]
+
+    plan = plan_task_placement(pending_tasks, cluster_instances=(), available_ec2_types=[ec2_instance_types[1]])
+
+    assert plan.unassigned == []
+    assert len(plan.new_instances) == 2
+    for new_instance in plan.new_instances:
+        assert new_instance.instance_type == ec2_instance_types[1]
+        assert len(new_instance.assigned_tasks) == 2
+        assert new_instance.available_resources == Resources(cpus=0, ram=ByteSize(14 * _GiB))
+        assert new_instance.assigned_task_product_name_if_uniform() == "osparc"
+
+
+def test_plan_task_placement_respects_instance_type_and_labels(
+    create_pending_task: Callable[..., PendingTask],
+    ec2_instance_types: list[EC2InstanceType],
+):
+    pending_tasks = [
+        create_pending_task(0, cpus=1, required_node_labels={"io.simcore.label": "a"}),
+        create_pending_task(1, cpus=1, required_node_labels={"io.simcore.label": "b"}),
+        create_pending_task(2, cpus=1, required_instance_type="t2.2xlarge"),
+    ]
+
+    plan = plan_task_placement(pending_tasks, cluster_instances=(), available_ec2_types=ec2_instance_types)
+
+    assert plan.unassigned == []
+    assert len(plan.new_instances) == 3
+    assert sorted(
+        (new_instance.instance_type.name, tuple(new_instance.osparc_custom_node_labels.items()))
+        for new_instance in plan.new_instances
+    ) == [
+        ("t2.2xlarge", ()),
+        ("t2.medium", (("io.simcore.label", "a"),)),
+        ("t2.medium", (("io.simcore.label", "b"),)),
+    ]
+
+
+def test_plan_task_placement_returns_unplaceable_tasks_as_unassigned(
+    create_pending_task: Callable[..., PendingTask],
+    ec2_instance_types: list[EC2InstanceType],
+):
+    pending_tasks = [
+        create_pending_task(0, cpus=16),
+        create_pending_task(1, cpus=1),
+        create_pending_task(2, cpus=1, required_instance_type="t2.nano"),
+    ]
+
+    plan = plan_task_placement(pending_tasks, cluster_instances=(), available_ec2_types=ec2_instance_types)
+
+    assert plan.unassigned == [pending_tasks[0], pending_tasks[2]]
+    assert len(plan.new_instances) == 1
+    assert plan.new_instances[0].assigned_tasks == [pending_tasks[1].task]
+
+
+def _create_task_queue(create_pending_task: Callable[..., PendingTask], num_tasks: int) -> list[PendingTask]:
+    rng = random.Random(42)  # noqa: S311
+    shapes = [(0.5, _GiB), (1, 2 * _GiB), (2, 4 * _GiB), (4, 8 * _GiB), (1, 12 * _GiB)]
+    return [
+        create_pending_task(i, cpus=cpus, ram=ram) for i, (cpus, ram) in enumerate(rng.choices(shapes, k=num_tasks))
+    ]
+
+
+@pytest.mark.parametrize("num_tasks", [10000])
+def test_benchmark_plan_task_placement_on_cluster(
+    benchmark: BenchmarkFixture,
+    create_pending_task: Callable[..., PendingTask],
+    create_cluster_instance: Callable[..., NonAssociatedInstance],
+    num_tasks: int,
+):
+    pending_tasks = _create_task_queue(create_pending_task, num_tasks)
+    cluster_instances = (
+        [create_cluster_instance(cpus=8, ram=32 * _GiB) for _ in range(500)],
+        [create_cluster_instance(cpus=4, ram=16 * _GiB) for _ in range(500)],
+    )
+
+    plan = benchmark.pedantic(
+        plan_task_placement,
+        args=(pending_tasks,),
+        kwargs={"cluster_instances": cluster_instances, "available_ec2_types": None},
+        rounds=5,
+    )
+    assert len(plan.assigned_to_cluster) + len(plan.unassigned) == num_tasks
+
+
+@pytest.mark.parametrize("num_tasks", [10000])
+def test_benchmark_plan_task_placement_on_new_instances(
+    benchmark: BenchmarkFixture,
+    create_pending_task: Callable[..., PendingTask],
+    ec2_instance_types: list[EC2InstanceType],
+    num_tasks: int,
+):
+    pending_tasks = _create_task_queue(create_pending_task, num_tasks)
+
+    plan = benchmark.pedantic(
+        plan_task_placement,
+        args=(pending_tasks,),
+        kwargs={"cluster_instances": (), "available_ec2_types": ec2_instance_types},
+        rounds=5,
+    )
+    assert plan.unassigned == []
+    assert sum(len(new_instance.assigned_tasks) for new_instance in plan.new_instances) == num_tasks
@@ -4,8 +4,10 @@ This module defines and implements ``simcore-aesgcm-stream-v1``, a streaming
 authenticated-encryption protocol for arbitrarily large files/objects. The data (the raw
 bytes to protect) is never fully materialised in memory: encryption and decryption
 operate on file-like binary objects (``BinaryIO``) and process the data in fixed-size
-chunks. Decryption memory is bounded by ``chunk_size``; encryption keeps one chunk of
-lookahead, so its peak is ~2x ``chunk_size``.
+chunks. Since every chunk is an independent AEAD record, up to ``max_workers`` chunks are
+encrypted/decrypted concurrently in a thread pool (the cipher releases the GIL) and written
+in order: memory is bounded by ~2x ``max_workers`` chunks (+1 chunk of lookahead when
+encrypting).
 
 This docstring is the normative specification. Any independent implementation (e.g. a
 libsodium-based client) that follows it byte-for-byte interoperates with this one.
@@ -144,9 +146,12 @@ Protocol invariants (enforced on decryption)
     decryption (no data beyond the failing chunk is emitted as valid output).
 """
 
+import functools
 import os
 import struct
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Annotated, BinaryIO, Final
 
@@ -160,6 +165,7 @@ from pydantic import Field
 NONCE_SIZE_BYTES: Final[int] = 12
 TAG_SIZE_BYTES: Final[int] = 16
 DEFAULT_CHUNK_SIZE_BYTES: Final[int] = 1024 * 1024
+DEFAULT_MAX_WORKERS: Final[int] = min(4, os.cpu_count() or 1)
 
 PROTOCOL_LABEL: Final[bytes] = b"simcore-aesgcm-stream-v1"
 FORMAT_MAGIC: Final[bytes] = b"SCAGSTRM"
@@ -293,6 +299,55 @@ def _parse_header(
     return chunk_size, bytes(base_nonce_seed)
 
 
+def _validate_max_workers(max_workers: int) -> None:
+    if max_workers <= 0:
+        msg = f"Invalid max_workers: must be strictly positive, got {max_workers}"
+        raise AesGcmStreamError(msg)
+
+
+def _process_chunks_in_order[T](
+    jobs: Annotated[
+        Iterator[Callable[[], T]],
+        Field(description="Per-chunk crypto operations, in stream order (reading the stream as it goes)"),
+    ],
+    *,
+    emit: Callable[[T], None],
+    max_workers: int,
+) -> None:
+    """Runs ``jobs`` on up to ``max_workers`` threads and emits their results in order.
+
+    At most 2x ``max_workers`` jobs are in flight, which bounds memory. If a job fails,
+    nothing after it is emitted. If producing the next job fails (e.g. a malformed record),
+    the jobs already submitted are emitted first, as with sequential processing.
+    """
+    if max_workers == 1:
+        for job in jobs:
+            emit(job())
+        return
+
+    max_in_flight = 2 * max_workers
+    in_flight: deque[Future[T]] = deque()
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="aes-gcm") as executor:
+        try:
+            while True:
+                try:
+                    job = next(jobs, None)
+                except AesGcmStreamError:
+                    while in_flight:
+                        emit(in_flight.popleft().result())
+                    raise
+                if job is None:
+                    break
+                in_flight.append(executor.submit(job))
+                if len(in_flight) >= max_in_flight:
+                    emit(in_flight.popleft().result())
+            while in_flight:
+                emit(in_flight.popleft().result())
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+
 def encrypt_stream(
     src: BinaryIO,
     dst: BinaryIO,
@@ -304,18 +359,21 @@ def encrypt_stream(
         Callable[[int], None] | None,
         Field(description="Called after each chunk with the cumulative data bytes processed so far"),
     ] = None,
+    max_workers: Annotated[int, Field(description="Number of chunks encrypted concurrently")] = DEFAULT_MAX_WORKERS,
 ) -> None:
     """Encrypt ``src`` into ``dst`` using the streaming AES-256-GCM protocol.
 
     Reads data from ``src`` in ``chunk_size`` blocks and writes a versioned
-    self-describing stream to ``dst``. Because a one-chunk lookahead is used to flag the
-    final chunk, peak memory usage is bounded by ~2x ``chunk_size``.
+    self-describing stream to ``dst``. Chunks are encrypted concurrently by up to
+    ``max_workers`` threads and written in order; a one-chunk lookahead is used to flag the
+    final chunk, so peak memory usage is bounded by ~(2x ``max_workers`` + 1) ``chunk_size``.
 
     Raises:
-        AesGcmStreamError: If ``root_key`` length or ``chunk_size`` are invalid.
+        AesGcmStreamError: If ``root_key`` length, ``chunk_size`` or ``max_workers`` are invalid.
     """
     _validate_key(root_key)
     _validate_chunk_size(chunk_size)
+    _validate_max_workers(max_workers)
 
     file_key = _derive_file_key(root_key, file_id=file_id)
     aesgcm = AESGCM(file_key)
@@ -323,32 +381,43 @@ def encrypt_stream(
 
     dst.write(_HEADER_STRUCT.pack(FORMAT_MAGIC, FORMAT_VERSION, 0, chunk_size, base_nonce_seed))
 
-    chunk_index = 0
+    def _encrypt_chunk(nonce: bytes, data: bytes, aad: bytes, is_final: bool) -> tuple[bool, int, bytes]:  # noqa: FBT001
+        return is_final, len(data), aesgcm.encrypt(nonce, data, aad)
+
+    def _encryption_jobs() -> Iterator[Callable[[], tuple[bool, int, bytes]]]:
+        chunk_index = 0
+        # One-chunk lookahead so the final chunk can be flagged unambiguously, including
+        # the empty-input case (which still emits exactly one final chunk).
+        pending = src.read(chunk_size)
+        while True:
+            next_chunk = src.read(chunk_size)
+            is_final = not next_chunk
+            nonce = _chunk_nonce(base_nonce_seed, chunk_index)
+            aad = _build_chunk_aad(
+                chunk_index=chunk_index,
+                is_final=is_final,
+                file_id=file_id,
+            )
+            yield functools.partial(_encrypt_chunk, nonce, pending, aad, is_final)
+
+            if is_final:
+                break
+            pending = next_chunk
+            chunk_index += 1
+
     total_data_bytes = 0
-    # One-chunk lookahead so the final chunk can be flagged unambiguously, including
-    # the empty-input case (which still emits exactly one final chunk).
-    pending = src.read(chunk_size)
-    while True:
-        next_chunk = src.read(chunk_size)
-        is_final = not next_chunk
-        nonce = _chunk_nonce(base_nonce_seed, chunk_index)
-        aad = _build_chunk_aad(
-            chunk_index=chunk_index,
-            is_final=is_final,
-            file_id=file_id,
-        )
-        ct_and_tag = aesgcm.encrypt(nonce, pending, aad)
+
+    def _write_chunk_record(encrypted: tuple[bool, int, bytes]) -> None:
+        nonlocal total_data_bytes
+        is_final, data_len, ct_and_tag = encrypted
         dst.write(_CHUNK_PREFIX_STRUCT.pack(_FINAL_CHUNK_FLAG if is_final else 0, len(ct_and_tag)))
         dst.write(ct_and_tag)
 
-        total_data_bytes += len(pending)
+        total_data_bytes += data_len
         if progress_cb is not None:
             progress_cb(total_data_bytes)
 
-        if is_final:
-            break
-        pending = next_chunk
-        chunk_index += 1
+    _process_chunks_in_order(_encryption_jobs(), emit=_write_chunk_record, max_workers=max_workers)
 
 
 def _read_chunk_record(src: BinaryIO, *, max_ct_len: int) -> tuple[bool, bytes]:
@@ -403,50 +472,59 @@ def decrypt_stream(
         Callable[[int], None] | None,
         Field(description="Called after each chunk with the cumulative data bytes processed so far"),
     ] = None,
+    max_workers: Annotated[int, Field(description="Number of chunks decrypted concurrently")] = DEFAULT_MAX_WORKERS,
 ) -> None:
     """Decrypt a stream produced by :func:`encrypt_stream` from ``src`` into ``dst``.
 
     Re-derives the per-file key, reconstructs per-chunk nonces and AAD, verifies every
-    chunk's authentication tag and streams data to ``dst``. Fails hard on any
+    chunk's authentication tag and streams data to ``dst``. Chunks are decrypted
+    concurrently by up to ``max_workers`` threads and written in order. Fails hard on any
     tampering, truncation, wrong key/context or unexpected trailing data.
 
     Raises:
-        AesGcmStreamError: If ``root_key`` length is invalid.
+        AesGcmStreamError: If ``root_key`` length or ``max_workers`` are invalid.
         AesGcmStreamFormatError: If the header or a chunk record is malformed,
             unsupported or truncated.
         AesGcmStreamAuthError: If authentication fails or the final chunk is missing.
     """
     _validate_key(root_key)
+    _validate_max_workers(max_workers)
 
     _chunk_size, base_nonce_seed = _parse_header(src)
 
     file_key = _derive_file_key(root_key, file_id=file_id)
     aesgcm = AESGCM(file_key)
 
-    chunk_index = 0
+    def _decryption_jobs() -> Iterator[Callable[[], bytes]]:
+        chunk_index = 0
+        seen_final = False
+        while not seen_final:
+            is_final, ct_and_tag = _read_chunk_record(src, max_ct_len=_chunk_size + TAG_SIZE_BYTES)
+            nonce = _chunk_nonce(base_nonce_seed, chunk_index)
+            aad = _build_chunk_aad(
+                chunk_index=chunk_index,
+                is_final=is_final,
+                file_id=file_id,
+            )
+            yield functools.partial(_decrypt_chunk, aesgcm, nonce=nonce, ct_and_tag=ct_and_tag, aad=aad)
+
+            seen_final = is_final
+            chunk_index += 1
+
+        if src.read(1):
+            msg = "Invalid stream: unexpected data after final chunk"
+            raise AesGcmStreamFormatError(msg)
+
     total_data_bytes = 0
-    seen_final = False
-    while not seen_final:
-        is_final, ct_and_tag = _read_chunk_record(src, max_ct_len=_chunk_size + TAG_SIZE_BYTES)
-        nonce = _chunk_nonce(base_nonce_seed, chunk_index)
-        aad = _build_chunk_aad(
-            chunk_index=chunk_index,
-            is_final=is_final,
-            file_id=file_id,
-        )
-        data = _decrypt_chunk(aesgcm, nonce=nonce, ct_and_tag=ct_and_tag, aad=aad)
 
+    def _write_data(data: bytes) -> None:
+        nonlocal total_data_bytes
         dst.write(data)
         total_data_bytes += len(data)
         if progress_cb is not None:
             progress_cb(total_data_bytes)
 
-        seen_final = is_final
-        chunk_index += 1
-
-    if src.read(1):
-        msg = "Invalid stream: unexpected data after final chunk"
-        raise AesGcmStreamFormatError(msg)
+    _process_chunks_in_order(_decryption_jobs(), emit=_write_data, max_workers=max_workers)
 
 
 def encrypt_file(
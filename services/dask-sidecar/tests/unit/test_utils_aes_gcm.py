@@ -124,6 +124,59 @@ def test_roundtrip_single_chunk_exact_size(root_key: bytes, context: dict[str, s
     assert _decrypt_to_bytes(encrypted, root_key, context) == plaintext
 
 
+@pytest.mark.parametrize("encrypt_workers, decrypt_workers", [(1, 4), (4, 1), (3, 8)])
+def test_roundtrip_with_concurrent_workers(
+    root_key: bytes, context: dict[str, str], encrypt_workers: int, decrypt_workers: int
+):
+    chunk_size = 64
+    plaintext = os.urandom(chunk_size * 50 + 5)
+    encrypted = io.BytesIO()
+    encrypt_stream(
+        io.BytesIO(plaintext),
+        encrypted,
+        root_key=root_key,
+        chunk_size=chunk_size,
+        max_workers=encrypt_workers,
+        **context,  # pyright: ignore[reportArgumentType]
+    )
+    progress: list[int] = []
+    decrypted = io.BytesIO()
+    decrypt_stream(
+        io.BytesIO(encrypted.getvalue()),
+        decrypted,
+        root_key=root_key,
+        progress_cb=progress.append,
+        max_workers=decrypt_workers,
+        **context,  # pyright: ignore[reportArgumentType]
+    )
+    assert decrypted.getvalue() == plaintext
+    # chunks are emitted in order
+    assert progress == [min((i + 1) * chunk_size, len(plaintext)) for i in range(51)]
+
+
+def test_concurrent_decrypt_emits_nothing_after_failing_chunk(root_key: bytes, context: dict[str, str]):
+    chunk_size = 32
+    plaintext = os.urandom(chunk_size * 20)
+    encrypted = bytearray(_encrypt_to_bytes(plaintext, root_key, context, chunk_size=chunk_size))
+    # flip a byte inside the ciphertext of chunk 5
+    record_size = _CHUNK_PREFIX_SIZE + chunk_size + TAG_SIZE_BYTES
+    encrypted[_HEADER_SIZE + 5 * record_size + _CHUNK_PREFIX_SIZE] ^= 0x01
+
+    dst = io.BytesIO()
+    with pytest.raises(AesGcmStreamAuthError, match="authentication failed"):
+        decrypt_stream(io.BytesIO(bytes(encrypted)), dst, root_key=root_key, max_workers=4, **context)  # pyright: ignore[reportArgumentType]
+    assert dst.getvalue() == plaintext[: 5 * chunk_size]
+
+
+@pytest.mark.parametrize("max_workers", [0, -1])
+def test_streams_reject_non_positive_max_workers(root_key: bytes, context: dict[str, str], max_workers: int):
+    with pytest.raises(AesGcmStreamError, match="Invalid max_workers"):
+        encrypt_stream(io.BytesIO(b"abc"), io.BytesIO(), root_key=root_key, max_workers=max_workers, **context)  # pyright: ignore[reportArgumentType]
+    encrypted = _encrypt_to_bytes(b"abc", root_key, context)
+    with pytest.raises(AesGcmStreamError, match="Invalid max_workers"):
+        decrypt_stream(io.BytesIO(encrypted), io.BytesIO(), root_key=root_key, max_workers=max_workers, **context)  # pyright: ignore[reportArgumentType]
+
+
 def test_encrypt_stream_reports_cumulative_progress(root_key: bytes, context: dict[str, str]):
     chunk_size = 64
     plaintext = os.urandom(chunk_size * 3 + 7)  # 3 full chunks + a short final chunk
@@ -13,7 +13,7 @@ import logging
 from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from http.client import HTTPException
-from typing import Final, cast
+from typing import Any, Final, cast
 
 import distributed
 import distributed.client
@@ -404,103 +404,132 @@ class DaskClient:
 
         return list_of_node_id_to_job_id
 
+    async def _get_tasks_last_events(
+        self, event_name_template: str, job_ids: Iterable[str]
+    ) -> dict[str, tuple[UnixTimestamp, Any] | None]:
+        """returns the last event of each job in a single round trip to the dask-scheduler
+
+        NOTE: calling client.get_events per job makes every scheduler tick O(number of tasks)
+        in network calls, therefore the lookup is done directly on the scheduler side
+        """
+
+        def _get_last_events_on_scheduler(
+            dask_scheduler: distributed.Scheduler,
+            topics: dict[str, str],
+        ) -> dict[str, tuple[float, Any] | None]:
+            last_events: dict[str, tuple[float, Any] | None] = {}
+            for job_id, topic in topics.items():
+                events = dask_scheduler.get_events(topic)
+                last_events[job_id] = tuple(events[-1]) if events else None
+            return last_events
+
+        topics = {job_id: event_name_template.format(key=job_id) for job_id in job_ids}
+        if not topics:
+            return {}
+        last_events: dict[str, tuple[UnixTimestamp, Any] | None] = await dask_utils.wrap_client_async_routine(
+            self.backend.client.run_on_scheduler(_get_last_events_on_scheduler, topics=topics)
+        )
+        return last_events
+
     async def get_tasks_progress(self, job_ids: list[str]) -> list[TaskProgressEvent | None]:
         dask_utils.check_scheduler_is_still_the_same(self.backend.scheduler_id, self.backend.client)
         dask_utils.check_communication_with_scheduler_is_open(self.backend.client)
         dask_utils.check_scheduler_status(self.backend.client)
 
-        async def _get_task_progress(job_id: str) -> TaskProgressEvent | None:
-            dask_events: tuple[tuple[UnixTimestamp, str], ...] = await self.backend.client.get_events(
-                TASK_RUNNING_PROGRESS_EVENT.format(key=job_id)
-            )
-            if not dask_events:
+        last_events = await self._get_tasks_last_events(TASK_RUNNING_PROGRESS_EVENT, job_ids)
+
+        def _get_task_progress(job_id: str) -> TaskProgressEvent | None:
+            last_event = last_events.get(job_id)
+            if last_event is None:
                 return None
-            # we are interested in the last event
-            return TaskProgressEvent.model_validate_json(dask_events[-1][1])
+            return TaskProgressEvent.model_validate_json(last_event[1])
 
-        return await limited_gather(
-            *(_get_task_progress(job_id) for job_id in job_ids),
-            log=_logger,
-            limit=_MAX_CONCURRENT_CLIENT_CONNECTIONS,
-        )
+        return [_get_task_progress(job_id) for job_id in job_ids]
+
+    async def _get_failed_task_state(self, job_id: str) -> RunningState:
+        log_error_context = {
+            "job_id": job_id,
+            "dask-scheduler": self.backend.scheduler_id,
+        }
+        try:
+            # find out if this was a cancellation
+            task_future: distributed.Future = await dask_utils.wrap_client_async_routine(
+                self.backend.client.get_dataset(name=job_id)
+            )
+            exception = await task_future.exception(timeout=_DASK_DEFAULT_TIMEOUT_S)
+            assert isinstance(exception, Exception)  # nosec
+
+            if isinstance(exception, TaskCancelledError):
+                _logger.info(
+                    **create_troubleshooting_log_kwargs(
+                        f"Task {job_id} was aborted by user",
+                        error=exception,
+                        error_context=log_error_context,
+                    )
+                )
+                return RunningState.ABORTED
+            assert exception  # nosec
+            _logger.info(
+                **create_troubleshooting_log_kwargs(
+                    f"Task {job_id} completed with an error",
+                    error=exception,
+                    error_context=log_error_context,
+                )
+            )
+            return RunningState.FAILED
+        except TimeoutError as exc:
+            _logger.exception(
+                **create_troubleshooting_log_kwargs(
+                    f"Task {job_id} exception could not be retrieved due to timeout",
+                    error=exc,
+                    error_context=log_error_context,
+                    tip="The dask-scheduler is probably under load, this should resolve itself later.",
+                ),
+            )
+            return RunningState.UNKNOWN
+        except KeyError as exc:
+            # the task does not exist
+            _logger.warning(
+                **create_troubleshooting_log_kwargs(
+                    f"Task {job_id} not found. State is UNKNOWN.",
+                    error=exc,
+                    error_context=log_error_context,
+                    tip=(
+                        "If the task is supposed to exist, the dask-scheduler has probably restarted. "
+                        "Check its status."
+                    ),
+                ),
+            )
+            return RunningState.UNKNOWN
 
     async def get_tasks_status(self, job_ids: Iterable[str]) -> list[RunningState]:
         dask_utils.check_scheduler_is_still_the_same(self.backend.scheduler_id, self.backend.client)
         dask_utils.check_communication_with_scheduler_is_open(self.backend.client)
         dask_utils.check_scheduler_status(self.backend.client)
 
-        async def _get_task_state(job_id: str) -> RunningState:
-            dask_events: tuple[tuple[UnixTimestamp, str], ...] = await self.backend.client.get_events(
-                TASK_LIFE_CYCLE_EVENT.format(key=job_id)
+        job_ids = list(job_ids)
+        last_events = await self._get_tasks_last_events(TASK_LIFE_CYCLE_EVENT, job_ids)
+
+        tasks_states: dict[str, RunningState] = {}
+        for job_id in job_ids:
+            last_event = last_events.get(job_id)
+            tasks_states[job_id] = (
+                RunningState.UNKNOWN
+                if last_event is None
+                else TaskLifeCycleState.model_validate(last_event[1]).state
             )
-            if not dask_events:
-                return RunningState.UNKNOWN
-            # we are interested in the last event
-            parsed_event = TaskLifeCycleState.model_validate(dask_events[-1][1])
-
-            if parsed_event.state == RunningState.FAILED:
-                log_error_context = {
-                    "job_id": job_id,
-                    "dask-scheduler": self.backend.scheduler_id,
-                }
-                try:
-                    # find out if this was a cancellation
-                    task_future: distributed.Future = await dask_utils.wrap_client_async_routine(
-                        self.backend.client.get_dataset(name=job_id)
-                    )
-                    exception = await task_future.exception(timeout=_DASK_DEFAULT_TIMEOUT_S)
-                    assert isinstance(exception, Exception)  # nosec
-
-                    if isinstance(exception, TaskCancelledError):
-                        _logger.info(
-                            **create_troubleshooting_log_kwargs(
-                                f"Task {job_id} was aborted by user",
-                                error=exception,
-                                error_context=log_error_context,
-                            )
-                        )
-                        return RunningState.ABORTED
-                    assert exception  # nosec
-                    _logger.info(
-                        **create_troubleshooting_log_kwargs(
-                            f"Task {job_id} completed with an error",
-                            error=exception,
-                            error_context=log_error_context,
-                        )
-                    )
-                    return RunningState.FAILED
-                except TimeoutError as exc:
-                    _logger.exception(
-                        **create_troubleshooting_log_kwargs(
-                            f"Task {job_id} exception could not be retrieved due to timeout",
-                            error=exc,
-                            error_context=log_error_context,
-                            tip="The dask-scheduler is probably under load, this should resolve itself later.",
-                        ),
-                    )
-                    return RunningState.UNKNOWN
-                except KeyError as exc:
-                    # the task does not exist
-                    _logger.warning(
-                        **create_troubleshooting_log_kwargs(
-                            f"Task {job_id} not found. State is UNKNOWN.",
-                            error=exc,
-                            error_context=log_error_context,
-                            tip=(
-                                "If the task is supposed to exist, the dask-scheduler has probably restarted. "
-                                "Check its status."
-                            ),
-                        ),
-                    )
-                    return RunningState.UNKNOWN
 
-            return parsed_event.state
+        # only failed tasks need an additional lookup to differentiate failures from cancellations
+        failed_job_ids = [job_id for job_id, state in tasks_states.items() if state == RunningState.FAILED]
+        if failed_job_ids:
+            failed_states = await limited_gather(
+                *(self._get_failed_task_state(job_id) for job_id in failed_job_ids),
+                log=_logger,
+                limit=_MAX_CONCURRENT_CLIENT_CONNECTIONS,
+            )
+            tasks_states.update(zip(failed_job_ids, failed_states, strict=True))
 
-        return await limited_gather(
-            *(_get_task_state(job_id) for job_id in job_ids),
-            log=_logger,
-            limit=_MAX_CONCURRENT_CLIENT_CONNECTIONS,
-        )
+        return [tasks_states[job_id] for job_id in job_ids]
 
     async def abort_computation_task(self, job_id: str) -> None:
         # Dask future may be cancelled, but only a future that was not already taken by
@@ -1209,3 +1209,20 @@ async def test_dask_sub_handlers(
             # we should have received data in our TaskHandlers
             fake_task_handlers.task_progress_handler.assert_called_with((mock.ANY, "my name is progress"))
     await _assert_wait_for_cb_call(mocked_user_completed_cb)
+
+
+async def test_get_tasks_status_and_progress_of_unknown_jobs_in_one_call(
+    dask_client: DaskClient, faker: Faker, mocker: MockerFixture
+):
+    job_ids = [faker.pystr() for _ in range(10)]
+    spy_run_on_scheduler = mocker.spy(dask_client.backend.client, "run_on_scheduler")
+
+    assert await dask_client.get_tasks_status(job_ids) == [RunningState.UNKNOWN] * len(job_ids)
+    assert spy_run_on_scheduler.call_count == 1
+
+    assert await dask_client.get_tasks_progress(job_ids) == [None] * len(job_ids)
+    assert spy_run_on_scheduler.call_count == 2
+
+    # no jobs, no round trip
+    assert await dask_client.get_tasks_status([]) == []
+    assert spy_run_on_scheduler.call_count == 2
@@ -9,7 +9,9 @@ from ._tracker import Tracker
 
 
 async def _service_tracker_lifespan(app: FastAPI) -> AsyncIterator[State]:
-    app.state.service_tracker = Tracker(get_redis_client(app, RedisDatabase.DYNAMIC_SERVICES))
+    tracker = Tracker(get_redis_client(app, RedisDatabase.DYNAMIC_SERVICES))
+    await tracker.setup()
+    app.state.service_tracker = tracker
     yield {}
 
 
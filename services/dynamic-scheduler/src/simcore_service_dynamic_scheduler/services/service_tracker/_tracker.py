@@ -2,37 +2,64 @@ from dataclasses import dataclass
 from typing import Final
 
 from models_library.projects_nodes_io import NodeID
-from servicelib.redis import RedisClientSDK
+from servicelib.redis import RedisClientSDK, handle_redis_returns_union_types
 
 from ._models import TrackedServiceModel
 
-_KEY_PREFIX: Final[str] = "t::"
+# NOTE: all tracked services are stored as fields of a single hash (node_id -> model)
+_TRACKED_SERVICES_KEY: Final[str] = "tracked_services"
 
-
-def _get_key(node_id: NodeID) -> str:
-    return f"{_KEY_PREFIX}{node_id}"
+# NOTE: services used to be tracked one per key, only used to migrate them to the hash
+_LEGACY_KEY_PREFIX: Final[str] = "t::"
 
 
 @dataclass
 class Tracker:
     redis_client_sdk: RedisClientSDK
 
+    async def setup(self) -> None:
+        await self._migrate_legacy_entries()
+
+    async def _migrate_legacy_entries(self) -> None:
+        # NOTE: SCANs the keyspace once on startup
+        legacy_keys: list[bytes] = [
+            x async for x in self.redis_client_sdk.redis.scan_iter(match=f"{_LEGACY_KEY_PREFIX}*")
+        ]
+        if not legacy_keys:
+            return
+
+        legacy_values: list[bytes | None] = await handle_redis_returns_union_types(
+            self.redis_client_sdk.redis.mget(legacy_keys)
+        )
+        mapping: dict[str, bytes] = {
+            k.decode().removeprefix(_LEGACY_KEY_PREFIX): v
+            for k, v in zip(legacy_keys, legacy_values, strict=True)
+            if v is not None
+        }
+
+        async with self.redis_client_sdk.redis.pipeline(transaction=True) as pipe:
+            for field, value in mapping.items():
+                # entries already in the hash are newer than the legacy ones
+                pipe.hsetnx(_TRACKED_SERVICES_KEY, field, value)
+            pipe.delete(*legacy_keys)
+            await pipe.execute()
+
     async def save(self, node_id: NodeID, model: TrackedServiceModel) -> None:
-        await self.redis_client_sdk.redis.set(_get_key(node_id), model.to_bytes())
+        await handle_redis_returns_union_types(
+            self.redis_client_sdk.redis.hset(_TRACKED_SERVICES_KEY, f"{node_id}", model.to_bytes())
+        )
 
     async def load(self, node_id: NodeID) -> TrackedServiceModel | None:
-        model_as_bytes: bytes | None = await self.redis_client_sdk.redis.get(_get_key(node_id))
+        model_as_bytes: bytes | None = await handle_redis_returns_union_types(
+            self.redis_client_sdk.redis.hget(_TRACKED_SERVICES_KEY, f"{node_id}")
+        )
         return None if model_as_bytes is None else TrackedServiceModel.from_bytes(model_as_bytes)
 
     async def delete(self, node_id: NodeID) -> None:
-        await self.redis_client_sdk.redis.delete(_get_key(node_id))
+        await handle_redis_returns_union_types(self.redis_client_sdk.redis.hdel(_TRACKED_SERVICES_KEY, f"{node_id}"))
 
     async def all(self) -> dict[NodeID, TrackedServiceModel]:
-        found_keys = [x async for x in self.redis_client_sdk.redis.scan_iter(match=f"{_KEY_PREFIX}*")]
-        found_values = await self.redis_client_sdk.redis.mget(found_keys)
-
-        return {
-            NodeID(k.decode().lstrip(_KEY_PREFIX)): TrackedServiceModel.from_bytes(v)
-            for k, v in zip(found_keys, found_values, strict=True)
-            if v is not None
-        }
+        found_entries: dict[bytes, bytes] = await handle_redis_returns_union_types(
+            self.redis_client_sdk.redis.hgetall(_TRACKED_SERVICES_KEY)
+        )
+        return {NodeID(k.decode()): TrackedServiceModel.from_bytes(v) for k, v in found_entries.items()}
@@ -10,6 +10,7 @@ from fastapi import FastAPI
 from models_library.projects_nodes_io import NodeID
 from pydantic import NonNegativeFloat, NonNegativeInt
 from servicelib.background_task_utils import exclusive_periodic
+from servicelib.deferred_tasks import TaskUID
 from servicelib.utils import limited_gather
 from settings_library.redis import RedisDatabase
 
@@ -23,6 +24,8 @@ _logger = logging.getLogger(__name__)
 
 _INTERVAL_BETWEEN_CHECKS: Final[timedelta] = timedelta(seconds=1)
 _MAX_CONCURRENCY: Final[NonNegativeInt] = 10
+# NOTE: bounds the duration of a check, the remaining services are started by the following checks
+_MAX_STATUS_REQUESTS_PER_CHECK: Final[NonNegativeInt] = 100
 
 _REMOVE_AFTER_IDLE_FOR: Final[timedelta] = timedelta(minutes=5)
 
@@ -32,6 +35,15 @@ async def _start_get_status_deferred(app: FastAPI, node_id: NodeID, *, next_chec
     await DeferredGetStatus.start(node_id=node_id)
 
 
+def _get_next_check_delay(tracked_services_count: NonNegativeInt) -> timedelta:
+    """
+    Polls at the normal rate unless the tracked services cannot all be started
+    within that interval, in which case the interval grows with their number
+    """
+    checks_to_start_all = tracked_services_count / _MAX_STATUS_REQUESTS_PER_CHECK
+    return max(NORMAL_RATE_POLL_INTERVAL, checks_to_start_all * _INTERVAL_BETWEEN_CHECKS)
+
+
 def _can_be_removed(model: TrackedServiceModel) -> bool:
     # requested **as** `STOPPED`
     # service **reports** `IDLE`
@@ -80,21 +92,34 @@ class Monitor:
 
         current_timestamp = arrow.utcnow().timestamp()
 
+        to_check: dict[NodeID, TrackedServiceModel] = {}
         for node_id, model in models.items():
             if _can_be_removed(model):
                 to_remove.append(node_id)
-                continue
-
-            job_not_running = not (
-                model.scheduled_to_run
-                and model.service_status_task_uid is not None
-                and await DeferredGetStatus.is_present(model.service_status_task_uid)
+            else:
+                to_check[node_id] = model
+
+        # NOTE: presence of all the scheduled status requests is checked in a single call
+        scheduled_task_uids: dict[NodeID, TaskUID] = {
+            node_id: model.service_status_task_uid
+            for node_id, model in to_check.items()
+            if model.scheduled_to_run and model.service_status_task_uid is not None
+        }
+        jobs_running: dict[NodeID, bool] = dict(
+            zip(
+                scheduled_task_uids,
+                await DeferredGetStatus.are_present(list(scheduled_task_uids.values())),
+                strict=True,
             )
+        )
+
+        for node_id, model in to_check.items():
+            job_not_running = not jobs_running.get(node_id, False)
             wait_period_finished = current_timestamp > model.check_status_after
             if job_not_running and wait_period_finished:
                 to_start.append(node_id)
             else:
-                _logger.info(
+                _logger.debug(
                     "Skipping status check for %s, because: %s or %s",
                     node_id,
                     f"{job_not_running=}",
@@ -105,6 +130,15 @@ class Monitor:
                     ),
                 )
 
+        if len(to_start) > _MAX_STATUS_REQUESTS_PER_CHECK:
+            # the services waiting the longest go first
+            to_start.sort(key=lambda node_id: to_check[node_id].check_status_after)
+            _logger.info(
+                "Postponing status check of %s services to the next check",
+                len(to_start) - _MAX_STATUS_REQUESTS_PER_CHECK,
+            )
+            to_start = to_start[:_MAX_STATUS_REQUESTS_PER_CHECK]
+
         _logger.debug("Removing tracked services: '%s'", to_remove)
         await limited_gather(
             *(service_tracker.remove_tracked_service(self.app, node_id) for node_id in to_remove),
@@ -112,11 +146,9 @@ class Monitor:
         )
 
         _logger.debug("Poll status for tracked services: '%s'", to_start)
+        next_check_delay = _get_next_check_delay(len(to_check))
         await limited_gather(
-            *(
-                _start_get_status_deferred(self.app, node_id, next_check_delay=NORMAL_RATE_POLL_INTERVAL)
-                for node_id in to_start
-            ),
+            *(_start_get_status_deferred(self.app, node_id, next_check_delay=next_check_delay) for node_id in to_start),
             limit=_MAX_CONCURRENCY,
         )
 
@@ -101,3 +101,20 @@ async def test_tracker_listing(tracker: Tracker, item_count: NonNegativeInt) ->
 
 async def test_remove_missing_key_does_not_raise_error(tracker: Tracker):
     await tracker.delete(uuid4())
+
+
+async def test_tracker_migrates_legacy_entries(tracker: Tracker):
+    node_id: NodeID = uuid4()
+    model = TrackedServiceModel(
+        dynamic_service_start=None,
+        user_id=None,
+        project_id=None,
+        requested_state=UserRequestedState.RUNNING,
+    )
+    # entries stored one per key before they were moved to a hash
+    await tracker.redis_client_sdk.redis.set(f"t::{node_id}", model.to_bytes())
+    assert await tracker.load(node_id) is None
+
+    await tracker.setup()
+    assert await tracker.all() == {node_id: model}
+    assert await tracker.redis_client_sdk.redis.exists(f"t::{node_id}") == 0
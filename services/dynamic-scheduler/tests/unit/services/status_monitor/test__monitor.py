@@ -30,6 +30,7 @@ from pytest_simcore.helpers.typing_env import EnvVarsDict
 from settings_library.rabbit import RabbitSettings
 from settings_library.redis import RedisSettings
 from simcore_service_dynamic_scheduler.services.service_tracker import (
+    NORMAL_RATE_POLL_INTERVAL,
     get_all_tracked_services,
     set_request_as_running,
     set_request_as_stopped,
@@ -44,8 +45,10 @@ from simcore_service_dynamic_scheduler.services.status_monitor._deferred_get_sta
     DeferredGetStatus,
 )
 from simcore_service_dynamic_scheduler.services.status_monitor._monitor import (
+    _MAX_STATUS_REQUESTS_PER_CHECK,
     Monitor,
     _can_be_removed,
+    _get_next_check_delay,
 )
 from simcore_service_dynamic_scheduler.services.status_monitor._setup import get_monitor
 from tenacity import AsyncRetrying
@@ -449,3 +452,15 @@ async def test__can_be_removed(
     ):
         with attempt:
             assert _can_be_removed(model) is can_be_removed
+
+
+@pytest.mark.parametrize(
+    "tracked_services_count, expected_delay",
+    [
+        pytest.param(0, NORMAL_RATE_POLL_INTERVAL, id="no_services"),
+        pytest.param(_MAX_STATUS_REQUESTS_PER_CHECK, NORMAL_RATE_POLL_INTERVAL, id="few_services"),
+        pytest.param(_MAX_STATUS_REQUESTS_PER_CHECK * 60, timedelta(seconds=60), id="many_services"),
+    ],
+)
+def test__get_next_check_delay(tracked_services_count: NonNegativeInt, expected_delay: timedelta):
+    assert _get_next_check_delay(tracked_services_count) == expected_delay
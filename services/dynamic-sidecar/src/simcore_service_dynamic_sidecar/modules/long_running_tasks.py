@@ -60,6 +60,11 @@ from ..modules.outputs import (
     OutputsManager,
     event_propagation_disabled,
 )
+from ..modules.outputs._directory_utils import (
+    DirectoryManifest,
+    get_directory_manifest,
+    get_manifest_total_size,
+)
 from ..modules.r_clone_mount_manager import get_r_clone_mount_manager
 from .long_running_tasks_utils import (
     ensure_read_permissions_on_user_service_data,
@@ -303,17 +308,22 @@ async def remove_user_services(
     await progress.update(message="done", percent=0.99)
 
 
-def _get_state_folders_size(paths: list[Path]) -> int:
-    total_size: int = 0
-    for path in paths:
-        for file in path.rglob("*"):
-            if file.is_file():
-                total_size += file.stat().st_size
-    return total_size
+def _get_state_folder_size(path: Path) -> int:
+    # NOTE: computed like when saving, so that both report the same size for the same content
+    return get_manifest_total_size(get_directory_manifest(path))
+
+
+async def _get_state_folders_size(paths: list[Path]) -> int:
+    sizes = await asyncio.gather(*(asyncio.to_thread(_get_state_folder_size, path) for path in paths))
+    return sum(sizes)
 
 
-async def _get_state_folders_size_async(paths: list[Path]) -> int:
-    return await asyncio.to_thread(_get_state_folders_size, paths)
+def _get_saved_state_manifests(app: FastAPI) -> dict[Path, DirectoryManifest]:
+    """content of the state paths when they were last successfully saved"""
+    if not hasattr(app.state, "saved_state_manifests"):
+        app.state.saved_state_manifests = {}
+    saved_state_manifests: dict[Path, DirectoryManifest] = app.state.saved_state_manifests
+    return saved_state_manifests
 
 
 def _get_legacy_state_with_dy_volumes_path(
@@ -401,7 +411,7 @@ async def restore_user_services_state_paths(
 
     await post_sidecar_log_message(app, "Finished state downloading", log_level=logging.INFO)
 
-    size = await _get_state_folders_size_async(state_paths)
+    size = await _get_state_folders_size(state_paths)
 
     enable_notifications_processing(app)
 
@@ -409,7 +419,7 @@ async def restore_user_services_state_paths(
     return size
 
 
-async def _save_state_folder(
+async def _push_state_folder(
     app: FastAPI,
     *,
     settings: ApplicationSettings,
@@ -435,6 +445,47 @@ async def _save_state_folder(
     )
 
 
+async def _save_state_folder(
+    app: FastAPI,
+    *,
+    settings: ApplicationSettings,
+    progress_bar: ProgressBarData,
+    state_path: Path,
+    index: NonNegativeInt,
+    mounted_volumes: MountedVolumes,
+) -> int:
+    """returns the size of the saved state folder"""
+    if get_r_clone_mount_manager(app).is_mount_tracked(state_path, index):
+        # NOTE: the content is already in S3, saving only stops the mount
+        await _push_state_folder(
+            app,
+            settings=settings,
+            progress_bar=progress_bar,
+            state_path=state_path,
+            index=index,
+            mounted_volumes=mounted_volumes,
+        )
+        return await asyncio.to_thread(_get_state_folder_size, state_path)
+
+    # NOTE: the manifest is taken before saving, a change while saving is detected next time
+    manifest = await asyncio.to_thread(get_directory_manifest, state_path)
+    saved_state_manifests = _get_saved_state_manifests(app)
+    if saved_state_manifests.get(state_path) == manifest:
+        _logger.info("State folder '%s' did not change since it was last saved", state_path)
+        await progress_bar.update()
+    else:
+        await _push_state_folder(
+            app,
+            settings=settings,
+            progress_bar=progress_bar,
+            state_path=state_path,
+            index=index,
+            mounted_volumes=mounted_volumes,
+        )
+        saved_state_manifests[state_path] = manifest
+    return get_manifest_total_size(manifest)
+
+
 async def save_user_services_state_paths(
     progress: TaskProgress,
     app: FastAPI,
@@ -457,7 +508,7 @@ async def save_user_services_state_paths(
         ),
         description="pushing state",
     ) as root_progress:
-        await logged_gather(
+        sizes = await logged_gather(
             *[
                 _save_state_folder(
                     app,
@@ -475,7 +526,7 @@ async def save_user_services_state_paths(
     await post_sidecar_log_message(app, "Finished state saving", log_level=logging.INFO)
     await progress.update(message="finished state saving", percent=0.99)
 
-    return _get_state_folders_size(state_paths)
+    return sum(sizes)
 
 
 async def pull_user_services_input_ports(
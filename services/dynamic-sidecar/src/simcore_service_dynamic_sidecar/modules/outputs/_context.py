@@ -14,6 +14,9 @@ class OutputsContext:
 
     # _PortKeysEventHandler (generates) -> EventFilter (receives)
     port_key_events_queue: AioQueue = field(default_factory=aioprocessing.AioQueue)
+    # sizes of the port keys directories, sent with each event
+    # _PortKeysEventHandler (generates) -> EventFilter (receives)
+    port_key_usages_queue: AioQueue = field(default_factory=aioprocessing.AioQueue)
 
     # OutputsContext (generates) -> _EventHandlerProcess(receives)
     file_system_event_handler_queue: AioQueue = field(default_factory=aioprocessing.AioQueue)
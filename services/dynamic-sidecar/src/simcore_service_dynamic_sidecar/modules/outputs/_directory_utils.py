@@ -1,7 +1,29 @@
 import os
+import stat
+import time
+from collections.abc import Iterator
+from contextlib import suppress
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Final
 
-from pydantic import ByteSize, TypeAdapter
+from pydantic import ByteSize, NonNegativeFloat, NonNegativeInt, TypeAdapter
+
+_RECONCILE_INTERVAL_S: Final[NonNegativeFloat] = 60
+
+# mode, size, modification and change times (in ns)
+type _EntrySignature = tuple[int, int, int, int]
+type DirectoryManifest = dict[str, _EntrySignature]
+
+
+def _iter_file_sizes(path: Path) -> Iterator[tuple[str, NonNegativeInt]]:
+    # NOTE: symlinked directories are not followed, they could point to
+    # content which is counted twice or to one of their parents
+    for entry in os.scandir(path):
+        if entry.is_file():
+            yield entry.path, entry.stat().st_size
+        elif entry.is_dir(follow_symlinks=False):
+            yield from _iter_file_sizes(Path(entry.path))
 
 
 def get_directory_total_size(path: Path) -> ByteSize:
@@ -12,10 +34,154 @@ def get_directory_total_size(path: Path) -> ByteSize:
     if not path.exists():
         return TypeAdapter(ByteSize).validate_python(0)
 
-    total = 0
+    return TypeAdapter(ByteSize).validate_python(sum(size for _, size in _iter_file_sizes(path)))
+
+
+def _iter_entries(path: Path) -> Iterator[os.DirEntry]:
     for entry in os.scandir(path):
-        if entry.is_file():
-            total += entry.stat().st_size
-        elif entry.is_dir():
-            total += get_directory_total_size(Path(entry.path))
-    return TypeAdapter(ByteSize).validate_python(total)
+        yield entry
+        if entry.is_dir(follow_symlinks=False):
+            yield from _iter_entries(Path(entry.path))
+
+
+def _get_signature(entry: os.DirEntry) -> _EntrySignature | None:
+    # NOTE: falls back to the link itself if it is dangling
+    for follow_symlinks in (True, False):
+        with suppress(FileNotFoundError):
+            stat_result = entry.stat(follow_symlinks=follow_symlinks)
+            if stat.S_ISDIR(stat_result.st_mode):
+                # NOTE: the times of a directory change with its content, which is already in the manifest
+                return (stat_result.st_mode, 0, 0, 0)
+            return (stat_result.st_mode, stat_result.st_size, stat_result.st_mtime_ns, stat_result.st_ctime_ns)
+    return None  # removed while scanning
+
+
+def get_directory_manifest(path: Path) -> DirectoryManifest:
+    """returns the signature of each entry of a directory by relative path,
+    if two manifests are the same the content of the directory did not change"""
+    # NOTE: the change time cannot be set (unlike the modification time), so content
+    # copied while preserving the modification time is also detected
+    if not path.exists():
+        return {}
+
+    return {
+        os.path.relpath(entry.path, path): signature
+        for entry in _iter_entries(path)
+        if (signature := _get_signature(entry)) is not None
+    }
+
+
+def get_manifest_total_size(manifest: DirectoryManifest) -> NonNegativeInt:
+    """return the size of the files in a manifest in bytes, without accessing the directory"""
+    return sum(size for mode, size, *_ in manifest.values() if stat.S_ISREG(mode))
+
+
+@dataclass(frozen=True, slots=True)
+class PortKeyUsage:
+    port_key: str
+    total_size: NonNegativeInt
+    file_count: NonNegativeInt
+
+
+class _TrackedDirectory:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.last_full_scan: NonNegativeFloat | None = None
+
+        self._file_sizes: dict[str, NonNegativeInt] = {}
+        self._total_size: NonNegativeInt = 0
+
+    @property
+    def total_size(self) -> NonNegativeInt:
+        return self._total_size
+
+    @property
+    def file_count(self) -> NonNegativeInt:
+        return len(self._file_sizes)
+
+    def full_scan(self) -> None:
+        self._file_sizes = dict(_iter_file_sizes(self.path)) if self.path.exists() else {}
+        self._total_size = sum(self._file_sizes.values())
+        self.last_full_scan = time.monotonic()
+
+    def _set_file_size(self, file_path: str, size: NonNegativeInt) -> None:
+        self._total_size += size - self._file_sizes.get(file_path, 0)
+        self._file_sizes[file_path] = size
+
+    def _remove(self, path: str, *, is_directory: bool) -> None:
+        if not is_directory:
+            self._total_size -= self._file_sizes.pop(path, 0)
+            return
+
+        prefix = f"{path}{os.sep}"
+        for file_path in [x for x in self._file_sizes if x.startswith(prefix)]:
+            self._total_size -= self._file_sizes.pop(file_path)
+
+    def path_changed(self, path: str, *, is_directory: bool) -> None:
+        try:
+            stat_result = os.stat(path)  # noqa: PTH116
+        except FileNotFoundError:
+            self._remove(path, is_directory=is_directory)
+            return
+
+        if stat.S_ISDIR(stat_result.st_mode):
+            if Path(path).is_symlink():
+                return
+            # NOTE: a directory which was created or moved in, its files might not generate events
+            for file_path, size in _iter_file_sizes(Path(path)):
+                self._set_file_size(file_path, size)
+        else:
+            self._set_file_size(path, stat_result.st_size)
+
+
+class PortsSizeTracker:
+    """
+    Keeps track of the size and of the amount of files of the port keys directories.
+
+    It is updated from the paths changed by the file system events (which costs
+    a `stat` per event) and fully rescans a directory when its size was never
+    computed, when the events stopped being tracked or every `reconcile_interval_s`
+    (events can be missed, e.g. when the inotify queue overflows).
+    """
+
+    def __init__(
+        self,
+        outputs_path: Path,
+        *,
+        reconcile_interval_s: NonNegativeFloat = _RECONCILE_INTERVAL_S,
+    ) -> None:
+        self.outputs_path = outputs_path
+        self.reconcile_interval_s = reconcile_interval_s
+
+        self._tracked_directories: dict[str, _TrackedDirectory] = {}
+
+    def set_port_keys(self, port_keys: set[str]) -> None:
+        self._tracked_directories = {
+            port_key: self._tracked_directories.get(port_key) or _TrackedDirectory(self.outputs_path / port_key)
+            for port_key in port_keys
+        }
+
+    def invalidate(self) -> None:
+        """forces a full scan of all directories, e.g. after changes which were not tracked"""
+        for tracked_directory in self._tracked_directories.values():
+            tracked_directory.last_full_scan = None
+
+    def path_changed(self, port_key: str, path: str, *, is_directory: bool) -> None:
+        if tracked_directory := self._tracked_directories.get(port_key):
+            tracked_directory.path_changed(path, is_directory=is_directory)
+
+    def get_usage(self, port_key: str) -> PortKeyUsage:
+        tracked_directory = self._tracked_directories.setdefault(
+            port_key, _TrackedDirectory(self.outputs_path / port_key)
+        )
+        if (
+            tracked_directory.last_full_scan is None
+            or time.monotonic() - tracked_directory.last_full_scan > self.reconcile_interval_s
+        ):
+            tracked_directory.full_scan()
+
+        return PortKeyUsage(
+            port_key=port_key,
+            total_size=tracked_directory.total_size,
+            file_count=tracked_directory.file_count,
+        )
@@ -19,7 +19,7 @@ from pydantic import (
 from servicelib.logging_utils import log_context
 from watchdog.observers.api import DEFAULT_OBSERVER_TIMEOUT
 
-from ._directory_utils import get_directory_total_size
+from ._directory_utils import PortKeyUsage, get_directory_total_size
 from ._manager import OutputsManager
 
 type PortEvent = str | None
@@ -85,6 +85,7 @@ class EventFilter:
         self._task_upload_events: Task | None = None
 
         self._port_key_tracked_event: dict[str, TrackedEvent] = {}
+        self._port_key_usage: dict[str, PortKeyUsage] = {}
 
     async def _worker_incoming_event_ingestion(self) -> None:
         """processes incoming events generated by the watchdog"""
@@ -119,13 +120,12 @@ class EventFilter:
                 # Set the wait_interval for future events.
                 # NOTE: Computing the size of a directory is a relatively difficult task,
                 # example: on SSD with 1 million files ~ 2 seconds
-                # Size of directory will only be computed if:
+                # The size is usually the one tracked from the file system events,
+                # otherwise it will only be computed if:
                 # - event was just added
                 # - already waited more than the wait_interval
                 if tracked_event.wait_interval is None or elapsed_since_detection > tracked_event.wait_interval:
-                    port_key_dir_path = self.outputs_manager.outputs_context.outputs_path / port_key
-                    total_wait_for = self.delay_policy.get_wait_interval(get_directory_total_size(port_key_dir_path))
-                    tracked_event.wait_interval = total_wait_for
+                    tracked_event.wait_interval = self.delay_policy.get_wait_interval(self._get_dir_size(port_key))
 
                 # could require to wait more since wait_interval was just updated
                 elapsed_since_detection = current_time - tracked_event.last_detection
@@ -139,6 +139,11 @@ class EventFilter:
 
             time.sleep(repeat_interval)
 
+    def _get_dir_size(self, port_key: str) -> NonNegativeInt:
+        if port_key_usage := self._port_key_usage.get(port_key):
+            return port_key_usage.total_size
+        return get_directory_total_size(self.outputs_manager.outputs_context.outputs_path / port_key)
+
     async def _worker_event_emitter(self) -> None:
         """checks at fixed intervals if it should emit events to upload"""
         with ThreadPoolExecutor(max_workers=1) as pool:
@@ -157,6 +162,9 @@ class EventFilter:
     async def enqueue(self, port_key: str) -> None:
         await self._incoming_events_queue.put(port_key)
 
+    def set_port_key_usage(self, port_key_usage: PortKeyUsage) -> None:
+        self._port_key_usage[port_key_usage.port_key] = port_key_usage
+
     async def start(self) -> None:
         with log_context(_logger, logging.INFO, f"{EventFilter.__name__} start"):
             self._task_incoming_event_ingestion = create_task(
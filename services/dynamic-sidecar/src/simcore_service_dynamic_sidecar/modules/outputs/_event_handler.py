@@ -14,9 +14,10 @@ from aioprocessing.process import AioProcess  # type: ignore [import-untyped]
 from aioprocessing.queues import AioQueue  # type: ignore [import-untyped]
 from pydantic import PositiveFloat
 from servicelib.logging_utils import log_context
-from watchdog.events import FileSystemEvent
+from watchdog.events import DirModifiedEvent, FileSystemEvent
 
 from ._context import OutputsContext
+from ._directory_utils import PortsSizeTracker
 from ._manager import OutputsManager
 from ._watchdog_extensions import ExtendedInotifyObserver, SafeFileSystemEventHandler
 
@@ -29,28 +30,36 @@ def _get_first_entry_or_none(data: list[str]) -> str | None:
     return next(iter(data), None)
 
 
+def _as_str(path: bytes | str) -> str:
+    return path.decode() if isinstance(path, bytes) else path
+
+
 class _PortKeysEventHandler(SafeFileSystemEventHandler):
     # NOTE: runs in the created process
 
-    def __init__(self, outputs_path: Path, port_key_events_queue: AioQueue):
+    def __init__(self, outputs_path: Path, port_key_events_queue: AioQueue, port_key_usages_queue: AioQueue):
         super().__init__()
 
         self._is_event_propagation_enabled: bool = False
         self.outputs_path: Path = outputs_path
         self.port_key_events_queue: AioQueue = port_key_events_queue
+        self.port_key_usages_queue: AioQueue = port_key_usages_queue
         self._outputs_port_keys: set[str] = set()
+        self._ports_size_tracker = PortsSizeTracker(outputs_path)
 
     def handle_set_outputs_port_keys(self, *, outputs_port_keys: set[str]) -> None:
         self._outputs_port_keys = outputs_port_keys
+        self._ports_size_tracker.set_port_keys(outputs_port_keys)
 
     def handle_toggle_event_propagation(self, *, is_enabled: bool) -> None:
         self._is_event_propagation_enabled = is_enabled
+        if not is_enabled:
+            # NOTE: changes are not tracked from now on, sizes are computed again once enabled
+            self._ports_size_tracker.invalidate()
 
     def _get_relative_path_parents(self, path: bytes | str) -> list[str]:
         try:
-            spath_relative_to_outputs = Path(path.decode() if isinstance(path, bytes) else path).relative_to(
-                self.outputs_path
-            )
+            spath_relative_to_outputs = Path(_as_str(path)).relative_to(self.outputs_path)
         except ValueError:
             return []
         return [f"{x}" for x in spath_relative_to_outputs.parents]
@@ -85,7 +94,19 @@ class _PortKeysEventHandler(SafeFileSystemEventHandler):
                 # will be consumed by the asyncio thread
                 detected_port_key_candidates.add(port_key_candidate)
 
+        # NOTE: a directory is modified when its content changes, which generates its own events
+        if not isinstance(event, DirModifiedEvent):
+            for path, port_key_candidate in (
+                (event.src_path, src_port_key_candidate),
+                (event.dest_path, dst_port_key_candidate),
+            ):
+                if port_key_candidate in detected_port_key_candidates:
+                    self._ports_size_tracker.path_changed(
+                        port_key_candidate, _as_str(path), is_directory=event.is_directory
+                    )
+
         for port_key_candidate in detected_port_key_candidates:
+            self.port_key_usages_queue.put(self._ports_size_tracker.get_usage(port_key_candidate))
             self.port_key_events_queue.put(port_key_candidate)
 
 
@@ -139,6 +160,7 @@ class _EventHandlerProcess:
 
             # signal queue observers to finish
             self.outputs_context.port_key_events_queue.put(None)  # pylint:disable=no-member
+            self.outputs_context.port_key_usages_queue.put(None)  # pylint:disable=no-member
             self.health_check_queue.put(None)  # pylint:disable=no-member
 
     def _thread_worker_update_outputs_port_keys(self) -> None:
@@ -170,6 +192,7 @@ class _EventHandlerProcess:
         self._file_system_event_handler = _PortKeysEventHandler(
             outputs_path=self.outputs_context.outputs_path,
             port_key_events_queue=self.outputs_context.port_key_events_queue,
+            port_key_usages_queue=self.outputs_context.port_key_usages_queue,
         )
         watch = None
 
@@ -126,6 +126,8 @@ class OutputsManager:  # pylint: disable=too-many-instance-attributes
         assert len(port_keys) > 0  # nosec
 
         async def _upload_ports() -> None:
+            # NOTE: the value of a folder port is a single archive of its content, so the whole
+            # port is uploaded again. Uploading only the changed files requires changing the port data model
             with log_context(_logger, logging.INFO, f"Uploading port keys: {port_keys}"):
                 async with progress_bar.ProgressBarData(
                     num_steps=1,
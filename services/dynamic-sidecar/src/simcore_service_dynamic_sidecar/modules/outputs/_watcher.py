@@ -8,6 +8,7 @@ from servicelib.logging_utils import log_context
 from watchdog.observers.api import DEFAULT_OBSERVER_TIMEOUT
 
 from ._context import OutputsContext
+from ._directory_utils import PortKeyUsage
 from ._event_filter import EventFilter
 from ._event_handler import EventHandlerObserver
 from ._manager import OutputsManager
@@ -21,6 +22,7 @@ class OutputsWatcher:
         self.outputs_context = outputs_context
 
         self._task_events_worker: Task | None = None
+        self._task_usages_worker: Task | None = None
         self._event_filter = EventFilter(outputs_manager=outputs_manager)
         self._observer_monitor: EventHandlerObserver = EventHandlerObserver(
             outputs_context=self.outputs_context,
@@ -36,6 +38,14 @@ class OutputsWatcher:
 
             await self._event_filter.enqueue(event)
 
+    async def _worker_usages(self) -> None:
+        while True:
+            usage: PortKeyUsage | None = await self.outputs_context.port_key_usages_queue.coro_get()
+            if usage is None:
+                break
+
+            self._event_filter.set_port_key_usage(usage)
+
     async def enable_event_propagation(self) -> None:
         await self.outputs_context.toggle_event_propagation(is_enabled=True)
 
@@ -45,6 +55,7 @@ class OutputsWatcher:
     async def start(self) -> None:
         with log_context(_logger, logging.INFO, f"{OutputsWatcher.__name__} start"):
             self._task_events_worker = create_task(self._worker_events(), name="outputs_watcher_events_worker")
+            self._task_usages_worker = create_task(self._worker_usages(), name="outputs_watcher_usages_worker")
 
             await self._event_filter.start()
             await self._observer_monitor.start()
@@ -55,10 +66,11 @@ class OutputsWatcher:
             await self._event_filter.shutdown()
             await self._observer_monitor.stop()
 
-            if self._task_events_worker is not None:
-                self._task_events_worker.cancel("shutting down outputs watcher")
-                with suppress(CancelledError):
-                    await self._task_events_worker
+            for task in (self._task_events_worker, self._task_usages_worker):
+                if task is not None:
+                    task.cancel("shutting down outputs watcher")
+                    with suppress(CancelledError):
+                        await task
 
 
 def setup_outputs_watcher(app: FastAPI) -> None:
@@ -645,6 +645,74 @@ async def test_container_save_state(
     assert isinstance(result, int)
 
 
+async def test_container_save_state_skips_unchanged_state_paths(
+    rpc_client: RabbitMQRPCClient,
+    node_id: NodeID,
+    lrt_namespace: LRTNamespace,
+    mock_data_manager: None,
+    app: FastAPI,
+):
+    state_paths = list(app.state.mounted_volumes.disk_state_paths_iter())
+    assert len(state_paths) > 0
+    push_directory: AsyncMock = sidecar_lrts.data_manager._push_directory  # noqa: SLF001
+
+    async def _save_state() -> None:
+        await get_lrt_result(
+            rpc_client,
+            lrt_namespace,
+            task_id=await _get_task_id_state_save_task(rpc_client, node_id, lrt_namespace),
+            task_timeout=_CREATE_SERVICE_CONTAINERS_TIMEOUT,
+            status_poll_interval=_FAST_STATUS_POLL,
+            progress_callback=_debug_progress,
+        )
+
+    await _save_state()
+    assert push_directory.call_count == len(state_paths)
+
+    # nothing changed
+    await _save_state()
+    assert push_directory.call_count == len(state_paths)
+
+    (state_paths[0] / "a_file").write_text("changed")
+    await _save_state()
+    assert push_directory.call_count == len(state_paths) + 1
+    assert push_directory.call_args.kwargs["source_path"] == state_paths[0]
+
+
+async def test_container_restore_and_save_state_report_the_same_size_with_symlinked_directories(
+    rpc_client: RabbitMQRPCClient,
+    node_id: NodeID,
+    lrt_namespace: LRTNamespace,
+    mock_data_manager: None,
+    app: FastAPI,
+):
+    state_path = next(iter(app.state.mounted_volumes.disk_state_paths_iter()))
+
+    async def _get_result(task_id: TaskId) -> int:
+        result = await get_lrt_result(
+            rpc_client,
+            lrt_namespace,
+            task_id=task_id,
+            task_timeout=_CREATE_SERVICE_CONTAINERS_TIMEOUT,
+            status_poll_interval=_FAST_STATUS_POLL,
+            progress_callback=_debug_progress,
+        )
+        assert isinstance(result, int)
+        return result
+
+    size_before = await _get_result(await _get_task_id_state_restore_task(rpc_client, node_id, lrt_namespace))
+
+    (state_path / "lib").mkdir()
+    (state_path / "lib" / "a_file").write_bytes(b"a" * 10)
+    (state_path / "lib64").symlink_to("lib")
+    (state_path / "loop").symlink_to(".")
+
+    restored_size = await _get_result(await _get_task_id_state_restore_task(rpc_client, node_id, lrt_namespace))
+    assert restored_size == size_before + 10
+    saved_size = await _get_result(await _get_task_id_state_save_task(rpc_client, node_id, lrt_namespace))
+    assert saved_size == restored_size
+
+
 @pytest.mark.parametrize("inputs_pulling_enabled", [True, False])
 async def test_container_pull_input_ports(
     rpc_client: RabbitMQRPCClient,
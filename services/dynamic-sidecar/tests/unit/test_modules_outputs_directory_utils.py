@@ -1,5 +1,6 @@
 # pylint:disable=redefined-outer-name
 
+import os
 import time
 from pathlib import Path
 from random import randbytes
@@ -8,7 +9,11 @@ from uuid import uuid4
 import pytest
 from pydantic import NonNegativeInt, PositiveInt
 from simcore_service_dynamic_sidecar.modules.outputs._directory_utils import (
+    PortKeyUsage,
+    PortsSizeTracker,
+    get_directory_manifest,
     get_directory_total_size,
+    get_manifest_total_size,
 )
 
 
@@ -57,3 +62,115 @@ def test_get_directory_total_size(dir_with_files: tuple[Path, PositiveInt]):
     print(f"runtime {runtime:04}")
 
     assert expected_size == dir_size
+
+
+def test_get_directory_manifest(tmp_path: Path):
+    assert get_directory_manifest(tmp_path / "missing") == {}
+
+    _create_files(tmp_path / "subdir", 2)
+    manifest = get_directory_manifest(tmp_path)
+    assert len(manifest) == 3
+    assert get_directory_manifest(tmp_path) == manifest
+    assert get_manifest_total_size(manifest) == get_directory_total_size(tmp_path)
+
+    # content changes
+    file_path = next((tmp_path / "subdir").iterdir())
+    file_path.write_bytes(randbytes(1))
+    assert get_directory_manifest(tmp_path) != manifest
+    manifest = get_directory_manifest(tmp_path)
+
+    # modification time restored
+    file_stat = file_path.stat()
+    file_path.write_bytes(randbytes(1))
+    os.utime(file_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns))
+    assert get_directory_manifest(tmp_path) != manifest
+    manifest = get_directory_manifest(tmp_path)
+
+    # empty directory created
+    (tmp_path / "empty").mkdir()
+    assert get_directory_manifest(tmp_path) != manifest
+
+
+def test_directory_sizes_do_not_follow_symlinked_directories(tmp_path: Path):
+    port_key = "output_1"
+    port_path = tmp_path / port_key
+    expected_size = _create_files(port_path / "lib", 3)
+    (port_path / "lib64").symlink_to("lib")
+    (port_path / "loop").symlink_to(".")
+    (port_path / "dangling").symlink_to("missing")
+
+    assert get_directory_total_size(port_path) == expected_size
+    assert get_manifest_total_size(get_directory_manifest(port_path)) == expected_size
+
+    tracker = PortsSizeTracker(tmp_path)
+    tracker.set_port_keys({port_key})
+    assert tracker.get_usage(port_key).total_size == expected_size
+
+    for link_name in ("lib64", "loop"):
+        tracker.path_changed(port_key, f"{port_path / link_name}", is_directory=True)
+    assert tracker.get_usage(port_key).total_size == expected_size
+
+
+def test_ports_size_tracker(tmp_path: Path):
+    port_key = "output_1"
+    port_path = tmp_path / port_key
+    port_path.mkdir()
+    (port_path / "initial").write_bytes(randbytes(10))
+
+    tracker = PortsSizeTracker(tmp_path)
+    tracker.set_port_keys({port_key})
+
+    def _assert_usage(total_size: NonNegativeInt, file_count: NonNegativeInt) -> None:
+        assert tracker.get_usage(port_key) == PortKeyUsage(port_key=port_key, total_size=total_size, file_count=file_count)
+        assert get_directory_total_size(port_path) == total_size
+
+    # first usage is computed by scanning the directory
+    _assert_usage(10, 1)
+
+    # files created, modified and deleted
+    file_path = port_path / "a_file"
+    file_path.write_bytes(randbytes(5))
+    tracker.path_changed(port_key, f"{file_path}", is_directory=False)
+    _assert_usage(15, 2)
+
+    file_path.write_bytes(randbytes(7))
+    tracker.path_changed(port_key, f"{file_path}", is_directory=False)
+    _assert_usage(17, 2)
+
+    file_path.unlink()
+    tracker.path_changed(port_key, f"{file_path}", is_directory=False)
+    _assert_usage(10, 1)
+
+    # directory moved in and out
+    moved_dir = tmp_path / "outside"
+    _create_files(moved_dir, 10)
+    moved_to = port_path / "subdir"
+    moved_dir.rename(moved_to)
+    tracker.path_changed(port_key, f"{moved_to}", is_directory=True)
+    _assert_usage(20, 11)
+
+    moved_to.rename(moved_dir)
+    tracker.path_changed(port_key, f"{moved_to}", is_directory=True)
+    _assert_usage(10, 1)
+
+    # untracked changes are picked up once the size is reconciled
+    (port_path / "untracked").write_bytes(randbytes(3))
+    assert tracker.get_usage(port_key).total_size == 10
+    tracker.invalidate()
+    _assert_usage(13, 2)
+
+    # changes to unknown port keys are ignored
+    tracker.path_changed("unknown_port", f"{tmp_path / 'unknown_port' / 'file'}", is_directory=False)
+
+
+def test_ports_size_tracker_reconciles_periodically(tmp_path: Path):
+    port_key = "output_1"
+    expected_size = _create_files(tmp_path / port_key, 10)
+
+    tracker = PortsSizeTracker(tmp_path, reconcile_interval_s=0)
+    tracker.set_port_keys({port_key})
+    assert tracker.get_usage(port_key).total_size == expected_size
+
+    expected_size += _create_files(tmp_path / port_key / "subdir", 10)
+    time.sleep(0.01)
+    assert tracker.get_usage(port_key).total_size == expected_size
@@ -13,6 +13,7 @@ from simcore_service_dynamic_sidecar.modules.notifications._notifications_ports
     PortNotifier,
 )
 from simcore_service_dynamic_sidecar.modules.outputs._context import OutputsContext
+from simcore_service_dynamic_sidecar.modules.outputs._directory_utils import PortKeyUsage
 from simcore_service_dynamic_sidecar.modules.outputs._event_filter import (
     BaseDelayPolicy,
     DefaultDelayPolicy,
@@ -217,6 +218,21 @@ async def test_minimum_amount_of_get_directory_total_size_calls_with_continuous_
             assert mocked_port_key_content_changed.call_count == 1
 
 
+async def test_tracked_port_key_usage_avoids_computing_directory_size(
+    mock_get_directory_total_size: AsyncMock,
+    event_filter: EventFilter,
+    port_key_1: str,
+    mocked_port_key_content_changed: AsyncMock,
+):
+    event_filter.set_port_key_usage(PortKeyUsage(port_key=port_key_1, total_size=1, file_count=1))
+
+    await event_filter.enqueue(port_key_1)
+    async for attempt in AsyncRetrying(**_TENACITY_RETRY_PARAMS):
+        with attempt:
+            assert mocked_port_key_content_changed.call_count == 1
+    assert mock_get_directory_total_size.call_count == 0
+
+
 def test_default_delay_policy():
     wait_policy = DefaultDelayPolicy()
 
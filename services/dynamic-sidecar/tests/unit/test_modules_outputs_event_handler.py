@@ -15,6 +15,7 @@ from simcore_service_dynamic_sidecar.modules.notifications._notifications_ports
     PortNotifier,
 )
 from simcore_service_dynamic_sidecar.modules.outputs._context import OutputsContext
+from simcore_service_dynamic_sidecar.modules.outputs._directory_utils import PortKeyUsage
 from simcore_service_dynamic_sidecar.modules.outputs._event_handler import (
     EventHandlerObserver,
     _EventHandlerProcess,
@@ -229,10 +230,36 @@ def test_port_keys_event_handler_triggers_for_events(
     mock_state_path: Path, event: FileSystemEvent, expected_port_key: str | None
 ) -> None:
     queue = _MockAioQueue()
+    usages_queue = _MockAioQueue()
 
-    event_handler = _PortKeysEventHandler(mock_state_path, queue)
+    event_handler = _PortKeysEventHandler(mock_state_path, queue, usages_queue)
     event_handler.handle_set_outputs_port_keys(outputs_port_keys={"output_1"})
     event_handler.handle_toggle_event_propagation(is_enabled=True)
 
     event_handler.event_handler(event)
     assert queue.get() == expected_port_key
+    usage = usages_queue.get()
+    assert (usage.port_key if usage else None) == expected_port_key
+
+
+def test_port_keys_event_handler_tracks_port_usage(tmp_path: Path) -> None:
+    queue = _MockAioQueue()
+    usages_queue = _MockAioQueue()
+
+    port_path = tmp_path / "output_1"
+    port_path.mkdir()
+    (port_path / "existing.txt").write_text("existing")
+
+    event_handler = _PortKeysEventHandler(tmp_path, queue, usages_queue)
+    event_handler.handle_set_outputs_port_keys(outputs_port_keys={"output_1"})
+    event_handler.handle_toggle_event_propagation(is_enabled=True)
+
+    file_path = port_path / "new.txt"
+    file_path.write_text("new")
+    event_handler.event_handler(FileCreatedEvent(src_path=f"{file_path}", dest_path=""))
+    assert usages_queue.get() == PortKeyUsage(port_key="output_1", total_size=11, file_count=2)
+
+    moved_file_path = tmp_path / "new.txt"
+    file_path.rename(moved_file_path)
+    event_handler.event_handler(FileMovedEvent(src_path=f"{file_path}", dest_path=f"{moved_file_path}"))
+    assert usages_queue.get() == PortKeyUsage(port_key="output_1", total_size=8, file_count=1)
@@ -122,6 +122,10 @@ class ApplicationSettings(MinimalApplicationSettings):
         default=6,
         description="Heartbeat counter limit when RUT considers service as unhealthy.",
     )
+    RESOURCE_USAGE_TRACKER_HEARTBEAT_BATCH_INTERVAL_SEC: datetime.timedelta = Field(
+        default=datetime.timedelta(seconds=5),
+        description="Interval at which received heartbeats are applied in bulk. (default to seconds, or see https://pydantic-docs.helpmanual.io/usage/types/#datetime-types for string formatting)",
+    )
     RESOURCE_USAGE_TRACKER_PROMETHEUS_INSTRUMENTATION_ENABLED: bool = True
     RESOURCE_USAGE_TRACKER_S3: S3Settings | None = Field(
         json_schema_extra={"auto_default_from_env": True},
@@ -131,7 +135,11 @@ class ApplicationSettings(MinimalApplicationSettings):
         json_schema_extra={"auto_default_from_env": True},
     )
 
-    @field_validator("RESOURCE_USAGE_TRACKER_MISSED_HEARTBEAT_INTERVAL_SEC", mode="before")
+    @field_validator(
+        "RESOURCE_USAGE_TRACKER_MISSED_HEARTBEAT_INTERVAL_SEC",
+        "RESOURCE_USAGE_TRACKER_HEARTBEAT_BATCH_INTERVAL_SEC",
+        mode="before",
+    )
     @classmethod
     def _validate_interval(cls, v):
         if isinstance(v, str) and v.isnumeric():
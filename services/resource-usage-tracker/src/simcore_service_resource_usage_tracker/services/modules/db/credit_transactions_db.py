@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Iterable
 from decimal import Decimal
 from typing import cast
 
@@ -20,6 +21,9 @@ from simcore_postgres_database.models.resource_tracker_credit_transactions impor
 from simcore_postgres_database.models.resource_tracker_service_runs import (
     resource_tracker_service_runs,
 )
+from simcore_postgres_database.models.resource_tracker_wallet_balances import (
+    resource_tracker_wallet_balances,
+)
 from simcore_postgres_database.utils_repos import transaction_context
 from sqlalchemy.engine import CursorResult
 from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
@@ -99,6 +103,43 @@ async def update_credit_transaction_credits(
     return cast(CreditTransactionId | None, row[0])
 
 
+async def batch_update_credit_transaction_credits(
+    engine: AsyncEngine,
+    connection: AsyncConnection | None = None,
+    *,
+    data: list[CreditTransactionCreditsUpdate],
+) -> list[ServiceRunID]:
+    """Same as `update_credit_transaction_credits` for many transactions in a single statement
+
+    Returns the service run ids of the updated transactions
+    """
+    if not data:
+        return []
+    updates = sa.values(
+        sa.column("service_run_id", sa.String),
+        sa.column("osparc_credits", resource_tracker_credit_transactions.c.osparc_credits.type),
+        sa.column("last_heartbeat_at", sa.DateTime(timezone=True)),
+        name="updates",
+    ).data([(f"{d.service_run_id}", d.osparc_credits, d.last_heartbeat_at) for d in data])
+    async with transaction_context(engine, connection) as conn:
+        update_stmt = (
+            resource_tracker_credit_transactions.update()
+            .values(
+                modified=sa.func.now(),
+                osparc_credits=updates.c.osparc_credits,
+                last_heartbeat_at=updates.c.last_heartbeat_at,
+            )
+            .where(
+                (resource_tracker_credit_transactions.c.service_run_id == updates.c.service_run_id)
+                & (resource_tracker_credit_transactions.c.transaction_status == CreditTransactionStatus.PENDING)
+                & (resource_tracker_credit_transactions.c.last_heartbeat_at <= updates.c.last_heartbeat_at)
+            )
+            .returning(resource_tracker_credit_transactions.c.service_run_id)
+        )
+        result = await conn.execute(update_stmt)
+    return [cast(ServiceRunID, row[0]) for row in result.fetchall()]
+
+
 async def update_credit_transaction_credits_and_status(
     engine: AsyncEngine,
     connection: AsyncConnection | None = None,
@@ -169,29 +210,64 @@ async def sum_wallet_credits(
     wallet_id: WalletID,
     include_pending_transactions: bool = True,
 ) -> WalletTotalCredits:
+    """sum of the BILLED, IN_DEBT (and PENDING) transactions of the wallet
+
+    NOTE: reads the balance materialized in `resource_tracker_wallet_balances` (kept up to date
+    by a trigger on the transactions table) instead of summing all the transactions
+    """
+    wallets_credits = await sum_wallets_credits(
+        engine,
+        connection,
+        wallets=[(product_name, wallet_id)],
+        include_pending_transactions=include_pending_transactions,
+    )
+    return wallets_credits[(product_name, wallet_id)]
+
+
+async def sum_wallets_credits(
+    engine: AsyncEngine,
+    connection: AsyncConnection | None = None,
+    *,
+    wallets: Iterable[tuple[ProductName, WalletID]],
+    include_pending_transactions: bool = True,
+) -> dict[tuple[ProductName, WalletID], WalletTotalCredits]:
+    """Same as `sum_wallet_credits` for many wallets in a single query"""
+    wallets = set(wallets)
+    if not wallets:
+        return {}
     async with transaction_context(engine, connection) as conn:
-        statuses = [
-            CreditTransactionStatus.BILLED,
-            CreditTransactionStatus.IN_DEBT,
-        ]
+        select_stmt = sa.select(
+            resource_tracker_wallet_balances.c.product_name,
+            resource_tracker_wallet_balances.c.wallet_id,
+            resource_tracker_wallet_balances.c.settled_osparc_credits,
+            resource_tracker_wallet_balances.c.pending_osparc_credits,
+        ).where(
+            sa.tuple_(
+                resource_tracker_wallet_balances.c.product_name,
+                resource_tracker_wallet_balances.c.wallet_id,
+            ).in_(wallets)
+        )
+        result = await conn.execute(select_stmt)
+
+    wallets_credits: dict[tuple[ProductName, WalletID], WalletTotalCredits] = {}
+    for row in result.fetchall():
+        available_osparc_credits = row.settled_osparc_credits
         if include_pending_transactions:
-            statuses.append(CreditTransactionStatus.PENDING)
-        sum_stmt = sa.select(sa.func.sum(resource_tracker_credit_transactions.c.osparc_credits)).where(
-            (resource_tracker_credit_transactions.c.product_name == product_name)
-            & (resource_tracker_credit_transactions.c.wallet_id == wallet_id)
-            & (resource_tracker_credit_transactions.c.transaction_status.in_(statuses))
+            available_osparc_credits += row.pending_osparc_credits
+        wallets_credits[(row.product_name, row.wallet_id)] = WalletTotalCredits(
+            wallet_id=row.wallet_id, available_osparc_credits=available_osparc_credits
         )
 
-        result = await conn.execute(sum_stmt)
-    row = result.first()
-    if row is None or row[0] is None:
+    for product_name, wallet_id in wallets - wallets_credits.keys():
         _logger.warning(
             "No credits found for wallet %s with product %s",
             wallet_id,
             product_name,
         )
-        return WalletTotalCredits(wallet_id=wallet_id, available_osparc_credits=Decimal(0))
-    return WalletTotalCredits(wallet_id=wallet_id, available_osparc_credits=row[0])
+        wallets_credits[(product_name, wallet_id)] = WalletTotalCredits(
+            wallet_id=wallet_id, available_osparc_credits=Decimal(0)
+        )
+    return wallets_credits
 
 
 async def get_transaction_current_credits_by_service_run_id(
@@ -136,6 +136,41 @@ async def update_service_run_last_heartbeat(
     return ServiceRunDB.model_validate(row)
 
 
+async def batch_update_service_runs_last_heartbeat(
+    engine: AsyncEngine,
+    connection: AsyncConnection | None = None,
+    *,
+    data: list[ServiceRunLastHeartbeatUpdate],
+) -> list[ServiceRunDB]:
+    """Same as `update_service_run_last_heartbeat` for many service runs in a single statement
+
+    Returns the updated service runs
+    """
+    if not data:
+        return []
+    updates = sa.values(
+        sa.column("service_run_id", sa.String),
+        sa.column("last_heartbeat_at", sa.DateTime(timezone=True)),
+        name="updates",
+    ).data([(f"{d.service_run_id}", d.last_heartbeat_at) for d in data])
+    async with transaction_context(engine, connection) as conn:
+        result = await conn.execute(
+            resource_tracker_service_runs.update()
+            .values(
+                modified=sa.func.now(),
+                last_heartbeat_at=updates.c.last_heartbeat_at,
+                missed_heartbeat_counter=0,
+            )
+            .where(
+                (resource_tracker_service_runs.c.service_run_id == updates.c.service_run_id)
+                & (resource_tracker_service_runs.c.service_run_status == ServiceRunStatus.RUNNING)
+                & (resource_tracker_service_runs.c.last_heartbeat_at <= updates.c.last_heartbeat_at)
+            )
+            .returning(*resource_tracker_service_runs.columns)
+        )
+    return [ServiceRunDB.model_validate(row) for row in result.fetchall()]
+
+
 async def update_service_run_stopped_at(
     engine: AsyncEngine,
     connection: AsyncConnection | None = None,
@@ -182,6 +217,21 @@ async def get_service_run_by_id(
     return ServiceRunDB.model_validate(row)
 
 
+async def list_service_runs_status_by_ids(
+    engine: AsyncEngine,
+    connection: AsyncConnection | None = None,
+    *,
+    service_run_ids: list[ServiceRunID],
+) -> dict[ServiceRunID, ServiceRunStatus]:
+    async with pass_or_acquire_connection(engine, connection) as conn:
+        stmt = sa.select(
+            resource_tracker_service_runs.c.service_run_id,
+            resource_tracker_service_runs.c.service_run_status,
+        ).where(resource_tracker_service_runs.c.service_run_id.in_([f"{_id}" for _id in service_run_ids]))
+        result = await conn.execute(stmt)
+    return {row.service_run_id: ServiceRunStatus(row.service_run_status) for row in result.fetchall()}
+
+
 _project_tags_subquery = (
     sa.select(
         projects_tags.c.project_uuid_for_rut,
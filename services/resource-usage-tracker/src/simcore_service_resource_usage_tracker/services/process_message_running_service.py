@@ -21,8 +21,10 @@ from models_library.resource_tracker import (
     ServiceRunStatus,
 )
 from models_library.services import ServiceType
+from models_library.services_types import ServiceRunID
 from pydantic import TypeAdapter
 from servicelib.rabbitmq import RabbitMQRPCClient
+from simcore_postgres_database.utils_repos import transaction_context
 from sqlalchemy.ext.asyncio import AsyncEngine
 
 from ..models.credit_transactions import (
@@ -46,6 +48,7 @@ from .notifications import notify_user_of_credit_reimbursement
 from .utils import (
     compute_service_run_credit_costs,
     make_negative,
+    publish_to_rabbitmq_wallet_credits,
     publish_to_rabbitmq_wallet_credits_limit_reached,
     sum_credit_transactions_and_publish_to_rabbitmq,
 )
@@ -53,6 +56,44 @@ from .utils import (
 _logger = logging.getLogger(__name__)
 
 
+class HeartbeatsBuffer:
+    """Collects the heartbeats received in a short window so that they are applied in bulk (see `flush`)
+
+    NOTE: only the latest heartbeat of each service run matters. Messages are acknowledged once
+    buffered: at worst (crash before a flush) a running service gets its heartbeat updated one
+    heartbeat later, which the missed heartbeats check tolerates.
+    """
+
+    def __init__(self, app: FastAPI) -> None:
+        self._app = app
+        self._heartbeats: dict[ServiceRunID, RabbitResourceTrackingHeartbeatMessage] = {}
+
+    def add(self, msg: RabbitResourceTrackingHeartbeatMessage) -> None:
+        current = self._heartbeats.get(msg.service_run_id)
+        if current is None or current.created_at <= msg.created_at:
+            self._heartbeats[msg.service_run_id] = msg
+
+    def discard(self, service_run_id: ServiceRunID) -> None:
+        self._heartbeats.pop(service_run_id, None)
+
+    async def flush(self) -> None:
+        if not self._heartbeats:
+            return
+        heartbeats, self._heartbeats = list(self._heartbeats.values()), {}
+        try:
+            await _process_heartbeat_events(self._app.state.engine, heartbeats, get_rabbitmq_client(self._app))
+        except Exception:
+            # NOTE: applied on next flush, unless newer heartbeats were received in the meantime
+            for msg in heartbeats:
+                self.add(msg)
+            raise
+
+
+def get_heartbeats_buffer(app: FastAPI) -> HeartbeatsBuffer | None:
+    buffer: HeartbeatsBuffer | None = getattr(app.state, "resource_tracker_heartbeats_buffer", None)
+    return buffer
+
+
 async def process_message(app: FastAPI, data: bytes) -> bool:
     rabbit_message: RabbitResourceTrackingMessages = TypeAdapter(RabbitResourceTrackingMessages).validate_json(data)
     _logger.info(
@@ -60,6 +101,14 @@ async def process_message(app: FastAPI, data: bytes) -> bool:
         rabbit_message.message_type,
         rabbit_message.service_run_id,
     )
+    if heartbeats_buffer := get_heartbeats_buffer(app):
+        if isinstance(rabbit_message, RabbitResourceTrackingHeartbeatMessage):
+            heartbeats_buffer.add(rabbit_message)
+            return True
+        if isinstance(rabbit_message, RabbitResourceTrackingStoppedMessage):
+            # NOTE: the stop message closes the service run, a pending heartbeat is obsolete
+            heartbeats_buffer.discard(rabbit_message.service_run_id)
+
     _db_engine = app.state.engine
     rabbitmq_client = get_rabbitmq_client(app)
     rabbitmq_rpc_client = get_rabbitmq_rpc_client(app)
@@ -164,67 +213,113 @@ async def _process_heartbeat_event(
     rabbitmq_client: RabbitMQClient,
     _rabbitmq_rpc_client: RabbitMQRPCClient,
 ):
-    service_run_db = await service_runs_db.get_service_run_by_id(db_engine, service_run_id=msg.service_run_id)
-    if not service_run_db:
-        _logger.error(
-            **create_troubleshooting_log_kwargs(
-                "Received process heartbeat event but we do not have the started record in the DB",
-                error=RuntimeError("No service run record found in DB for the received heartbeat event"),
-                error_context={"service_run_id": msg.service_run_id},
+    await _process_heartbeat_events(db_engine, [msg], rabbitmq_client)
+
+
+def _log_heartbeats_not_applied(
+    heartbeats: list[RabbitResourceTrackingHeartbeatMessage],
+    service_runs_status: dict[ServiceRunID, ServiceRunStatus],
+) -> None:
+    for msg in heartbeats:
+        service_run_status = service_runs_status.get(msg.service_run_id)
+        if service_run_status is None:
+            _logger.error(
+                **create_troubleshooting_log_kwargs(
+                    "Received process heartbeat event but we do not have the started record in the DB",
+                    error=RuntimeError("No service run record found in DB for the received heartbeat event"),
+                    error_context={"service_run_id": msg.service_run_id},
+                )
             )
-        )
-        return
-    if service_run_db.service_run_status in {
-        ServiceRunStatus.SUCCESS,
-        ServiceRunStatus.ERROR,
-    }:
-        _logger.error(
-            **create_troubleshooting_log_kwargs(
-                "Received process heartbeat event but the service run was already closed",
-                error=RuntimeError("Service run already closed"),
-                error_context={"service_run_id": msg.service_run_id},
+        elif service_run_status in {
+            ServiceRunStatus.SUCCESS,
+            ServiceRunStatus.ERROR,
+        }:
+            _logger.error(
+                **create_troubleshooting_log_kwargs(
+                    "Received process heartbeat event but the service run was already closed",
+                    error=RuntimeError("Service run already closed"),
+                    error_context={"service_run_id": msg.service_run_id},
+                )
             )
-        )
-        return
+        else:
+            _logger.info("Nothing to update: %s", msg)
 
-    # Update `service run` record (if billable `credit transaction`) in the DB
-    update_service_run_last_heartbeat = ServiceRunLastHeartbeatUpdate(
-        service_run_id=msg.service_run_id, last_heartbeat_at=msg.created_at
-    )
-    running_service = await service_runs_db.update_service_run_last_heartbeat(
-        db_engine, data=update_service_run_last_heartbeat
-    )
-    if running_service is None:
-        _logger.info("Nothing to update: %s", msg)
+
+async def _process_heartbeat_events(
+    db_engine: AsyncEngine,
+    msgs: list[RabbitResourceTrackingHeartbeatMessage],
+    rabbitmq_client: RabbitMQClient,
+) -> None:
+    """Applies heartbeats in bulk: a constant number of DB round trips and one wallet
+    credits message per affected wallet, whatever the number of heartbeats
+    """
+    latest_heartbeats: dict[ServiceRunID, RabbitResourceTrackingHeartbeatMessage] = {}
+    for msg in msgs:
+        current = latest_heartbeats.get(msg.service_run_id)
+        if current is None or current.created_at <= msg.created_at:
+            latest_heartbeats[msg.service_run_id] = msg
+    if not latest_heartbeats:
         return
 
-    if running_service.wallet_id and running_service.pricing_unit_cost is not None:
-        # Compute currently used credits
-        computed_credits = await compute_service_run_credit_costs(
-            running_service.started_at,
-            msg.created_at,
-            running_service.pricing_unit_cost,
+    async with transaction_context(db_engine) as conn:
+        # Update `service run` records (if billable `credit transaction`) in the DB
+        running_services = await service_runs_db.batch_update_service_runs_last_heartbeat(
+            db_engine,
+            conn,
+            data=[
+                ServiceRunLastHeartbeatUpdate(service_run_id=msg.service_run_id, last_heartbeat_at=msg.created_at)
+                for msg in latest_heartbeats.values()
+            ],
         )
+        billable_running_services = [
+            service for service in running_services if service.wallet_id and service.pricing_unit_cost is not None
+        ]
+        credit_transactions_updates: list[CreditTransactionCreditsUpdate] = []
+        for running_service in billable_running_services:
+            assert running_service.pricing_unit_cost is not None  # nosec
+            last_heartbeat_at = latest_heartbeats[running_service.service_run_id].created_at
+            # Compute currently used credits
+            computed_credits = await compute_service_run_credit_costs(
+                running_service.started_at,
+                last_heartbeat_at,
+                running_service.pricing_unit_cost,
+            )
+            credit_transactions_updates.append(
+                CreditTransactionCreditsUpdate(
+                    service_run_id=running_service.service_run_id,
+                    osparc_credits=make_negative(computed_credits),
+                    last_heartbeat_at=last_heartbeat_at,
+                )
+            )
         # Update credits in the transaction table
-        update_credit_transaction = CreditTransactionCreditsUpdate(
-            service_run_id=msg.service_run_id,
-            osparc_credits=make_negative(computed_credits),
-            last_heartbeat_at=msg.created_at,
+        await credit_transactions_db.batch_update_credit_transaction_credits(
+            db_engine, conn, data=credit_transactions_updates
         )
-        await credit_transactions_db.update_credit_transaction_credits(db_engine, data=update_credit_transaction)
-        # Publish wallet total credits to RabbitMQ
-        wallet_total_credits = await sum_credit_transactions_and_publish_to_rabbitmq(
-            db_engine,
-            rabbitmq_client=rabbitmq_client,
-            product_name=running_service.product_name,
-            wallet_id=running_service.wallet_id,
+
+    updated_service_run_ids = {service.service_run_id for service in running_services}
+    if not_applied := [msg for msg in latest_heartbeats.values() if msg.service_run_id not in updated_service_run_ids]:
+        _log_heartbeats_not_applied(
+            not_applied,
+            await service_runs_db.list_service_runs_status_by_ids(
+                db_engine, service_run_ids=[msg.service_run_id for msg in not_applied]
+            ),
+        )
+
+    # Publish wallets total credits to RabbitMQ
+    wallets_total_credits = await credit_transactions_db.sum_wallets_credits(
+        db_engine,
+        wallets={(service.product_name, service.wallet_id) for service in billable_running_services if service.wallet_id},
+    )
+    for (product_name, wallet_id), wallet_total_credits in wallets_total_credits.items():
+        await publish_to_rabbitmq_wallet_credits(
+            rabbitmq_client, product_name=product_name, wallet_total_credits=wallet_total_credits
         )
         if wallet_total_credits.available_osparc_credits < CreditsLimit.OUT_OF_CREDITS:
             await publish_to_rabbitmq_wallet_credits_limit_reached(
                 db_engine,
                 rabbitmq_client,
-                product_name=running_service.product_name,
-                wallet_id=running_service.wallet_id,
+                product_name=product_name,
+                wallet_id=wallet_id,
                 credits_=wallet_total_credits.available_osparc_credits,
                 credits_limit=CreditsLimit.OUT_OF_CREDITS,
             )
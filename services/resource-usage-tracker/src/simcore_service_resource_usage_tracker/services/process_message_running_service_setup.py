@@ -2,20 +2,23 @@ import functools
 import logging
 from collections.abc import AsyncIterator, Awaitable, Callable
 
+from common_library.async_tools import cancel_wait_task
 from fastapi import FastAPI
 from fastapi_lifespan_manager import LifespanManager, State
 from models_library.rabbitmq_messages import RabbitResourceTrackingBaseMessage
+from servicelib.background_task import create_periodic_task
 from servicelib.logging_utils import log_catch, log_context
 from servicelib.rabbitmq import RabbitMQClient
 from settings_library.rabbit import RabbitSettings
 
 from ..core.settings import ApplicationSettings
 from .modules.rabbitmq import get_rabbitmq_client
-from .process_message_running_service import process_message
+from .process_message_running_service import HeartbeatsBuffer, get_heartbeats_buffer, process_message
 
 _logger = logging.getLogger(__name__)
 
 _RUT_MESSAGE_TTL_IN_MS = 2 * 60 * 60 * 1000  # 2 hours
+_TASK_NAME_FLUSH_HEARTBEATS = "rut_flush_heartbeats"
 
 
 async def _subscribe_to_rabbitmq(app) -> str:
@@ -42,10 +45,19 @@ def on_app_startup(app: FastAPI) -> Callable[[], Awaitable[None]]:
         ):
             app_settings: ApplicationSettings = app.state.settings
             app.state.resource_tracker_rabbitmq_consumer = None
+            app.state.resource_tracker_heartbeats_buffer = None
+            app.state.resource_tracker_heartbeats_flush_task = None
             settings: RabbitSettings | None = app_settings.RESOURCE_USAGE_TRACKER_RABBITMQ
             if not settings:
                 _logger.warning("RabbitMQ client is de-activated in the settings")
                 return
+            heartbeats_buffer = HeartbeatsBuffer(app)
+            app.state.resource_tracker_heartbeats_buffer = heartbeats_buffer
+            app.state.resource_tracker_heartbeats_flush_task = create_periodic_task(
+                heartbeats_buffer.flush,
+                interval=app_settings.RESOURCE_USAGE_TRACKER_HEARTBEAT_BATCH_INTERVAL_SEC,
+                task_name=_TASK_NAME_FLUSH_HEARTBEATS,
+            )
             app.state.resource_tracker_rabbitmq_consumer = await _subscribe_to_rabbitmq(app)
 
     return _startup
@@ -57,6 +69,12 @@ def on_app_shutdown(
     async def _stop() -> None:
         # NOTE: We want to have persistent queue, therefore we will not unsubscribe
         assert _app  # nosec
+        with log_catch(_logger, reraise=False):
+            if flush_task := getattr(_app.state, "resource_tracker_heartbeats_flush_task", None):
+                await cancel_wait_task(flush_task)
+            if heartbeats_buffer := get_heartbeats_buffer(_app):
+                # NOTE: heartbeats were already acknowledged, apply what is left
+                await heartbeats_buffer.flush()
 
     return _stop
 
@@ -45,14 +45,25 @@ async def sum_credit_transactions_and_publish_to_rabbitmq(
         product_name=product_name,
         wallet_id=wallet_id,
     )
+    await publish_to_rabbitmq_wallet_credits(
+        rabbitmq_client, product_name=product_name, wallet_total_credits=wallet_total_credits
+    )
+    return wallet_total_credits
+
+
+async def publish_to_rabbitmq_wallet_credits(
+    rabbitmq_client: RabbitMQClient,
+    *,
+    product_name: ProductName,
+    wallet_total_credits: WalletTotalCredits,
+) -> None:
     publish_message = WalletCreditsMessage.model_construct(
-        wallet_id=wallet_id,
+        wallet_id=wallet_total_credits.wallet_id,
         created_at=datetime.now(tz=UTC),
         credits=wallet_total_credits.available_osparc_credits,
         product_name=product_name,
     )
     await rabbitmq_client.publish(publish_message.channel_name, publish_message)
-    return wallet_total_credits
 
 
 _BATCH_SIZE = 20
@@ -38,10 +38,14 @@ from simcore_postgres_database.models.resource_tracker_pricing_units import (
 from simcore_postgres_database.models.resource_tracker_service_runs import (
     resource_tracker_service_runs,
 )
+from simcore_postgres_database.models.resource_tracker_wallet_balances import (
+    resource_tracker_wallet_balances,
+)
 from simcore_postgres_database.models.services import services_meta_data
 from simcore_service_resource_usage_tracker.services import notifications
 from simcore_service_resource_usage_tracker.services.process_message_running_service import (
     _process_heartbeat_event,
+    _process_heartbeat_events,
     _process_start_event,
     _process_stop_event,
 )
@@ -175,6 +179,7 @@ def resource_tracker_pricing_tables_db(postgres_db: sa.engine.Engine) -> Iterato
                 " resource_tracker_pricing_unit_costs,"
                 " resource_tracker_pricing_plans,"
                 " resource_tracker_credit_transactions,"
+                " resource_tracker_wallet_balances,"
                 " services_meta_data"
                 " RESTART IDENTITY CASCADE"
             )
@@ -253,6 +258,59 @@ async def test_process_event_functions(
             mocked_message_parser.assert_called_once()
 
 
+async def test_process_heartbeat_events_in_batch_updates_wallet_balance(
+    create_rabbitmq_client: Callable[[str], RabbitMQClient],
+    random_rabbit_message_start,
+    mocked_redis_server: None,
+    postgres_db: sa.engine.Engine,
+    resource_tracker_service_run_db,
+    resource_tracker_pricing_tables_db,
+    initialized_app,
+):
+    engine = initialized_app.state.engine
+    publisher = create_rabbitmq_client("publisher")
+    rpc_client = AsyncMock()
+
+    start_msgs = [
+        random_rabbit_message_start(
+            wallet_id=1,
+            wallet_name="test",
+            pricing_plan_id=1,
+            pricing_unit_id=1,
+            pricing_unit_cost_id=1,
+        )
+        for _ in range(3)
+    ]
+    for msg in start_msgs:
+        await _process_start_event(engine, msg, publisher, rpc_client)
+
+    # only the latest heartbeat of each service run is applied
+    heartbeat_msgs = [
+        RabbitResourceTrackingHeartbeatMessage(
+            service_run_id=msg.service_run_id,
+            created_at=msg.created_at + timedelta(seconds=seconds),
+        )
+        for msg in start_msgs
+        for seconds in (2, 1)
+    ]
+    await _process_heartbeat_events(engine, heartbeat_msgs, publisher)
+
+    total_credits = Decimal(0)
+    for msg in start_msgs:
+        output = await assert_credit_transactions_db_row(postgres_db, msg.service_run_id)
+        assert output.osparc_credits < 0.0
+        assert output.transaction_status == CreditTransactionStatus.PENDING.value
+        assert output.last_heartbeat_at == msg.created_at + timedelta(seconds=2)
+        total_credits += output.osparc_credits
+
+    with postgres_db.connect() as con:
+        balance = con.execute(
+            sa.select(resource_tracker_wallet_balances).where(resource_tracker_wallet_balances.c.wallet_id == 1)
+        ).one()
+    assert balance.pending_osparc_credits == total_credits
+    assert balance.settled_osparc_credits == 0
+
+
 async def test_stop_event_with_platform_bad_sends_reimbursement_notification(
     create_rabbitmq_client: Callable[[str], RabbitMQClient],
     random_rabbit_message_start,
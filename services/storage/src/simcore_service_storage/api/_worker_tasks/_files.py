@@ -34,4 +34,4 @@ async def complete_upload_file(
         # NOTE: completing a multipart upload on AWS can take up to several minutes
         # if it returns slow we return a 202 - Accepted, the client will have to check later
         # for completeness
-        return await dsm.complete_file_upload(file_id, user_id, body.parts)
+        return await dsm.complete_file_upload(file_id, user_id, body.parts, sha256_checksum=body.sha256_checksum)
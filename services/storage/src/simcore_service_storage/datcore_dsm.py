@@ -305,6 +305,8 @@ class DatCoreDataManager(BaseDataManager):
         file_id: StorageFileID,
         user_id: UserID,
         uploaded_parts: list[UploadedPart],
+        *,
+        sha256_checksum: SHA256Str | None = None,
     ) -> FileMetaData:
         raise NotImplementedError
 
@@ -116,8 +116,11 @@ class BaseDataManager(ABC):
         file_id: StorageFileID,
         user_id: UserID,
         uploaded_parts: list[UploadedPart],
+        *,
+        sha256_checksum: SHA256Str | None = None,
     ) -> FileMetaData:
-        """completes an upload if the user has the rights to"""
+        """completes an upload if the user has the rights to,
+        sha256_checksum is set when the client computed it while uploading"""
 
     @abstractmethod
     async def abort_file_upload(self, user_id: UserID, file_id: StorageFileID) -> None:
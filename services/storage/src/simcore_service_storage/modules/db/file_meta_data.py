@@ -1,8 +1,9 @@
 import contextlib
 import datetime
 from collections.abc import AsyncGenerator
+from itertools import batched
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Final
 
 import sqlalchemy as sa
 from annotated_types import doc
@@ -35,6 +36,10 @@ from .access_layer import readable_project_ids_stmt
 
 type TotalChildren = int
 
+# NOTE: every row of a multi-row INSERT takes one bind parameter per column and
+# postgres accepts at most 32767 of them in a single statement
+_UPSERT_MANY_BATCH_SIZE: Final[int] = 500
+
 
 class _PathsCursorParameters(BaseModel):
     # NOTE: this is a cursor do not put things that can grow unbounded as this goes then through REST APIs or such
@@ -143,6 +148,28 @@ class FileMetaDataRepository(BaseRepository):
                 ).one()
             )
 
+    async def upsert_many(
+        self,
+        *,
+        connection: AsyncConnection | None = None,
+        fmds: list[FileMetaDataAtDB],
+    ) -> list[FileMetaDataAtDB]:
+        """same as `upsert` for multiple entries at once, returns them in the same order"""
+        if not fmds:
+            return []
+
+        upserted: dict[SimcoreS3FileID, FileMetaDataAtDB] = {}
+        async with transaction_context(self.db_engine, connection) as conn:
+            for fmds_batch in batched(fmds, _UPSERT_MANY_BATCH_SIZE):
+                insert_stmt = pg_insert(file_meta_data).values([fmd.model_dump() for fmd in fmds_batch])
+                upsert_stmt = insert_stmt.on_conflict_do_update(
+                    index_elements=[file_meta_data.c.file_id],
+                    set_={column_name: insert_stmt.excluded[column_name] for column_name in fmds[0].model_dump()},
+                ).returning(literal_column("*"))
+                result = await conn.execute(upsert_stmt)
+                upserted |= {row.file_id: FileMetaDataAtDB.model_validate(row) for row in result}
+        return [upserted[fmd.file_id] for fmd in fmds]
+
     async def insert(self, *, connection: AsyncConnection | None = None, fmd: FileMetaData) -> FileMetaDataAtDB:
         fmd_db = FileMetaDataAtDB.model_validate(fmd)
         async with transaction_context(self.db_engine, connection) as conn:
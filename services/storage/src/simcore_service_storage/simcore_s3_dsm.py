@@ -151,6 +151,22 @@ async def _add_frontend_needed_data(
     return clean_data
 
 
+def _update_fmd_from_s3_metadata(
+    fmd: FileMetaDataAtDB, s3_metadata: S3MetaData | S3DirectoryMetaData
+) -> FileMetaDataAtDB:
+    if not fmd.is_directory:
+        assert isinstance(s3_metadata, S3MetaData)  # nosec
+        fmd.file_size = TypeAdapter(ByteSize).validate_python(s3_metadata.size)
+        fmd.last_modified = s3_metadata.last_modified
+        fmd.entity_tag = s3_metadata.e_tag
+    elif fmd.is_directory:
+        assert isinstance(s3_metadata, S3DirectoryMetaData)  # nosec
+        fmd.file_size = TypeAdapter(ByteSize).validate_python(s3_metadata.size)
+    fmd.upload_expires_at = None
+    fmd.upload_id = None
+    return fmd
+
+
 @dataclass
 class SimcoreS3DataManager(BaseDataManager):  # pylint:disable=too-many-public-methods
     simcore_bucket_name: S3BucketName
@@ -327,14 +343,12 @@ class SimcoreS3DataManager(BaseDataManager):  # pylint:disable=too-many-public-m
         )
 
         # ensure file sizes are uptodate
-        updated_fmds = []
-        for metadata in fmds:
-            if is_file_entry_valid(metadata):
-                updated_fmds.append(convert_db_to_model(metadata))
-                continue
-            updated_fmds.append(convert_db_to_model(await self._update_database_from_storage(metadata)))
+        valid_fmds = [metadata for metadata in fmds if is_file_entry_valid(metadata)]
+        updated_fmds = await self._update_database_from_storage_many(
+            [metadata for metadata in fmds if not is_file_entry_valid(metadata)]
+        )
 
-        return ByteSize(sum(fmd.file_size for fmd in updated_fmds))
+        return ByteSize(sum(convert_db_to_model(fmd).file_size for fmd in (*valid_fmds, *updated_fmds)))
 
     async def list_files(
         self,
@@ -384,17 +398,25 @@ class SimcoreS3DataManager(BaseDataManager):  # pylint:disable=too-many-public-m
         )
 
         # add all the entries from file_meta_data without
-        for metadata in file_and_directory_meta_data:
+        listed_fmds = [
+            metadata
+            for metadata in file_and_directory_meta_data
             # below checks ensures that directories either appear as
-            if metadata.is_directory and expand_dirs:
-                # avoids directory files and does not add any directory entry to the result
-                continue
-
+            # avoids directory files and does not add any directory entry to the result
+            if not (metadata.is_directory and expand_dirs)
+        ]
+        # entries not yet found in S3 (e.g. pending uploads) are skipped
+        updated_fmds: dict[SimcoreS3FileID, FileMetaDataAtDB] = {
+            fmd.file_id: fmd
+            for fmd in await self._update_database_from_storage_many(
+                [metadata for metadata in listed_fmds if not is_file_entry_valid(metadata)],
+                skip_missing=True,
+            )
+        }
+        for metadata in listed_fmds:
             if is_file_entry_valid(metadata):
                 data.append(convert_db_to_model(metadata))
-                continue
-            with suppress(S3KeyNotFoundError):
-                updated_fmd = await self._update_database_from_storage(metadata)
+            elif updated_fmd := updated_fmds.get(metadata.file_id):
                 data.append(convert_db_to_model(updated_fmd))
 
         # expand directories until the max number of files to return is reached
@@ -579,6 +601,8 @@ class SimcoreS3DataManager(BaseDataManager):  # pylint:disable=too-many-public-m
         file_id: StorageFileID,
         user_id: UserID,
         uploaded_parts: list[UploadedPart],
+        *,
+        sha256_checksum: SHA256Str | None = None,
     ) -> FileMetaData:
         can = await AccessLayerRepository.instance(get_db_engine(self.app)).get_file_access_rights(
             user_id=user_id, file_id=file_id
@@ -588,6 +612,9 @@ class SimcoreS3DataManager(BaseDataManager):  # pylint:disable=too-many-public-m
         fmd = await FileMetaDataRepository.instance(get_db_engine(self.app)).get(
             file_id=TypeAdapter(SimcoreS3FileID).validate_python(file_id)
         )
+        if sha256_checksum:
+            # NOTE: the client computes the checksum while uploading (single read of the file)
+            fmd.sha256_checksum = sha256_checksum
 
         if is_valid_managed_multipart_upload(fmd.upload_id):
             # NOTE: Processing of a Complete Multipart Upload request
@@ -823,17 +850,20 @@ class SimcoreS3DataManager(BaseDataManager):  # pylint:disable=too-many-public-m
                 logging.INFO,
                 f"{src_project_uuid} -> {dst_project_uuid}: get total file size for {len(src_project_files)} files",
             ):
-                sizes_and_num_files: list[tuple[ByteSize | UNDEFINED_SIZE_TYPE, int]] = await limited_gather(
-                    *[self._get_size_and_num_files(fmd) for fmd in src_project_files],
+                sizes: list[ByteSize | UNDEFINED_SIZE_TYPE] = await limited_gather(
+                    *[self._get_size(fmd) for fmd in src_project_files],
                     limit=_MAX_PARALLEL_S3_CALLS,
                 )
-            total_num_of_files = sum(n for _, n in sizes_and_num_files)
-            src_project_total_data_size = TypeAdapter(ByteSize).validate_python(sum(n for n, _ in sizes_and_num_files))
+            num_of_directories = sum(1 for fmd in src_project_files if fmd.is_directory)
+            num_of_files = len(src_project_files) - num_of_directories
+            src_project_total_data_size = TypeAdapter(ByteSize).validate_python(sum(sizes))
 
         async with S3TransferDataCB(
             task_progress,
             src_project_total_data_size,
-            task_progress_message_prefix=f"Copying {total_num_of_files} files to '{dst_project['name']}'",
+            task_progress_message_prefix=(
+                f"Copying {num_of_files} files and {num_of_directories} folders to '{dst_project['name']}'"
+            ),
         ) as s3_transferred_data_cb:
             with log_context(
                 _logger,
@@ -889,21 +919,18 @@ class SimcoreS3DataManager(BaseDataManager):  # pylint:disable=too-many-public-m
             ):
                 await limited_gather(*copy_tasks, limit=MAX_CONCURRENT_S3_TASKS)
 
-    async def _get_size_and_num_files(self, fmd: FileMetaDataAtDB) -> tuple[ByteSize | UNDEFINED_SIZE_TYPE, int]:
-        if not fmd.is_directory:
-            return fmd.file_size, 1
+    async def _get_size(self, fmd: FileMetaDataAtDB) -> ByteSize | UNDEFINED_SIZE_TYPE:
+        if not fmd.is_directory or fmd.file_size > 0:
+            # NOTE: the size of a directory is recorded once its upload completes, no need to list it
+            return fmd.file_size
 
-        # in case of directory list files and return size
-        total_size: int = 0
-        total_num_s3_objects = 0
-        async for s3_objects in get_s3_client(self.app).list_objects_paginated(
-            bucket=self.simcore_bucket_name,
-            prefix=(ensure_ends_with(f"{fmd.object_name}", "/") if fmd.is_directory else fmd.object_name),
-        ):
-            total_size += sum(x.size for x in s3_objects)
-            total_num_s3_objects += len(s3_objects)
-
-        return TypeAdapter(ByteSize).validate_python(total_size), total_num_s3_objects
+        # directory without a known size (e.g. upload not completed)
+        s3_metadata = await get_s3_client(self.app).get_directory_metadata(
+            bucket=self.simcore_bucket_name, prefix=ensure_ends_with(f"{fmd.object_name}", "/")
+        )
+        # NOTE: listing a directory always computes its size
+        assert s3_metadata.size is not None  # nosec
+        return s3_metadata.size
 
     async def search_owned_files(
         self,
@@ -1330,20 +1357,45 @@ class SimcoreS3DataManager(BaseDataManager):  # pylint:disable=too-many-public-m
         Raises:
             S3KeyNotFoundError -- if the object key is not found in S3
         """
-        s3_metadata = await self._get_s3_metadata(fmd)
-        if not fmd.is_directory:
-            assert isinstance(s3_metadata, S3MetaData)  # nosec
-            fmd.file_size = TypeAdapter(ByteSize).validate_python(s3_metadata.size)
-            fmd.last_modified = s3_metadata.last_modified
-            fmd.entity_tag = s3_metadata.e_tag
-        elif fmd.is_directory:
-            assert isinstance(s3_metadata, S3DirectoryMetaData)  # nosec
-            fmd.file_size = TypeAdapter(ByteSize).validate_python(s3_metadata.size)
-        fmd.upload_expires_at = None
-        fmd.upload_id = None
-
+        fmd = _update_fmd_from_s3_metadata(fmd, await self._get_s3_metadata(fmd))
         return await FileMetaDataRepository.instance(get_db_engine(self.app)).upsert(fmd=convert_db_to_model(fmd))
 
+    async def _update_database_from_storage_many(
+        self, fmds: list[FileMetaDataAtDB], *, skip_missing: bool = False
+    ) -> list[FileMetaDataAtDB]:
+        """same as `_update_database_from_storage` for multiple entries:
+        S3 is queried concurrently and the entries are updated in the database at once
+
+        Keyword Arguments:
+            skip_missing -- entries not found in S3 are left out of the result instead of raising
+
+        Raises:
+            S3KeyNotFoundError -- if an object key is not found in S3 and `skip_missing` is False
+        """
+
+        async def _get_s3_metadata_or_none(
+            fmd: FileMetaDataAtDB,
+        ) -> S3MetaData | S3DirectoryMetaData | None:
+            try:
+                return await self._get_s3_metadata(fmd)
+            except S3KeyNotFoundError:
+                if skip_missing:
+                    return None
+                raise
+
+        s3_metadata = await limited_gather(
+            *(_get_s3_metadata_or_none(fmd) for fmd in fmds),
+            limit=MAX_CONCURRENT_S3_TASKS,
+        )
+        fmds_to_update = [
+            _update_fmd_from_s3_metadata(fmd, metadata)
+            for fmd, metadata in zip(fmds, s3_metadata, strict=True)
+            if metadata is not None
+        ]
+        return await FileMetaDataRepository.instance(get_db_engine(self.app)).upsert_many(
+            fmds=[FileMetaDataAtDB.model_validate(convert_db_to_model(fmd)) for fmd in fmds_to_update]
+        )
+
     async def _copy_file_datcore_s3(
         self,
         user_id: UserID,
@@ -1472,7 +1524,7 @@ class SimcoreS3DataManager(BaseDataManager):  # pylint:disable=too-many-public-m
         *,
         progress_bar: ProgressBarData,
     ) -> StorageFileID:
-        source_object_keys: set[tuple[UserSelectionStr, StorageFileID]] = set()
+        source_objects: dict[tuple[UserSelectionStr, StorageFileID], S3MetaData] = {}
 
         # ensure all selected items have the same parent
         if not ensure_user_selection_from_same_base_directory(object_keys):
@@ -1509,12 +1561,12 @@ class SimcoreS3DataManager(BaseDataManager):  # pylint:disable=too-many-public-m
                 self.simcore_bucket_name, object_key
             ):
                 for entry in meta_data_files:
-                    source_object_keys.add((object_key, entry.object_key))
+                    source_objects[(object_key, entry.object_key)] = entry
 
         _logger.debug(
             "User selection '%s' includes '%s' files",
             object_keys,
-            len(source_object_keys),
+            len(source_objects),
         )
 
         try:
@@ -1537,7 +1589,7 @@ class SimcoreS3DataManager(BaseDataManager):  # pylint:disable=too-many-public-m
                 get_s3_client(self.app),
                 ProjectRepository.instance(get_db_engine(self.app)),
                 self.simcore_bucket_name,
-                source_object_keys=source_object_keys,
+                source_objects=[(selection, entry) for (selection, _), entry in source_objects.items()],
                 destination_object_keys=destination_object_key,
                 progress_bar=progress_bar,
             )
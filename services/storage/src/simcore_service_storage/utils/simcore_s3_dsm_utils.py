@@ -22,7 +22,7 @@ from pydantic import ByteSize, NonNegativeInt, TypeAdapter
 from servicelib.bytes_iters import ArchiveEntries, get_zip_bytes_iter
 from servicelib.progress_bar import ProgressBarData
 from servicelib.s3_utils import FileLikeBytesIterReader
-from servicelib.utils import ensure_ends_with, limited_gather
+from servicelib.utils import ensure_ends_with
 from sqlalchemy.ext.asyncio import AsyncEngine
 
 from ..constants import EXPORTS_S3_PREFIX, MAX_CONCURRENT_S3_TASKS
@@ -207,47 +207,44 @@ async def create_and_upload_export(
     project_repository: ProjectRepository,
     bucket: S3BucketName,
     *,
-    source_object_keys: set[tuple[UserSelectionStr, StorageFileID]],
+    source_objects: list[tuple[UserSelectionStr, S3MetaData]],
     destination_object_keys: StorageFileID,
     progress_bar: ProgressBarData,
 ) -> None:
     ids_names_map = await project_repository.get_project_id_and_node_id_to_names_map(
-        project_uuids=_get_project_ids(user_selection={x[0] for x in source_object_keys})
+        project_uuids=_get_project_ids(user_selection={x[0] for x in source_objects})
     )
 
-    # Build list of (selection, s3_object) pairs to maintain order
-    source_keys_list = list(source_object_keys)
-
-    # Parallelize HEAD requests for all files (required to get file sizes)
-    byte_streamers = await limited_gather(
-        *[s3_client.get_bytes_streamer_from_object(bucket, s3_object) for (_, s3_object) in source_keys_list],
-        limit=MAX_CONCURRENT_S3_TASKS,
-    )
-
-    # Build archive entries with the parallelized results
-    archive_entries: ArchiveEntries = [
-        (
-            _base_path_parent(
-                _replace_node_id_project_id_in_path(ids_names_map, selection),
-                _replace_node_id_project_id_in_path(ids_names_map, s3_object),
-            ),
-            streamer,
-        )
-        for (selection, s3_object), streamer in zip(source_keys_list, byte_streamers, strict=True)
-    ]
-
-    async with progress_bar:
-        await s3_client.upload_object_from_file_like(
-            bucket,
-            destination_object_keys,
-            FileLikeBytesIterReader(
-                get_zip_bytes_iter(
-                    archive_entries,
-                    progress_bar=progress_bar,
-                    chunk_size=STREAM_READER_CHUNK_SIZE,
-                )
-            ),
-        )
+    # NOTE: the sizes are already known from the listing, so no HEAD request is needed.
+    # The next objects which fit in one chunk are prefetched while the current one is zipped
+    async with s3_client.get_prefetching_bytes_streamers_from_s3_metadata(
+        bucket,
+        [s3_object for _, s3_object in source_objects],
+        prefetch_count=MAX_CONCURRENT_S3_TASKS,
+    ) as byte_streamers:
+        archive_entries: ArchiveEntries = [
+            (
+                _base_path_parent(
+                    _replace_node_id_project_id_in_path(ids_names_map, selection),
+                    _replace_node_id_project_id_in_path(ids_names_map, s3_object.object_key),
+                ),
+                streamer,
+            )
+            for (selection, s3_object), streamer in zip(source_objects, byte_streamers, strict=True)
+        ]
+
+        async with progress_bar:
+            await s3_client.upload_object_from_file_like(
+                bucket,
+                destination_object_keys,
+                FileLikeBytesIterReader(
+                    get_zip_bytes_iter(
+                        archive_entries,
+                        progress_bar=progress_bar,
+                        chunk_size=STREAM_READER_CHUNK_SIZE,
+                    )
+                ),
+            )
 
 
 async def list_child_paths_from_s3(
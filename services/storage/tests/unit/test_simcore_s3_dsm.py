@@ -13,6 +13,7 @@ import pytest
 from aws_library.s3 import S3KeyNotFoundError, SimcoreS3API
 from aws_library.s3._models import S3ObjectKey
 from faker import Faker
+from models_library.api_schemas_storage.storage_schemas import UNDEFINED_SIZE, UNDEFINED_SIZE_TYPE
 from models_library.basic_types import SHA256Str
 from models_library.products import ProductName
 from models_library.progress_bar import ProgressReport
@@ -32,9 +33,10 @@ from simcore_postgres_database.storage_models import (
 from simcore_service_storage.constants import EXPORTS_S3_PREFIX, LinkType
 from simcore_service_storage.exceptions.errors import FileMetaDataNotFoundError
 from simcore_service_storage.models import FileMetaData, S3BucketName
-from simcore_service_storage.modules.db.file_meta_data import FileMetaDataRepository
+from simcore_service_storage.modules.db.file_meta_data import _UPSERT_MANY_BATCH_SIZE, FileMetaDataRepository
 from simcore_service_storage.modules.s3 import get_s3_client
 from simcore_service_storage.simcore_s3_dsm import SimcoreS3DataManager
+from simcore_service_storage.utils.s3_utils import S3TransferDataCB
 from sqlalchemy.ext.asyncio import AsyncEngine
 
 pytest_simcore_core_services_selection = [
@@ -169,6 +171,42 @@ async def test_upload_and_search(
         assert file.file_name in {"file1", "file2"}
 
 
+@pytest.mark.parametrize(
+    "location_id",
+    [SimcoreS3DataManager.get_location_id()],
+    ids=[SimcoreS3DataManager.get_location_name()],
+    indirect=True,
+)
+async def test_complete_file_upload_stores_sha256_checksum(
+    simcore_s3_dsm: SimcoreS3DataManager,
+    user_id: UserID,
+    project_id: ProjectID,
+    node_id: NodeID,
+    create_file_of_size: Callable[[ByteSize, str | None], Path],
+    create_simcore_file_id: Callable[[ProjectID, NodeID, str], SimcoreS3FileID],
+    file_size: ByteSize,
+    sqlalchemy_async_engine: AsyncEngine,
+    cleanup_files_closure: Callable[[SimcoreS3FileID], None],
+    faker: Faker,
+):
+    # NOTE: a checksum computed while uploading is unknown when creating the upload links
+    file = create_file_of_size(file_size, "a_file")
+    file_id = create_simcore_file_id(project_id, node_id, "a_file")
+    cleanup_files_closure(file_id)
+    await simcore_s3_dsm.create_file_upload_links(
+        user_id, file_id, LinkType.PRESIGNED, file_size, sha256_checksum=None, is_directory=False
+    )
+    await get_s3_client(simcore_s3_dsm.app).upload_file(
+        bucket=simcore_s3_dsm.simcore_bucket_name, file=file, object_key=file_id, bytes_transferred_cb=None
+    )
+
+    checksum: SHA256Str = TypeAdapter(SHA256Str).validate_python(faker.sha256())
+    file_meta_data = await simcore_s3_dsm.complete_file_upload(file_id, user_id, [], sha256_checksum=checksum)
+    assert file_meta_data.sha256_checksum == checksum
+    fmd = await FileMetaDataRepository.instance(sqlalchemy_async_engine).get(file_id=file_id)
+    assert fmd.sha256_checksum == checksum
+
+
 async def _search_files_by_pattern(
     simcore_s3_dsm: SimcoreS3DataManager,
     user_id: UserID,
@@ -819,3 +857,167 @@ async def test_search_files_scoped_by_product(
 
     # Verify product isolation: no file from product 2 should appear in product 1 results
     assert file_ids_product_1.isdisjoint(file_ids_product_2), "Files from different products should not overlap"
+
+
+@pytest.mark.parametrize(
+    "location_id",
+    [SimcoreS3DataManager.get_location_id()],
+    ids=[SimcoreS3DataManager.get_location_name()],
+    indirect=True,
+)
+async def test__update_database_from_storage_many(
+    simcore_s3_dsm: SimcoreS3DataManager,
+    sqlalchemy_async_engine: AsyncEngine,
+    upload_file: Callable[..., Awaitable[tuple[Path, SimcoreS3FileID]]],
+    file_size: ByteSize,
+):
+    uploaded_file_ids = [(await upload_file(file_size, f"file_{i}.dat"))[1] for i in range(5)]
+
+    # entries look like pending uploads
+    async with sqlalchemy_async_engine.begin() as conn:
+        await conn.execute(
+            file_meta_data_table.update()
+            .where(file_meta_data_table.c.file_id.in_(uploaded_file_ids))
+            .values(file_size=-1, entity_tag=None)
+        )
+    repo = FileMetaDataRepository.instance(sqlalchemy_async_engine)
+    fmds = [await repo.get(file_id=file_id) for file_id in uploaded_file_ids]
+    assert all(fmd.file_size == -1 for fmd in fmds)
+
+    # an entry which was never uploaded to S3
+    missing_fmd = fmds[0].model_copy(
+        update={"file_id": f"{fmds[0].file_id}.missing", "object_name": f"{fmds[0].object_name}.missing"}
+    )
+    with pytest.raises(S3KeyNotFoundError):
+        await simcore_s3_dsm._update_database_from_storage_many([*fmds, missing_fmd])  # noqa: SLF001
+
+    updated_fmds = await simcore_s3_dsm._update_database_from_storage_many(  # noqa: SLF001
+        [missing_fmd, *fmds], skip_missing=True
+    )
+    assert [fmd.file_id for fmd in updated_fmds] == uploaded_file_ids
+    for fmd in updated_fmds:
+        assert fmd.file_size == file_size
+        assert fmd.entity_tag is not None
+        assert await repo.get(file_id=fmd.file_id) == fmd
+
+
+
+@pytest.mark.parametrize(
+    "location_id",
+    [SimcoreS3DataManager.get_location_id()],
+    ids=[SimcoreS3DataManager.get_location_name()],
+    indirect=True,
+)
+async def test_upsert_many_with_more_entries_than_one_batch(
+    sqlalchemy_async_engine: AsyncEngine,
+    upload_file: Callable[..., Awaitable[tuple[Path, SimcoreS3FileID]]],
+    file_size: ByteSize,
+):
+    _, file_id = await upload_file(file_size, "file.dat")
+    repo = FileMetaDataRepository.instance(sqlalchemy_async_engine)
+    fmd = await repo.get(file_id=file_id)
+
+    # NOTE: in a single statement this many entries would exceed the bind parameters limit of postgres
+    num_entries = 4 * _UPSERT_MANY_BATCH_SIZE + 1
+    fmds = [
+        fmd.model_copy(update={"file_id": f"{file_id}.{i}", "object_name": f"{fmd.object_name}.{i}"})
+        for i in range(num_entries)
+    ]
+    upserted_fmds = await repo.upsert_many(fmds=[fmd, *fmds])
+    assert [f.file_id for f in upserted_fmds] == [fmd.file_id, *(f.file_id for f in fmds)]
+    assert await repo.get(file_id=fmds[-1].file_id) == upserted_fmds[-1]
+
+    # entries already in the database are updated
+    updated_fmds = [f.model_copy(update={"file_size": file_size + 1}) for f in reversed(upserted_fmds)]
+    upserted_fmds = await repo.upsert_many(fmds=updated_fmds)
+    assert [f.file_id for f in upserted_fmds] == [f.file_id for f in updated_fmds]
+    assert all(f.file_size == file_size + 1 for f in upserted_fmds)
+    assert (await repo.get(file_id=fmds[0].file_id)).file_size == file_size + 1
+
+
+async def _set_file_size(
+    sqlalchemy_async_engine: AsyncEngine,
+    file_id: SimcoreS3FileID,
+    file_size: ByteSize | UNDEFINED_SIZE_TYPE,
+) -> None:
+    async with sqlalchemy_async_engine.begin() as conn:
+        await conn.execute(
+            file_meta_data_table.update()
+            .where(file_meta_data_table.c.file_id == file_id)
+            .values(file_size=file_size)
+        )
+
+
+@pytest.mark.parametrize(
+    "location_id",
+    [SimcoreS3DataManager.get_location_id()],
+    ids=[SimcoreS3DataManager.get_location_name()],
+    indirect=True,
+)
+async def test_deep_copy_project_with_directories_with_and_without_recorded_size(
+    user_id: UserID,
+    simcore_s3_dsm: SimcoreS3DataManager,
+    create_project: Callable[..., Awaitable[dict[str, Any]]],
+    create_project_node: Callable[..., Awaitable[tuple[NodeID, Any]]],
+    create_directory_with_files: Callable[
+        [str, ByteSize, int, int, ProjectID, NodeID],
+        Awaitable[tuple[SimcoreS3FileID, tuple[NodeID, dict[SimcoreS3FileID, FileIDDict]]]],
+    ],
+    file_size: ByteSize,
+    sqlalchemy_async_engine: AsyncEngine,
+    mocker: MockerFixture,
+):
+    src_project = await create_project()
+    src_node_id, _ = await create_project_node(ProjectID(src_project["uuid"]))
+    dst_project = await create_project()
+    dst_node_id, _ = await create_project_node(ProjectID(dst_project["uuid"]))
+
+    file_count = 3
+    directory_size = ByteSize(file_count * file_size)
+    sized_directory, _ = await create_directory_with_files(
+        dir_name="with-recorded-size",
+        file_size_in_dir=file_size,
+        subdir_count=1,
+        file_count=file_count,
+        project_id=ProjectID(src_project["uuid"]),
+        node_id=src_node_id,
+    )
+    await _set_file_size(sqlalchemy_async_engine, sized_directory, directory_size)
+    unsized_directory, _ = await create_directory_with_files(
+        dir_name="without-recorded-size",
+        file_size_in_dir=file_size,
+        subdir_count=1,
+        file_count=file_count,
+        project_id=ProjectID(src_project["uuid"]),
+        node_id=src_node_id,
+    )
+    await _set_file_size(sqlalchemy_async_engine, unsized_directory, UNDEFINED_SIZE)
+
+    s3_client = get_s3_client(simcore_s3_dsm.app)
+    spy_get_directory_metadata = mocker.spy(s3_client, "get_directory_metadata")
+    spy_copy_objects_recursively = mocker.spy(s3_client, "copy_objects_recursively")
+    spy_transfer_cb = mocker.patch(
+        "simcore_service_storage.simcore_s3_dsm.S3TransferDataCB", side_effect=S3TransferDataCB
+    )
+
+    async with ProgressBarData(num_steps=1, description="deep copy") as task_progress:
+        await simcore_s3_dsm.deep_copy_project_simcore_s3(
+            user_id, src_project, dst_project, {src_node_id: dst_node_id}, task_progress
+        )
+
+    # only the directory without a recorded size is listed to compute the total
+    spy_get_directory_metadata.assert_called_once()
+    assert spy_get_directory_metadata.call_args.kwargs["prefix"] == f"{unsized_directory}/"
+    spy_transfer_cb.assert_called_once()
+    assert spy_transfer_cb.call_args.args[1] == 2 * directory_size
+
+    # both directories are entirely copied
+    assert spy_copy_objects_recursively.call_count == 2
+    for src_directory in (sized_directory, unsized_directory):
+        dst_directory = src_directory.replace(src_project["uuid"], dst_project["uuid"]).replace(
+            f"{src_node_id}", f"{dst_node_id}"
+        )
+        dst_metadata = await s3_client.get_directory_metadata(
+            bucket=simcore_s3_dsm.simcore_bucket_name, prefix=f"{dst_directory}/"
+        )
+        assert dst_metadata.size == directory_size
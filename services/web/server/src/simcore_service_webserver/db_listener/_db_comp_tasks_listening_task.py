@@ -6,6 +6,7 @@ of a record in comp_task table is changed.
 import asyncio
 import datetime
 import logging
+from collections import defaultdict
 from collections.abc import AsyncIterator
 from typing import Final, NoReturn
 
@@ -17,6 +18,7 @@ from models_library.projects_state import RunningState
 from models_library.users import UserID
 from pydantic.types import PositiveInt
 from servicelib.background_task import periodic_task
+from servicelib.utils import limited_gather
 from simcore_postgres_database.models.comp_tasks import comp_tasks
 from simcore_postgres_database.webserver_models import DB_CHANNEL_NAME, projects
 from sqlalchemy.engine import Row
@@ -31,6 +33,8 @@ from ._models import CompTaskNotificationPayload
 from ._utils import convert_state_from_db
 
 _LISTENING_TASK_BASE_SLEEPING_TIME_S: Final[int] = 1
+_MAX_NOTIFICATIONS_BATCH_SIZE: Final[int] = 1000
+_MAX_CONCURRENT_PROJECTS_UPDATES: Final[int] = 10
 _logger = logging.getLogger(__name__)
 
 
@@ -47,64 +51,108 @@ async def _update_project_state(
     app: web.Application,
     user_id: UserID,
     project_uuid: ProjectID,
-    node_uuid: NodeID,
-    new_state: RunningState,
+    nodes_states: dict[NodeID, RunningState],
 ) -> None:
-    project = await _projects_service.update_project_node_state(
-        app,
-        user_id,
-        project_uuid,
-        node_uuid,
-        new_state,
-        client_session_id=None,  # <-- The trigger for this update is not from the UI (its db listener)
-    )
+    while nodes_states:
+        try:
+            project = await _projects_service.update_project_nodes_state(
+                app,
+                user_id,
+                project_uuid,
+                nodes_states,
+                client_session_id=None,  # <-- The trigger for this update is not from the UI (its db listener)
+            )
+            break
+        except exceptions.NodeNotFoundError as exc:
+            # NOTE: the other nodes of the batch shall still be updated
+            _logger.warning(
+                "Node %s of project %s not found and cannot be updated. Maybe was it deleted?",
+                exc.node_uuid,
+                exc.project_uuid,
+            )
+            nodes_states = {
+                node_id: state for node_id, state in nodes_states.items() if f"{node_id}" != f"{exc.node_uuid}"
+            }
+    else:
+        return
 
-    await _projects_service.notify_project_node_update(app, project, node_uuid)
+    await _projects_service.notify_project_nodes_update(app, project, nodes_states.keys())
 
     await _projects_service.notify_project_state_update(app, project)
 
 
-async def _get_changed_comp_task_row(conn: AsyncConnection, task_id: PositiveInt) -> Row | None:
-    result = await conn.execute(select(comp_tasks).where(comp_tasks.c.task_id == task_id))
-    return result.fetchone()
+async def _get_changed_comp_task_rows(conn: AsyncConnection, task_ids: list[PositiveInt]) -> dict[PositiveInt, Row]:
+    result = await conn.execute(select(comp_tasks).where(comp_tasks.c.task_id.in_(task_ids)))
+    return {row.task_id: row for row in result}
 
 
-async def _handle_db_notification(
-    app: web.Application, payload: CompTaskNotificationPayload, engine: AsyncEngine
+def _coalesce_notifications(
+    payloads: list[CompTaskNotificationPayload],
+) -> dict[ProjectID, dict[NodeID, CompTaskNotificationPayload]]:
+    """groups notifications per project and merges the ones of a same node (changes are read from the DB anyway)"""
+    coalesced: dict[ProjectID, dict[NodeID, CompTaskNotificationPayload]] = defaultdict(dict)
+    for payload in payloads:
+        project_payloads = coalesced[payload.project_id]
+        if previous := project_payloads.get(payload.node_id):
+            payload = payload.model_copy(  # noqa: PLW2901
+                update={"changes": list(dict.fromkeys([*previous.changes, *payload.changes]))}
+            )
+        project_payloads[payload.node_id] = payload
+    return coalesced
+
+
+async def _handle_project_db_notifications(
+    app: web.Application,
+    project_id: ProjectID,
+    payloads: list[CompTaskNotificationPayload],
+    engine: AsyncEngine,
 ) -> None:
+    """Applies the notifications of one project: node outputs are updated per node,
+    while all the node states are updated with a single project update
+    """
+    relevant_payloads = [p for p in payloads if any(f in p.changes for f in ["outputs", "run_hash", "state"])]
+    if not relevant_payloads:
+        return
     try:
         async with engine.connect() as conn:
-            the_project_owner = await _get_project_owner(conn, payload.project_id)
-            changed_row = await _get_changed_comp_task_row(conn, payload.task_id)
-
-        if not changed_row:
-            _logger.warning(
-                "No comp_tasks row found for project_id=%s node_id=%s",
-                payload.project_id,
-                payload.node_id,
-            )
-            return
+            the_project_owner = await _get_project_owner(conn, project_id)
+            changed_rows = await _get_changed_comp_task_rows(conn, [p.task_id for p in relevant_payloads])
+
+        nodes_states: dict[NodeID, RunningState] = {}
+        for payload in relevant_payloads:
+            changed_row = changed_rows.get(payload.task_id)
+            if not changed_row:
+                _logger.warning(
+                    "No comp_tasks row found for project_id=%s node_id=%s",
+                    payload.project_id,
+                    payload.node_id,
+                )
+                continue
+
+            if any(f in payload.changes for f in ["outputs", "run_hash"]):
+                try:
+                    await update_node_outputs(
+                        app,
+                        the_project_owner,
+                        payload.project_id,
+                        payload.node_id,
+                        changed_row.outputs,
+                        changed_row.run_hash,
+                        ui_changed_keys=None,
+                        client_session_id=None,  # <-- The trigger for this update is not from the UI (its db listener)
+                    )
+                except exceptions.NodeNotFoundError as exc:
+                    _logger.warning(
+                        "Node %s of project %s not found and cannot be updated. Maybe was it deleted?",
+                        exc.node_uuid,
+                        exc.project_uuid,
+                    )
 
-        if any(f in payload.changes for f in ["outputs", "run_hash"]):
-            await update_node_outputs(
-                app,
-                the_project_owner,
-                payload.project_id,
-                payload.node_id,
-                changed_row.outputs,
-                changed_row.run_hash,
-                ui_changed_keys=None,
-                client_session_id=None,  # <-- The trigger for this update is not from the UI (its db listener)
-            )
+            if "state" in payload.changes and (changed_row.state is not None):
+                nodes_states[payload.node_id] = convert_state_from_db(changed_row.state)
 
-        if "state" in payload.changes and (changed_row.state is not None):
-            await _update_project_state(
-                app,
-                the_project_owner,
-                payload.project_id,
-                payload.node_id,
-                convert_state_from_db(changed_row.state),
-            )
+        if nodes_states:
+            await _update_project_state(app, the_project_owner, project_id, nodes_states)
 
     except exceptions.ProjectNotFoundError as exc:
         _logger.warning(
@@ -116,12 +164,20 @@ async def _handle_db_notification(
             "Project owner of project %s could not be found, is the project valid?",
             exc.project_uuid,
         )
-    except exceptions.NodeNotFoundError as exc:
-        _logger.warning(
-            "Node %s of project %s not found and cannot be updated. Maybe was it deleted?",
-            exc.node_uuid,
-            exc.project_uuid,
-        )
+
+
+async def _handle_db_notifications(
+    app: web.Application, payloads: list[CompTaskNotificationPayload], engine: AsyncEngine
+) -> None:
+    await limited_gather(
+        *(
+            _handle_project_db_notifications(app, project_id, list(nodes_payloads.values()), engine)
+            for project_id, nodes_payloads in _coalesce_notifications(payloads).items()
+        ),
+        reraise=False,
+        log=_logger,
+        limit=_MAX_CONCURRENT_PROJECTS_UPDATES,
+    )
 
 
 async def _listen(app: web.Application) -> NoReturn:
@@ -159,9 +215,14 @@ async def _listen(app: web.Application) -> NoReturn:
                         raise ConnectionError(msg) from None
                     continue
 
-                payload = CompTaskNotificationPayload.model_validate_json(raw_payload)
-                _logger.debug("received update from database: %s", f"{payload=}")
-                await _handle_db_notification(app, payload, engine)
+                # NOTE: drain what is already queued, so that bursts are processed as one batch
+                raw_payloads = [raw_payload]
+                while not notifications.empty() and len(raw_payloads) < _MAX_NOTIFICATIONS_BATCH_SIZE:
+                    raw_payloads.append(notifications.get_nowait())
+
+                payloads = [CompTaskNotificationPayload.model_validate_json(p) for p in raw_payloads]
+                _logger.debug("received %d updates from database: %s", len(payloads), f"{payloads=}")
+                await _handle_db_notifications(app, payloads, engine)
         finally:
             if not asyncpg_conn.is_closed():
                 await asyncpg_conn.remove_listener(DB_CHANNEL_NAME, _on_notification)  # type: ignore[arg-type]
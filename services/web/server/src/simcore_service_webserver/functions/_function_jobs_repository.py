@@ -1,6 +1,5 @@
 # pylint: disable=too-many-arguments
 
-import json
 import logging
 
 import sqlalchemy
@@ -38,8 +37,9 @@ from simcore_postgres_database.models.funcapi_function_job_collections_to_functi
 )
 from simcore_postgres_database.models.funcapi_function_jobs_access_rights_table import function_jobs_access_rights_table
 from simcore_postgres_database.models.funcapi_function_jobs_table import function_jobs_table
+from simcore_postgres_database.utils_funcapi_function_jobs import compute_function_job_inputs_hash
 from simcore_postgres_database.utils_repos import pass_or_acquire_connection, transaction_context
-from sqlalchemy import Text, cast, func
+from sqlalchemy import func
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from ..db.plugin import get_asyncpg_engine
@@ -82,6 +82,7 @@ async def create_function_jobs(
             {
                 "function_uuid": job.function_uuid,
                 "inputs": job.inputs,
+                "inputs_hash": compute_function_job_inputs_hash(job.inputs),
                 "outputs": job.outputs,
                 "function_class": job.function_class,
                 "class_specific_data": job.class_specific_data,
@@ -156,6 +157,11 @@ async def patch_function_jobs(
             )
             update_values = {
                 "inputs": patch_request.patch.inputs,
+                "inputs_hash": (
+                    compute_function_job_inputs_hash(patch_request.patch.inputs)
+                    if patch_request.patch.inputs is not None
+                    else None
+                ),
                 "outputs": patch_request.patch.outputs,
                 "class_specific_data": class_specific_data,
                 "title": patch_request.patch.title,
@@ -313,13 +319,13 @@ async def find_cached_function_jobs(
             )
         )
 
-        # Create list of JSON dumped inputs for comparison
-        json_inputs = [json.dumps(inp) for inp in inputs]
+        # NOTE: inputs are matched by their canonical hash (indexed with function_uuid)
+        inputs_hashes = [compute_function_job_inputs_hash(inp) for inp in inputs]
 
         # Build filter conditions
         filter_conditions = sqlalchemy.and_(
             function_jobs_table.c.function_uuid == function_id,
-            cast(function_jobs_table.c.inputs, Text).in_(json_inputs),
+            function_jobs_table.c.inputs_hash.in_(set(inputs_hashes)),
             function_jobs_table.c.uuid.in_(access_subquery),
             (
                 function_jobs_table.c.status.in_([status.status for status in cached_job_statuses])
@@ -330,24 +336,20 @@ async def find_cached_function_jobs(
 
         # Use DISTINCT ON to get only one job per input (the most recent one)
         results = await conn.execute(
-            function_jobs_table.select()
-            .distinct(cast(function_jobs_table.c.inputs, Text))
+            sqlalchemy.select(*_FUNCTION_JOBS_TABLE_COLS, function_jobs_table.c.inputs_hash)
+            .distinct(function_jobs_table.c.inputs_hash)
             .where(filter_conditions)
             .order_by(
-                cast(function_jobs_table.c.inputs, Text),
+                function_jobs_table.c.inputs_hash,
                 function_jobs_table.c.created.desc(),
             )
         )
 
-        # Create a mapping from JSON inputs to jobs
-        def _ensure_str(x: str | dict) -> str:
-            return x if isinstance(x, str) else json.dumps(x)
-
-        jobs_by_input: dict[str, RegisteredFunctionJobDB] = {
-            _ensure_str(row.inputs): RegisteredFunctionJobDB.model_validate(row) for row in results
+        jobs_by_inputs_hash: dict[str, RegisteredFunctionJobDB] = {
+            row.inputs_hash: RegisteredFunctionJobDB.model_validate(row) for row in results
         }
 
-        return [jobs_by_input.get(input_) for input_ in json_inputs]
+        return [jobs_by_inputs_hash.get(inputs_hash) for inputs_hash in inputs_hashes]
 
 
 async def get_function_job_status(
@@ -1,4 +1,5 @@
 import asyncio
+import datetime
 import logging
 from collections import defaultdict
 from collections.abc import AsyncIterator, Generator, MutableMapping
@@ -7,7 +8,9 @@ from typing import Annotated, Final
 from aiohttp import web
 from annotated_types import doc
 from models_library.groups import GroupID
+from models_library.progress_bar import ProgressReport
 from models_library.projects import ProjectID
+from models_library.projects_nodes_io import NodeID
 from models_library.projects_state import RUNNING_STATE_COMPLETED_STATES
 from models_library.rabbitmq_messages import (
     ComputationalPipelineStatusMessage,
@@ -22,6 +25,7 @@ from models_library.rabbitmq_messages import (
 )
 from models_library.socketio import SocketMessageDict
 from pydantic import TypeAdapter
+from servicelib.background_task import periodic_task
 from servicelib.logging_utils import log_catch, log_context
 from servicelib.rabbitmq import RabbitMQClient
 from servicelib.utils import limited_gather, logged_gather
@@ -51,13 +55,52 @@ WALLET_SUBSCRIPTIONS_COUNT_APPKEY: Final = web.AppKey(
     defaultdict,  # wallet_id -> subscriber count
 )
 WALLET_SUBSCRIPTION_LOCK_APPKEY: Final = web.AppKey("WALLET_SUBSCRIPTION_LOCK", asyncio.Lock)
+_COMPUTATION_PROGRESS_BUFFER_APPKEY: Final = web.AppKey(
+    "COMPUTATION_PROGRESS_BUFFER",
+    dict,  # (project_id, node_id) -> latest progress message
+)
 
+_COMPUTATION_PROGRESS_FLUSH_INTERVAL: Final[datetime.timedelta] = datetime.timedelta(seconds=1)
+_COMPUTATION_PROGRESS_NOTIFICATIONS_LIMIT: Final[int] = 10
 
-async def _notify_comp_node_progress(app: web.Application, message: ProgressRabbitMessageNode) -> None:
-    project = await _projects_service.get_project_for_user(
-        app, f"{message.project_id}", message.user_id, include_state=True
+
+async def _notify_comp_nodes_progress(
+    app: web.Application, messages: list[ProgressRabbitMessageNode]
+) -> None:
+    nodes_progress_by_project: dict[ProjectID, dict[NodeID, ProgressReport]] = defaultdict(dict)
+    for message in messages:
+        nodes_progress_by_project[message.project_id][message.node_id] = message.report
+    await limited_gather(
+        *(
+            _projects_service.notify_project_nodes_progress(app, project_id, nodes_progress)
+            for project_id, nodes_progress in nodes_progress_by_project.items()
+        ),
+        reraise=False,
+        log=_logger,
+        limit=_COMPUTATION_PROGRESS_NOTIFICATIONS_LIMIT,
     )
-    await _projects_service.notify_project_node_update(app, project, message.node_id)
+
+
+async def _flush_computation_progress(app: web.Application) -> None:
+    """Notifies the latest computation progress of each node received since the last flush
+
+    NOTE: pipelines may report progress at high frequency; coalescing them bounds the rate of
+    notifications per node to one per flush interval
+    """
+    progress_buffer = app[_COMPUTATION_PROGRESS_BUFFER_APPKEY]
+    if not progress_buffer:
+        return
+    messages = list(progress_buffer.values())
+    progress_buffer.clear()
+    await _notify_comp_nodes_progress(app, messages)
+
+
+async def _notify_comp_node_progress(app: web.Application, message: ProgressRabbitMessageNode) -> None:
+    if _COMPUTATION_PROGRESS_BUFFER_APPKEY in app:
+        # only the latest progress of a node is kept until next flush
+        app[_COMPUTATION_PROGRESS_BUFFER_APPKEY][(message.project_id, message.node_id)] = message
+        return
+    await _notify_comp_nodes_progress(app, [message])
 
 
 async def _progress_message_parser(app: web.Application, data: bytes) -> bool:
@@ -259,8 +302,17 @@ async def on_cleanup_ctx_rabbitmq_consumers(
     app[WALLET_SUBSCRIPTION_LOCK_APPKEY] = asyncio.Lock(
         # Ensures exclusive access to wallet subscription changes
     )
+    app[_COMPUTATION_PROGRESS_BUFFER_APPKEY] = {}
 
-    yield
+    async with periodic_task(
+        _flush_computation_progress,
+        interval=_COMPUTATION_PROGRESS_FLUSH_INTERVAL,
+        task_name="computation progress notifications flush",
+        app=app,
+    ):
+        yield
 
     # cleanup
     await _unsubscribe_from_rabbitmq(app)
+    with log_catch(_logger, reraise=False):
+        await _flush_computation_progress(app)
@@ -146,6 +146,7 @@ async def list_projects(request: web.Request):
         offset=query_params.offset,
         limit=query_params.limit,
         order_by=OrderBy.model_construct(**query_params.order_by.model_dump()),
+        view=query_params.view,
     )
 
     projects = await _rest_utils.aggregate_data_to_projects_from_request(
@@ -183,6 +184,7 @@ async def list_projects_full_search(request: web.Request):
         offset=query_params.offset,
         limit=query_params.limit,
         order_by=OrderBy.model_construct(**query_params.order_by.model_dump()),
+        view=query_params.view,
     )
 
     projects = await _rest_utils.aggregate_data_to_projects_from_request(
@@ -33,7 +33,7 @@ from servicelib.common_headers import (
 )
 
 from ..exceptions import WrongTagIdsInQueryError
-from ..models import ProjectTypeAPI
+from ..models import ProjectListView, ProjectTypeAPI
 
 
 class ProjectCreateHeaders(BaseModel):
@@ -158,6 +158,13 @@ class ProjectsListExtraQueryParams(RequestParameters):
             description="Filter projects in specific workspace. Default filtering is a private workspace.",
         ),
     ] = None
+    view: Annotated[
+        ProjectListView,
+        Field(
+            description="Fields to return: `basic` omits the workbench (and other heavy fields) "
+            "and returns `nodesCount` instead, e.g. to render the project cards",
+        ),
+    ] = ProjectListView.full
 
     @field_validator("search", mode="before")
     @classmethod
@@ -219,6 +226,13 @@ class ProjectSearchExtraQueryParams(
             examples=["1,3"],
         ),
     ] = None
+    view: Annotated[
+        ProjectListView,
+        Field(
+            description="Fields to return: `basic` omits the workbench (and other heavy fields) "
+            "and returns `nodesCount` instead, e.g. to render the project cards",
+        ),
+    ] = ProjectListView.full
 
     _empty_is_none = field_validator("text", mode="before")(empty_str_to_none_pre_validator)
 
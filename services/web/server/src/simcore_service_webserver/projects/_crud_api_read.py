@@ -28,7 +28,7 @@ from ._access_rights_repository import batch_get_project_access_rights
 from ._projects_repository import batch_get_trashed_by_primary_gid
 from ._projects_repository_legacy import ProjectDBAPI
 from ._projects_repository_legacy_utils import convert_to_schema_names
-from .models import ProjectDict, ProjectTypeAPI
+from .models import ProjectDict, ProjectListView, ProjectTypeAPI
 
 
 class _GuestFilters(NamedTuple):
@@ -142,6 +142,8 @@ async def list_projects(  # pylint: disable=too-many-arguments  # noqa: PLR0913
     limit: int,
     # ordering
     order_by: OrderBy,
+    # projection
+    view: ProjectListView = ProjectListView.full,
 ) -> tuple[list[ProjectDict], TotalCount]:
     db = ProjectDBAPI.get_from_app_context(app)
 
@@ -197,6 +199,8 @@ async def list_projects(  # pylint: disable=too-many-arguments  # noqa: PLR0913
         limit=limit,
         # order
         order_by=order_by,
+        # projection
+        view=view,
     )
 
     api_projects = await _legacy_convert_db_projects_to_api_projects(app, db, db_projects)
@@ -227,6 +231,8 @@ async def list_projects_full_depth(  # pylint: disable=too-many-arguments  # noq
     # search
     search_by_multi_columns: str | None,
     search_by_project_name: str | None,
+    # projection
+    view: ProjectListView = ProjectListView.full,
 ) -> tuple[list[ProjectDict], int]:
     db = ProjectDBAPI.get_from_app_context(app)
 
@@ -248,6 +254,7 @@ async def list_projects_full_depth(  # pylint: disable=too-many-arguments  # noq
         offset=offset,
         limit=limit,
         order_by=order_by,
+        view=view,
     )
 
     api_projects = await _legacy_convert_db_projects_to_api_projects(app, db, db_projects)
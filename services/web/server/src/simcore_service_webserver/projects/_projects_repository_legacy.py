@@ -59,7 +59,7 @@ from simcore_postgres_database.webserver_models import (
     users,
 )
 from sqlalchemy import func, sql
-from sqlalchemy.dialects.postgresql import BOOLEAN, INTEGER
+from sqlalchemy.dialects.postgresql import BOOLEAN, INTEGER, JSONB
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.engine import Result, Row
 from sqlalchemy.exc import IntegrityError
@@ -79,6 +79,7 @@ from ._projects_repository_legacy_utils import (
     ProjectAccessRights,
     convert_to_db_names,
     convert_to_schema_names,
+    get_projects_nodes_counts,
     get_projects_workbenches,
 )
 from .exceptions import (
@@ -90,6 +91,7 @@ from .exceptions import (
 from .models import (
     ProjectDBGet,
     ProjectDict,
+    ProjectListView,
     UserProjectAccessRightsDB,
     UserSpecificProjectDataDBGet,
 )
@@ -98,6 +100,24 @@ _logger = logging.getLogger(__name__)
 
 ANY_USER = ANY_USER_ID_SENTINEL
 
+# NOTE: keys of projects.ui that grow with the project (e.g. per-node) and are not needed to list projects
+_UI_HEAVY_KEYS: Final[tuple[str, ...]] = ("workbench", "slideshow", "annotations")
+
+
+def _get_project_list_columns(view: ProjectListView) -> list[ColumnElement]:
+    if view == ProjectListView.full:
+        return list(PROJECT_DB_COLS)
+
+    # the heavy columns are trimmed in the DB so that they are neither transferred nor deserialized
+    basic_ui: ColumnElement = projects.c.ui
+    for key in _UI_HEAVY_KEYS:
+        basic_ui = basic_ui.op("-", return_type=JSONB)(sa.literal(key, sa.Text))
+    basic_columns: dict[str, ColumnElement] = {
+        "ui": basic_ui.label("ui"),
+        "dev": sa.null().label("dev"),
+    }
+    return [basic_columns.get(column.name, column) for column in PROJECT_DB_COLS]
+
 DEFAULT_ORDER_BY = OrderBy(field=IDStr("last_change_date"), direction=OrderDirection.DESC)
 
 
@@ -342,6 +362,7 @@ class ProjectDBAPI(BaseProjectDB):
     @staticmethod
     def _create_private_workspace_query(
         *,
+        project_columns: list[ColumnElement],
         product_name: ProductName,
         user_id: UserID,
         workspace_query: WorkspaceQuery,
@@ -392,7 +413,7 @@ class ProjectDBAPI(BaseProjectDB):
                 )
                 private_workspace_query = (
                     sa.select(
-                        *PROJECT_DB_COLS,
+                        *project_columns,
                         sa.literal(None).label("folder_id"),
                     )
                     .select_from(projects)
@@ -408,7 +429,7 @@ class ProjectDBAPI(BaseProjectDB):
                 # to this exact folder survive — simple equi-join, no filter needed.
                 private_workspace_query = (
                     sa.select(
-                        *PROJECT_DB_COLS,
+                        *project_columns,
                         projects_to_folders.c.folder_id,
                     )
                     .select_from(
@@ -433,7 +454,7 @@ class ProjectDBAPI(BaseProjectDB):
                 # the folder_id column when present; no rows are filtered out.
                 private_workspace_query = (
                     sa.select(
-                        *PROJECT_DB_COLS,
+                        *project_columns,
                         projects_to_folders.c.folder_id,
                     )
                     .select_from(
@@ -463,6 +484,7 @@ class ProjectDBAPI(BaseProjectDB):
     @staticmethod
     def _create_shared_workspace_query(
         *,
+        project_columns: list[ColumnElement],
         product_name: ProductName,
         workspace_query: WorkspaceQuery,
         folder_query: FolderQuery,
@@ -498,7 +520,7 @@ class ProjectDBAPI(BaseProjectDB):
                 )
                 shared_workspace_query = (
                     sa.select(
-                        *PROJECT_DB_COLS,
+                        *project_columns,
                         sa.literal(None).label("folder_id"),
                     )
                     .select_from(projects)
@@ -509,7 +531,7 @@ class ProjectDBAPI(BaseProjectDB):
                 # to this exact folder survive — simple equi-join, no filter needed.
                 shared_workspace_query = (
                     sa.select(
-                        *PROJECT_DB_COLS,
+                        *project_columns,
                         projects_to_folders.c.folder_id,
                     )
                     .select_from(
@@ -530,7 +552,7 @@ class ProjectDBAPI(BaseProjectDB):
                 # the folder_id column when present; no rows are filtered out.
                 shared_workspace_query = (
                     sa.select(
-                        *PROJECT_DB_COLS,
+                        *project_columns,
                         projects_to_folders.c.folder_id,
                     )
                     .select_from(
@@ -650,6 +672,8 @@ class ProjectDBAPI(BaseProjectDB):
         limit: int | None = None,
         # order
         order_by: OrderBy = DEFAULT_ORDER_BY,
+        # projection
+        view: ProjectListView = ProjectListView.full,
     ) -> tuple[list[dict[str, Any]], int]:
         async with self.engine.connect() as conn:
             user_groups_rows: list[Row] = await self._list_user_groups(conn, user_id)
@@ -659,7 +683,10 @@ class ProjectDBAPI(BaseProjectDB):
             # Private workspace query
             ###
 
+            project_columns = _get_project_list_columns(view)
+
             private_workspace_query = self._create_private_workspace_query(
+                project_columns=project_columns,
                 product_name=product_name,
                 user_id=user_id,
                 workspace_query=workspace_query,
@@ -672,6 +699,7 @@ class ProjectDBAPI(BaseProjectDB):
             # Shared workspace query
             ###
             shared_workspace_query = self._create_shared_workspace_query(
+                project_columns=project_columns,
                 product_name=product_name,
                 workspace_query=workspace_query,
                 folder_query=folder_query,
@@ -731,9 +759,19 @@ class ProjectDBAPI(BaseProjectDB):
             result = await conn.execute(combined_query.offset(offset).limit(limit))
             rows = list(result.mappings())
 
-            # Batch-fetch all workbenches in a single query
             project_uuids = [row["uuid"] for row in rows]
-            workbenches = await get_projects_workbenches(conn, project_uuids)
+            if view == ProjectListView.full:
+                # Batch-fetch all workbenches in a single query
+                extra_columns = {
+                    project_uuid: {"workbench": workbench}
+                    for project_uuid, workbench in (await get_projects_workbenches(conn, project_uuids)).items()
+                }
+            else:
+                # the nodes are only counted (in the DB), the workbenches are not loaded
+                extra_columns = {
+                    project_uuid: {"nodes_count": count}
+                    for project_uuid, count in (await get_projects_nodes_counts(conn, project_uuids)).items()
+                }
 
             for row in rows:
                 # NOTE: Historically, projects were returned as a dictionary. I have created a model that
@@ -741,9 +779,7 @@ class ProjectDBAPI(BaseProjectDB):
                 # Therefore, if we use this model, it will return those default values, which is not backward-compatible
                 # with the frontend. The frontend would need to check and adapt how it handles default values in
                 # Workbench nodes, which are currently not returned if not set in the DB.
-                prj_dict = dict(row.items()) | {
-                    "workbench": workbenches.get(row["uuid"], {}),
-                }
+                prj_dict = dict(row.items()) | extra_columns[row["uuid"]]
                 ProjectListAtDB.model_validate(prj_dict)
                 prjs_output.append(prj_dict)
 
@@ -301,3 +301,24 @@ async def get_projects_workbenches(
         workbenches[project_uuid][node_id] = node_data
 
     return workbenches
+
+
+async def get_projects_nodes_counts(
+    connection: AsyncConnection,
+    project_uuids: list[str],
+) -> dict[str, int]:
+    """Batch-count the nodes of multiple projects in a single query (without loading them)."""
+    if not project_uuids:
+        return {}
+
+    stmt = (
+        sa.select(projects_nodes_table.c.project_uuid, sa.func.count())
+        .where(projects_nodes_table.c.project_uuid.in_(project_uuids))
+        .group_by(projects_nodes_table.c.project_uuid)
+    )
+    result = await connection.execute(stmt)
+
+    nodes_counts: dict[str, int] = dict.fromkeys(project_uuids, 0)
+    for project_uuid, count in result.all():
+        nodes_counts[project_uuid] = count
+    return nodes_counts
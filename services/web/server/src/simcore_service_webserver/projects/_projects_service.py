@@ -13,7 +13,7 @@ import contextlib
 import datetime
 import logging
 from collections import defaultdict
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from contextlib import suppress
 from decimal import Decimal
 from typing import Any, Final, cast
@@ -56,8 +56,10 @@ from models_library.projects_nodes import (
     NodeState,
     PartialNode,
 )
+from models_library.progress_bar import ProgressReport
 from models_library.projects_nodes_io import NodeID, NodeIDStr, PortLink
 from models_library.projects_state import (
+    ProjectLocked,
     ProjectRunningState,
     ProjectShareState,
     ProjectState,
@@ -107,6 +109,7 @@ from servicelib.rabbitmq.rpc_interfaces.dynamic_scheduler.errors import (
 from servicelib.redis import (
     exclusive,
     get_project_locked_state,
+    get_projects_locked_states,
     is_project_locked,
     with_project_locked,
 )
@@ -117,11 +120,13 @@ from simcore_postgres_database.utils_projects_nodes import (
     ProjectNodeCreate,
     ProjectNodesNodeNotFoundError,
 )
+from simcore_postgres_database.utils_repos import transaction_context
 from simcore_postgres_database.webserver_models import ProjectType
 
 from ..application_settings import get_application_settings
 from ..catalog import catalog_service
 from ..constants import APP_FIRE_AND_FORGET_TASKS_KEY
+from ..db.plugin import get_asyncpg_engine
 from ..director_v2 import director_v2_service
 from ..director_v2.exceptions import DirectorV2PipelineStatesRetrievalError
 from ..dynamic_scheduler import api as dynamic_scheduler_service
@@ -1296,9 +1301,29 @@ async def update_project_node_state(
     new_state: str,
     client_session_id: ClientSessionID | None,
 ) -> dict:
+    return await update_project_nodes_state(
+        app,
+        user_id,
+        project_id,
+        {node_id: new_state},
+        client_session_id=client_session_id,
+    )
+
+
+async def update_project_nodes_state(
+    app: web.Application,
+    user_id: UserID,
+    project_id: ProjectID,
+    nodes_states: Mapping[NodeID, str],
+    client_session_id: ClientSessionID | None,
+) -> dict:
+    """Updates the current state of several nodes of a project at once
+
+    NOTE: permissions are checked, and the project document created and returned, only once
+    """
     _logger.debug(
-        "updating node %s current state in project %s for user %s",
-        node_id,
+        "updating nodes %s current state in project %s for user %s",
+        list(nodes_states),
         project_id,
         user_id,
     )
@@ -1312,12 +1337,15 @@ async def update_project_node_state(
         permission="write",  # NOTE: MD: before only read was sufficient, double check this
     )
 
-    await _projects_nodes_repository.update(
-        app,
-        project_id=project_id,
-        node_id=node_id,
-        partial_node=PartialNode.model_construct(state=NodeState(current_status=RunningState(new_state))),
-    )
+    async with transaction_context(get_asyncpg_engine(app)) as conn:
+        for node_id, new_state in nodes_states.items():
+            await _projects_nodes_repository.update(
+                app,
+                conn,
+                project_id=project_id,
+                node_id=node_id,
+                partial_node=PartialNode.model_construct(state=NodeState(current_status=RunningState(new_state))),
+            )
 
     await create_project_document_and_notify(
         app,
@@ -1904,11 +1932,60 @@ async def _get_project_share_state(
     5. If the same user is using the project with NO socket id (meaning there is no current tab active)
         then the project is Unlocked and OPENED. which means the user can open it again.
     """
-    app_settings = get_application_settings(app)
     prj_locked_state = await get_project_locked_state(get_redis_lock_manager_client_sdk(app), project_uuid)
     with managed_resource(user_id, None, app) as rt:
         user_sessions_with_project = await rt.find_users_of_resource(app, PROJECT_ID_KEY, project_uuid)
 
+    return await _compute_project_share_state(
+        app,
+        user_id=user_id,
+        project_uuid=project_uuid,
+        prj_locked_state=prj_locked_state,
+        user_sessions_with_project=user_sessions_with_project,
+    )
+
+
+async def _get_projects_share_states(
+    user_id: UserID,
+    project_uuids: list[str],
+    app: web.Application,
+) -> list[ProjectShareState]:
+    """bulk version of _get_project_share_state: the locks and the users of all the projects
+    are read from Redis in a constant number of round-trips (i.e. independent of the number of projects)
+    """
+    if not project_uuids:
+        return []
+    with managed_resource(user_id, None, app) as rt:
+        prj_locked_states, user_sessions_by_project = await asyncio.gather(
+            get_projects_locked_states(get_redis_lock_manager_client_sdk(app), project_uuids),
+            rt.find_users_of_resources(app, PROJECT_ID_KEY, project_uuids),
+        )
+
+    return await limited_gather(
+        *[
+            _compute_project_share_state(
+                app,
+                user_id=user_id,
+                project_uuid=project_uuid,
+                prj_locked_state=prj_locked_state,
+                user_sessions_with_project=user_sessions_by_project[project_uuid],
+            )
+            for project_uuid, prj_locked_state in zip(project_uuids, prj_locked_states, strict=True)
+        ],
+        limit=20,
+    )
+
+
+async def _compute_project_share_state(
+    app: web.Application,
+    *,
+    user_id: UserID,
+    project_uuid: str,
+    prj_locked_state: ProjectLocked | None,
+    user_sessions_with_project: list[UserSession],
+) -> ProjectShareState:
+    app_settings = get_application_settings(app)
+
     if prj_locked_state:
         _logger.debug(
             "project [%s] is currently locked: %s",
@@ -2031,10 +2108,7 @@ async def add_projects_states_for_user(
             app,
             [ProjectID(project["uuid"]) for project in projects],
         ),
-        limited_gather(
-            *[_get_project_share_state(user_id, project["uuid"], app) for project in projects],
-            limit=20,
-        ),
+        _get_projects_share_states(user_id, [project["uuid"] for project in projects], app),
     )
     state_by_project = {item.project_uuid: item.state for item in latest_states} if latest_states is not None else None
 
@@ -2439,6 +2513,32 @@ async def notify_project_node_update(
     await notify_project_nodes_update(app, project, (node_id,))
 
 
+async def notify_project_nodes_progress(
+    app: web.Application,
+    project_id: ProjectID,
+    nodes_progress: Mapping[NodeID, ProgressReport],
+) -> None:
+    """Lightweight variant of `notify_project_nodes_update` that only sends the nodes progress
+
+    NOTE: does not need the project document (nor its state), only the project groups to notify
+    """
+    if await is_project_hidden(app, project_id):
+        return
+
+    rooms_to_notify = await _list_project_group_rooms_to_notify(app, project_id)
+    for node_id, progress_report in nodes_progress.items():
+        message = SocketMessageDict(
+            event_type=SOCKET_IO_NODE_UPDATED_EVENT,
+            data={
+                "project_id": f"{project_id}",
+                "node_id": f"{node_id}",
+                # NOTE: same as the project node "progress" field (i.e. a percentage)
+                "data": {"progress": round(progress_report.percent_value * 100.0)},
+            },
+        )
+        await _send_message_to_rooms(app, rooms_to_notify, message)
+
+
 async def retrieve_and_notify_project_locked_state(
     user_id: UserID,
     project_uuid: str,
@@ -25,7 +25,7 @@ from .exceptions import (
     ProjectRunningConflictError,
     ProjectsBatchDeleteError,
 )
-from .models import ProjectDict, ProjectPatchInternalExtended, ProjectTypeAPI
+from .models import ProjectDict, ProjectListView, ProjectPatchInternalExtended, ProjectTypeAPI
 
 _logger = logging.getLogger(__name__)
 
@@ -215,6 +215,7 @@ async def list_explicitly_trashed_projects(
             order_by=OrderBy(field=IDStr("trashed"), direction=OrderDirection.ASC),
             search_by_multi_columns=None,
             search_by_project_name=None,
+            view=ProjectListView.basic,  # only the trash attributes are needed
         )
 
         # NOTE: Applying POST-FILTERING because we do not want to modify the interface of
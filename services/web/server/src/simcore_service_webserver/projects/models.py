@@ -35,6 +35,12 @@ class ProjectTypeAPI(str, Enum):
         }[api_type]
 
 
+class ProjectListView(str, Enum):
+    # SEE https://google.aip.dev/157
+    full = "full"  # all the fields, including the workbench
+    basic = "basic"  # fields to render the project cards (no workbench but its number of nodes)
+
+
 class ProjectDBGet(BaseModel):
     # NOTE: model intended to read one-to-one columns of the `projects` table
     id: int
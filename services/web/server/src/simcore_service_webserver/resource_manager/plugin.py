@@ -13,11 +13,15 @@ from aiohttp import web
 
 from ..application_setup import ModuleCategory, app_setup_func
 from ..redis import setup_redis
-from .registry import CLIENT_SOCKET_REGISTRY_APPKEY, RedisResourceRegistry
+from .registry import CLIENT_SOCKET_REGISTRY_APPKEY, RedisResourceRegistry, get_registry
 
 _logger = logging.getLogger(__name__)
 
 
+async def _rebuild_registry_indexes_on_startup(app: web.Application) -> None:
+    await get_registry(app).rebuild_indexes()
+
+
 @app_setup_func(
     "simcore_service_webserver.resource_manager",
     ModuleCategory.SYSTEM,
@@ -29,5 +33,6 @@ def setup_resource_manager(app: web.Application) -> bool:
 
     setup_redis(app)
     app[CLIENT_SOCKET_REGISTRY_APPKEY] = RedisResourceRegistry(app)
+    app.on_startup.append(_rebuild_registry_indexes_on_startup)
 
     return True
@@ -10,10 +10,20 @@ A same key can have a lot of fields provided they have a different name.
 A key can be set as "alive". This creates a secondary key (e.g. "user_id=a_user_id:some_other_id=123:alive").
 This key can have a timeout value. When the key times out then the key disappears from Redis automatically.
 
+To avoid SCANning the whole keyspace, the registry also maintains secondary indexes that are kept in sync
+atomically (via Lua scripts/transactions) on every write. Every key touched by the scripts is declared in KEYS,
+entries left behind in the indexes (e.g. by sessions which were removed from outside the registry) are pruned
+when they are read and on rebuild:
+- "resource_index:{resource_name}={resource_value}": set of sessions owning that resource
+- "user_sessions_index:user_id={user_id}": set of sessions of a user that have resources
+- "sessions_index": set of all sessions that have resources
+- "alive_index": sorted set of sessions that were set alive (scored by their expiration timestamp)
+
 
 """
 
 import logging
+import time
 from typing import Final
 
 import redis.asyncio as aioredis
@@ -27,11 +37,99 @@ from .models import (
     AliveSessions,
     DeadSessions,
     ResourcesDict,
+    RedisHashKey,
     UserSession,
 )
 
 _logger = logging.getLogger(__name__)
 
+_RESOURCE_INDEX_PREFIX: Final[str] = "resource_index:"
+_USER_SESSIONS_INDEX_PREFIX: Final[str] = "user_sessions_index:"
+_SESSIONS_INDEX: Final[str] = "sessions_index"
+_ALIVE_INDEX: Final[str] = "alive_index"
+
+# NOTE: the resource index keys depend on the (old) values stored in the hash, they are read
+# beforehand and every key is passed in KEYS. The scripts check that the values did not change
+# meanwhile, otherwise they do nothing and return 0 (the caller reads again and retries)
+_SET_RESOURCE_SCRIPT: Final[str] = """
+local old_value = redis.call('HGET', KEYS[1], ARGV[2])
+if (old_value ~= false) ~= (ARGV[5] == '1') or (old_value and old_value ~= ARGV[4]) then
+    return 0
+end
+if KEYS[5] then
+    redis.call('SREM', KEYS[5], ARGV[1])
+end
+redis.call('HSET', KEYS[1], ARGV[2], ARGV[3])
+redis.call('SADD', KEYS[4], ARGV[1])
+redis.call('SADD', KEYS[2], ARGV[1])
+redis.call('SADD', KEYS[3], ARGV[1])
+return 1
+"""
+
+_REMOVE_RESOURCE_SCRIPT: Final[str] = """
+local old_value = redis.call('HGET', KEYS[1], ARGV[2])
+if (old_value ~= false) ~= (ARGV[4] == '1') or (old_value and old_value ~= ARGV[3]) then
+    return 0
+end
+if old_value then
+    redis.call('SREM', KEYS[4], ARGV[1])
+    redis.call('HDEL', KEYS[1], ARGV[2])
+end
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    redis.call('SREM', KEYS[2], ARGV[1])
+    redis.call('SREM', KEYS[3], ARGV[1])
+end
+return 1
+"""
+
+_REMOVE_KEY_SCRIPT: Final[str] = """
+if redis.call('HLEN', KEYS[1]) ~= (#ARGV - 1) / 2 then
+    return 0
+end
+for i = 2, #ARGV, 2 do
+    if redis.call('HGET', KEYS[1], ARGV[i]) ~= ARGV[i + 1] then
+        return 0
+    end
+end
+for i = 6, #KEYS do
+    redis.call('SREM', KEYS[i], ARGV[1])
+end
+redis.call('DEL', KEYS[1], KEYS[2])
+redis.call('SREM', KEYS[3], ARGV[1])
+redis.call('SREM', KEYS[4], ARGV[1])
+redis.call('ZREM', KEYS[5], ARGV[1])
+return 1
+"""
+
+# NOTE: removes the sessions which no longer own the resource (e.g. their hash disappeared)
+_PRUNE_RESOURCE_INDEX_SCRIPT: Final[str] = """
+for i = 2, #KEYS do
+    if redis.call('HGET', KEYS[i], ARGV[1]) ~= ARGV[2] then
+        redis.call('SREM', KEYS[1], ARGV[i + 1])
+    end
+end
+return 1
+"""
+
+# NOTE: removes the sessions which no longer have resources
+_PRUNE_SESSIONS_INDEX_SCRIPT: Final[str] = """
+for i = 2, #KEYS do
+    if redis.call('EXISTS', KEYS[i]) == 0 then
+        redis.call('SREM', KEYS[1], ARGV[i - 1])
+    end
+end
+return 1
+"""
+
+
+def _resource_index_key(resource_name: str, resource_value: str) -> str:
+    return f"{_RESOURCE_INDEX_PREFIX}{resource_name}={resource_value}"
+
+
+def _user_sessions_index_key(key: UserSession) -> str:
+    return f"{_USER_SESSIONS_INDEX_PREFIX}user_id={key.user_id}"
+
+
 # redis `resources` db has composed-keys formatted as '${user_id=}:${client_session_id=}:{suffix}'
 #    Example:
 #        Key: user_id=1:client_session_id=7f40353b-db02-4474-a44d-23ce6a6e428c:alive = 1
@@ -73,9 +171,27 @@ class RedisResourceRegistry:
         return client
 
     async def set_resource(self, key: UserSession, resource: tuple[str, str]) -> None:
-        hash_key = f"{key.to_redis_hash_key()}:{RESOURCE_SUFFIX}"
+        session_key = key.to_redis_hash_key()
+        hash_key = f"{session_key}:{RESOURCE_SUFFIX}"
         field, value = resource
-        await handle_redis_returns_union_types(self.client.hset(hash_key, mapping={field: value}))
+        applied = 0
+        while not applied:
+            old_value: str | None = await handle_redis_returns_union_types(self.client.hget(hash_key, field))
+            keys = [hash_key, _SESSIONS_INDEX, _user_sessions_index_key(key), _resource_index_key(field, value)]
+            if old_value is not None and old_value != value:
+                keys.append(_resource_index_key(field, old_value))
+            applied = await handle_redis_returns_union_types(
+                self.client.eval(
+                    _SET_RESOURCE_SCRIPT,
+                    len(keys),
+                    *keys,
+                    session_key,
+                    field,
+                    value,
+                    old_value or "",
+                    "0" if old_value is None else "1",
+                )
+            )
 
     async def get_resources(self, key: UserSession) -> ResourcesDict:
         hash_key = f"{key.to_redis_hash_key()}:{RESOURCE_SUFFIX}"
@@ -83,56 +199,258 @@ class RedisResourceRegistry:
         return ResourcesDict(**fields)
 
     async def remove_resource(self, key: UserSession, resource_name: str) -> None:
-        hash_key = f"{key.to_redis_hash_key()}:{RESOURCE_SUFFIX}"
-        await handle_redis_returns_union_types(self.client.hdel(hash_key, resource_name))
+        session_key = key.to_redis_hash_key()
+        hash_key = f"{session_key}:{RESOURCE_SUFFIX}"
+        applied = 0
+        while not applied:
+            old_value: str | None = await handle_redis_returns_union_types(self.client.hget(hash_key, resource_name))
+            keys = [hash_key, _SESSIONS_INDEX, _user_sessions_index_key(key)]
+            if old_value is not None:
+                keys.append(_resource_index_key(resource_name, old_value))
+            applied = await handle_redis_returns_union_types(
+                self.client.eval(
+                    _REMOVE_RESOURCE_SCRIPT,
+                    len(keys),
+                    *keys,
+                    session_key,
+                    resource_name,
+                    old_value or "",
+                    "0" if old_value is None else "1",
+                )
+            )
 
     async def find_resources(self, key: UserSession, resource_name: str) -> list[str]:
-        resources: list[str] = []
-        # the key might only be partially complete
-        partial_hash_key = f"{key.to_redis_hash_key()}:{RESOURCE_SUFFIX}"
-        async for scanned_key in self.client.scan_iter(match=partial_hash_key):
-            if await handle_redis_returns_union_types(self.client.hexists(scanned_key, resource_name)):
-                key_value = await handle_redis_returns_union_types(self.client.hget(scanned_key, resource_name))
-                if key_value is not None:
-                    resources.append(key_value)
-        return resources
+        # the key might only be partially complete (e.g. all the sessions of a user)
+        if key.client_session_id == "*":
+            session_keys: list[RedisHashKey] = sorted(
+                await handle_redis_returns_union_types(self.client.smembers(_user_sessions_index_key(key)))
+            )
+        else:
+            session_keys = [key.to_redis_hash_key()]
+        if not session_keys:
+            return []
+
+        async with self.client.pipeline(transaction=False) as pipe:
+            for session_key in session_keys:
+                pipe.hget(f"{session_key}:{RESOURCE_SUFFIX}", resource_name)
+            values = await pipe.execute()
+        return [value for value in values if value is not None]
+
+    async def _prune_resource_index(
+        self, resource: tuple[str, str], session_keys: set[RedisHashKey]
+    ) -> set[RedisHashKey]:
+        """returns the sessions which still own the resource, the others are removed from its index"""
+        if not session_keys:
+            return session_keys
+        field, value = resource
+        ordered_session_keys = sorted(session_keys)
+        async with self.client.pipeline(transaction=False) as pipe:
+            for session_key in ordered_session_keys:
+                pipe.hget(f"{session_key}:{RESOURCE_SUFFIX}", field)
+            current_values = await pipe.execute()
+        stale_session_keys = [
+            session_key
+            for session_key, current_value in zip(ordered_session_keys, current_values, strict=True)
+            if current_value != value
+        ]
+        if stale_session_keys:
+            _logger.debug("pruning %s stale sessions from the index of %s", len(stale_session_keys), resource)
+            await handle_redis_returns_union_types(
+                self.client.eval(
+                    _PRUNE_RESOURCE_INDEX_SCRIPT,
+                    1 + len(stale_session_keys),
+                    _resource_index_key(field, value),
+                    *(f"{session_key}:{RESOURCE_SUFFIX}" for session_key in stale_session_keys),
+                    field,
+                    value,
+                    *stale_session_keys,
+                )
+            )
+        return session_keys.difference(stale_session_keys)
+
+    async def _prune_sessions_index(self, index_key: str, session_keys: set[RedisHashKey]) -> set[RedisHashKey]:
+        """returns the sessions which still have resources, the others are removed from the index"""
+        if not session_keys:
+            return session_keys
+        ordered_session_keys = sorted(session_keys)
+        async with self.client.pipeline(transaction=False) as pipe:
+            for session_key in ordered_session_keys:
+                pipe.exists(f"{session_key}:{RESOURCE_SUFFIX}")
+            exists_results = await pipe.execute()
+        stale_session_keys = [
+            session_key
+            for session_key, exists in zip(ordered_session_keys, exists_results, strict=True)
+            if not exists
+        ]
+        if stale_session_keys:
+            _logger.debug("pruning %s stale sessions from %s", len(stale_session_keys), index_key)
+            await handle_redis_returns_union_types(
+                self.client.eval(
+                    _PRUNE_SESSIONS_INDEX_SCRIPT,
+                    1 + len(stale_session_keys),
+                    index_key,
+                    *(f"{session_key}:{RESOURCE_SUFFIX}" for session_key in stale_session_keys),
+                    *stale_session_keys,
+                )
+            )
+        return session_keys.difference(stale_session_keys)
 
     async def find_keys(self, resource: tuple[str, str]) -> list[UserSession]:
         field, value = resource
-        return [
-            self._decode_hash_key(hash_key)
-            async for hash_key in self.client.scan_iter(match=f"*:{RESOURCE_SUFFIX}")
-            if value == await handle_redis_returns_union_types(self.client.hget(hash_key, field))
+        session_keys: set[RedisHashKey] = await handle_redis_returns_union_types(
+            self.client.smembers(_resource_index_key(field, value))
+        )
+        session_keys = await self._prune_resource_index(resource, session_keys)
+        return [UserSession.from_redis_hash_key(session_key) for session_key in sorted(session_keys)]
+
+    async def find_keys_of_resources(
+        self, resource_name: str, resource_values: list[str]
+    ) -> dict[str, list[UserSession]]:
+        """bulk version of find_keys, resolves all the values in one pipelined round-trip"""
+        if not resource_values:
+            return {}
+        async with self.client.pipeline(transaction=False) as pipe:
+            for value in resource_values:
+                pipe.smembers(_resource_index_key(resource_name, value))
+            sessions_keys: list[set[RedisHashKey]] = await pipe.execute()
+
+        # NOTE: the sessions are verified in one round-trip as well, only the stale ones are pruned one by one
+        indexed = [
+            (value, session_key)
+            for value, session_keys in zip(resource_values, sessions_keys, strict=True)
+            for session_key in session_keys
         ]
+        current_values = []
+        if indexed:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for _, session_key in indexed:
+                    pipe.hget(f"{session_key}:{RESOURCE_SUFFIX}", resource_name)
+                current_values = await pipe.execute()
+
+        found: dict[str, set[RedisHashKey]] = {value: set() for value in resource_values}
+        stale: dict[str, set[RedisHashKey]] = {}
+        for (value, session_key), current_value in zip(indexed, current_values, strict=True):
+            if current_value == value:
+                found[value].add(session_key)
+            else:
+                stale.setdefault(value, set()).add(session_key)
+        for value, stale_session_keys in stale.items():
+            found[value] |= await self._prune_resource_index((resource_name, value), stale_session_keys)
+
+        return {
+            value: [UserSession.from_redis_hash_key(session_key) for session_key in sorted(found[value])]
+            for value in resource_values
+        }
 
     async def set_key_alive(self, key: UserSession, *, expiration_time: int) -> None:
         # setting the timeout to always expire, timeout > 0
         expiration_time = int(max(1, expiration_time))
-        hash_key = f"{key.to_redis_hash_key()}:{ALIVE_SUFFIX}"
-        await self.client.set(hash_key, 1, ex=expiration_time)
+        session_key = key.to_redis_hash_key()
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.set(f"{session_key}:{ALIVE_SUFFIX}", 1, ex=expiration_time)
+            pipe.zadd(_ALIVE_INDEX, {session_key: time.time() + expiration_time})
+            await pipe.execute()
 
     async def is_key_alive(self, key: UserSession) -> bool:
         hash_key = f"{key.to_redis_hash_key()}:{ALIVE_SUFFIX}"
         return bool(await self.client.exists(hash_key) > 0)
 
     async def remove_key(self, key: UserSession) -> None:
-        await self.client.delete(
-            f"{key.to_redis_hash_key()}:{RESOURCE_SUFFIX}",
-            f"{key.to_redis_hash_key()}:{ALIVE_SUFFIX}",
-        )
+        session_key = key.to_redis_hash_key()
+        hash_key = f"{session_key}:{RESOURCE_SUFFIX}"
+        applied = 0
+        while not applied:
+            fields: dict[str, str] = await handle_redis_returns_union_types(self.client.hgetall(hash_key))
+            keys = [
+                hash_key,
+                f"{session_key}:{ALIVE_SUFFIX}",
+                _SESSIONS_INDEX,
+                _user_sessions_index_key(key),
+                _ALIVE_INDEX,
+                *(_resource_index_key(field, value) for field, value in fields.items()),
+            ]
+            applied = await handle_redis_returns_union_types(
+                self.client.eval(
+                    _REMOVE_KEY_SCRIPT,
+                    len(keys),
+                    *keys,
+                    session_key,
+                    *(item for field_value in fields.items() for item in field_value),
+                )
+            )
 
     async def get_all_resource_keys(self) -> tuple[AliveSessions, DeadSessions]:
-        alive_keys = [
-            self._decode_hash_key(hash_key) async for hash_key in self.client.scan_iter(match=f"*:{ALIVE_SUFFIX}")
-        ]
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.zrange(_ALIVE_INDEX, 0, -1)
+            pipe.smembers(_SESSIONS_INDEX)
+            alive_candidates, sessions_with_resources = await pipe.execute()
+
+        # NOTE: the alive keys expire on their own, the alive index is only used to find candidates
+        # and the expiration is checked on the keys themselves (no dependency on the clocks of the replicas)
+        alive_session_keys: list[RedisHashKey] = []
+        if alive_candidates:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for session_key in alive_candidates:
+                    pipe.exists(f"{session_key}:{ALIVE_SUFFIX}")
+                exists_results = await pipe.execute()
+            expired_session_keys = []
+            for session_key, exists in zip(alive_candidates, exists_results, strict=True):
+                (alive_session_keys if exists else expired_session_keys).append(session_key)
+            if expired_session_keys:
+                await handle_redis_returns_union_types(self.client.zrem(_ALIVE_INDEX, *expired_session_keys))
+
+        alive_session_keys_set = set(alive_session_keys)
+        alive_keys = [UserSession.from_redis_hash_key(session_key) for session_key in alive_session_keys]
         dead_keys = [
-            self._decode_hash_key(hash_key)
-            async for hash_key in self.client.scan_iter(match=f"*:{RESOURCE_SUFFIX}")
-            if self._decode_hash_key(hash_key) not in alive_keys
+            UserSession.from_redis_hash_key(session_key)
+            for session_key in sorted(sessions_with_resources)
+            if session_key not in alive_session_keys_set
         ]
 
         return (alive_keys, dead_keys)
 
+    async def rebuild_indexes(self) -> None:
+        """Rebuilds the secondary indexes from the stored resources and alive keys
+        and prunes the entries of sessions which no longer own what is indexed
+
+        NOTE: this SCANs the whole keyspace and is meant to run once on startup
+        (e.g. to index entries created by a previous version of the registry)
+        """
+        async for index_key in self.client.scan_iter(match=f"{_RESOURCE_INDEX_PREFIX}*"):
+            field, value = index_key.removeprefix(_RESOURCE_INDEX_PREFIX).split("=", maxsplit=1)
+            await self._prune_resource_index(
+                (field, value), await handle_redis_returns_union_types(self.client.smembers(index_key))
+            )
+        async for index_key in self.client.scan_iter(match=f"{_USER_SESSIONS_INDEX_PREFIX}*"):
+            await self._prune_sessions_index(
+                index_key, await handle_redis_returns_union_types(self.client.smembers(index_key))
+            )
+        await self._prune_sessions_index(
+            _SESSIONS_INDEX, await handle_redis_returns_union_types(self.client.smembers(_SESSIONS_INDEX))
+        )
+
+        async for hash_key in self.client.scan_iter(match=f"*:{RESOURCE_SUFFIX}"):
+            key = self._decode_hash_key(hash_key)
+            session_key = key.to_redis_hash_key()
+            fields = await handle_redis_returns_union_types(self.client.hgetall(hash_key))
+            if not fields:
+                continue
+            async with self.client.pipeline(transaction=True) as pipe:
+                pipe.sadd(_SESSIONS_INDEX, session_key)
+                pipe.sadd(_user_sessions_index_key(key), session_key)
+                for field, value in fields.items():
+                    pipe.sadd(_resource_index_key(field, value), session_key)
+                await pipe.execute()
+
+        async for alive_key in self.client.scan_iter(match=f"*:{ALIVE_SUFFIX}"):
+            ttl = await handle_redis_returns_union_types(self.client.ttl(alive_key))
+            if ttl > 0:
+                await handle_redis_returns_union_types(
+                    self.client.zadd(
+                        _ALIVE_INDEX, {self._decode_hash_key(alive_key).to_redis_hash_key(): time.time() + ttl}
+                    )
+                )
+
 
 CLIENT_SOCKET_REGISTRY_APPKEY: Final = web.AppKey("CLIENT_SOCKET_REGISTRY", RedisResourceRegistry)
 
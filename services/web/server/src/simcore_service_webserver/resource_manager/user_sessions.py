@@ -192,6 +192,11 @@ class UserSessionResourcesRegistry:
         registry = get_registry(app)
         return await registry.find_keys(resource=(key, value))
 
+    @staticmethod
+    async def find_users_of_resources(app: web.Application, key: str, values: list[str]) -> dict[str, list[UserSession]]:
+        registry = get_registry(app)
+        return await registry.find_keys_of_resources(key, values)
+
     def get_id(self) -> UserSession:
         if self.client_session_id is None:
             msg = f"Cannot build UserSessionID with missing {self.client_session_id=}"
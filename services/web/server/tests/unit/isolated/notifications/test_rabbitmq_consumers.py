@@ -5,7 +5,7 @@
 # pylint: disable=unused-variable
 
 from unittest.mock import AsyncMock
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import pytest
 from models_library.progress_bar import ProgressReport
@@ -17,6 +17,8 @@ from models_library.rabbitmq_messages import (
 from models_library.socketio import SocketMessageDict
 from pytest_mock import MockerFixture
 from simcore_service_webserver.notifications._rabbitmq_exclusive_queue_consumers import (
+    _COMPUTATION_PROGRESS_BUFFER_APPKEY,
+    _flush_computation_progress,
     _progress_message_parser,
 )
 from simcore_service_webserver.socketio.models import WebSocketNodeProgress
@@ -94,3 +96,47 @@ async def test_regression_progress_message_parser(
 
     # check that all fields are sent as expected
     assert message["data"] == expected_socket_message["data"]
+
+
+async def test_computation_progress_messages_are_coalesced(mocker: MockerFixture):
+    notify_project_nodes_progress_mock = mocker.patch(
+        "simcore_service_webserver.notifications._rabbitmq_exclusive_queue_consumers._projects_service.notify_project_nodes_progress",
+        autospec=True,
+    )
+    send_message_to_project_room_mock = mocker.patch(
+        "simcore_service_webserver.socketio.socketio_service.send_message_to_project_room",
+        autospec=True,
+    )
+    app = {_COMPUTATION_PROGRESS_BUFFER_APPKEY: {}}
+
+    project_id = uuid4()
+    node_ids = [uuid4(), uuid4()]
+    for progress in (0.1, 0.5, 0.9):
+        for node_id in node_ids:
+            assert await _progress_message_parser(
+                app,  # type: ignore[arg-type]
+                ProgressRabbitMessageNode(
+                    project_id=project_id,
+                    user_id=123,
+                    node_id=node_id,
+                    progress_type=ProgressType.COMPUTATION_RUNNING,
+                    report=ProgressReport(actual_value=progress, total=1),
+                )
+                .model_dump_json()
+                .encode(),
+            )
+    # nothing is notified until the buffer is flushed
+    notify_project_nodes_progress_mock.assert_not_called()
+    send_message_to_project_room_mock.assert_not_called()
+
+    await _flush_computation_progress(app)  # type: ignore[arg-type]
+    notify_project_nodes_progress_mock.assert_called_once_with(
+        app,
+        project_id,
+        {node_id: ProgressReport(actual_value=0.9, total=1) for node_id in node_ids},
+    )
+
+    # the buffer is empty after a flush
+    notify_project_nodes_progress_mock.reset_mock()
+    await _flush_computation_progress(app)  # type: ignore[arg-type]
+    notify_project_nodes_progress_mock.assert_not_called()
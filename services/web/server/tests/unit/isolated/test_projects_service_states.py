@@ -3,10 +3,11 @@ from uuid import uuid4
 
 import pytest
 from models_library.api_schemas_directorv2.comp_runs import ComputationRunStateRpcGet
-from models_library.projects_state import ProjectShareState, ProjectStatus, RunningState
+from models_library.projects_state import ProjectLocked, ProjectShareState, ProjectStatus, RunningState
 from models_library.users import UserID
 from pytest_mock import MockerFixture
 from simcore_service_webserver.projects import _projects_service
+from simcore_service_webserver.resource_manager.models import UserSession
 
 
 @pytest.mark.parametrize(
@@ -34,8 +35,8 @@ async def test_add_projects_states_distinguishes_no_run_from_retrieval_failure(
     )
     mocker.patch.object(
         _projects_service,
-        "_get_project_share_state",
-        AsyncMock(return_value=project_share_state),
+        "_get_projects_share_states",
+        AsyncMock(return_value=[project_share_state]),
     )
 
     projects = await _projects_service.add_projects_states_for_user(
@@ -45,3 +46,48 @@ async def test_add_projects_states_distinguishes_no_run_from_retrieval_failure(
     )
 
     assert projects[0]["state"]["state"]["value"] == expected_state
+
+
+async def test_get_projects_share_states_reads_redis_once_for_all_projects(
+    mocker: MockerFixture,
+):
+    closed_project, maintained_project, opened_project = (f"{uuid4()}" for _ in range(3))
+    user_id = UserID(1)
+
+    mocker.patch.object(
+        _projects_service,
+        "get_application_settings",
+        return_value=Mock(WEBSERVER_REALTIME_COLLABORATION=None),
+    )
+    mocker.patch.object(_projects_service, "get_redis_lock_manager_client_sdk")
+    mocked_get_locked_states = mocker.patch.object(
+        _projects_service,
+        "get_projects_locked_states",
+        AsyncMock(return_value=[None, ProjectLocked(value=True, status=ProjectStatus.MAINTAINING), None]),
+    )
+    mocked_find_users = AsyncMock(
+        return_value={
+            closed_project: [],
+            maintained_project: [],
+            opened_project: [UserSession(user_id=2, client_session_id=f"{uuid4()}")],
+        }
+    )
+    mocked_managed_resource = mocker.patch.object(_projects_service, "managed_resource")
+    mocked_managed_resource.return_value.__enter__.return_value.find_users_of_resources = mocked_find_users
+    mocker.patch.object(
+        _projects_service.users_service,
+        "get_user_primary_group_id",
+        AsyncMock(return_value=42),
+    )
+
+    share_states = await _projects_service._get_projects_share_states(  # noqa: SLF001
+        user_id, [closed_project, maintained_project, opened_project], Mock()
+    )
+
+    mocked_get_locked_states.assert_awaited_once()
+    mocked_find_users.assert_awaited_once()
+    assert share_states == [
+        ProjectShareState(status=ProjectStatus.CLOSED, locked=False, current_user_groupids=[]),
+        ProjectShareState(status=ProjectStatus.MAINTAINING, locked=True, current_user_groupids=[]),
+        ProjectShareState(status=ProjectStatus.OPENED, locked=True, current_user_groupids=[42]),
+    ]
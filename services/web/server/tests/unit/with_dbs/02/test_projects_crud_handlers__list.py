@@ -319,3 +319,30 @@ async def test_guest_user_lists_and_accesses_owned_or_published_projects(
         url = client.app.router["get_project"].url_for(project_id=other_project["uuid"])
         resp = await client.get(f"{url}")
         await assert_status(resp, status.HTTP_403_FORBIDDEN)
+
+
+@pytest.mark.parametrize("user_role", [UserRole.USER])
+async def test_list_projects_with_basic_view(
+    client: TestClient,
+    logged_user: UserInfoDict,
+    user_project: ProjectDict,
+    director_v2_service_mock: aioresponses,
+    mock_batch_get_computations_latest_states: AsyncMock,
+):
+    full_data, *_ = await _list_projects(client, status.HTTP_200_OK)
+    basic_data, *_ = await _list_projects(client, status.HTTP_200_OK, query_parameters={"view": "basic"})
+
+    assert len(full_data) == len(basic_data) == 1
+    full_project, basic_project = full_data[0], basic_data[0]
+    assert "nodesCount" not in full_project
+    assert full_project["workbench"] == user_project["workbench"]
+
+    # heavy fields are omitted, the nodes are only counted
+    assert "workbench" not in basic_project
+    assert basic_project.get("dev") is None
+    assert basic_project["nodesCount"] == len(user_project["workbench"])
+    assert not {"workbench", "slideshow", "annotations"}.intersection(basic_project.get("ui") or {})
+
+    # the rest is the same
+    for key in ("uuid", "name", "description", "thumbnail", "accessRights", "tags", "state", "prjOwner"):
+        assert basic_project[key] == full_project[key]
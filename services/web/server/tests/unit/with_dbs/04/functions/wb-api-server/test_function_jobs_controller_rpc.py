@@ -466,6 +466,55 @@ async def test_find_cached_function_jobs(
     assert all(job is None for job in cached_jobs)
 
 
+@pytest.mark.parametrize(
+    "user_role",
+    [UserRole.USER],
+)
+async def test_find_cached_function_jobs_with_equivalent_inputs(
+    client: TestClient,
+    webserver_rpc_client: WebServerRpcClient,
+    add_user_function_api_access_rights: None,
+    logged_user: UserInfoDict,
+    osparc_product_name: ProductName,
+    create_fake_function_obj: Callable[[FunctionClass], Function],
+    clean_functions: None,
+):
+    registered_function = await webserver_rpc_client.functions.register_function(
+        function=create_fake_function_obj(FunctionClass.PROJECT),
+        user_id=logged_user["id"],
+        product_name=osparc_product_name,
+    )
+    await webserver_rpc_client.functions.batch_register_function_jobs(
+        function_jobs=TypeAdapter(FunctionJobList).validate_python(
+            [
+                ProjectFunctionJob(
+                    function_uid=registered_function.uid,
+                    title="Test Function Job",
+                    description="A test function job",
+                    project_job_id=uuid4(),
+                    inputs={"input1": 1, "input2": "a"},
+                    outputs={"output1": "result1"},
+                    job_creation_task_id=None,
+                )
+            ]
+        ),
+        user_id=logged_user["id"],
+        product_name=osparc_product_name,
+    )
+
+    # keys order and number formatting do not matter
+    cached_jobs = await webserver_rpc_client.functions.find_cached_function_jobs(
+        function_id=registered_function.uid,
+        inputs=[{"input2": "a", "input1": 1.0}, {"input1": 1, "input2": "b"}],
+        user_id=logged_user["id"],
+        product_name=osparc_product_name,
+    )
+    assert len(cached_jobs) == 2
+    assert cached_jobs[0] is not None
+    assert cached_jobs[0].inputs == {"input1": 1, "input2": "a"}
+    assert cached_jobs[1] is None
+
+
 @pytest.mark.parametrize(
     "user_role",
     [UserRole.USER],
@@ -297,3 +297,92 @@ async def test_users_sessions_resources_registry(
                 assert len(list_of_sockets_of_user) == num_sockets_for_user
 
                 assert await rt.find(res_key) == [res_value]
+
+
+async def test_redis_registry_indexes_are_kept_in_sync(
+    redis_registry: RedisResourceRegistry,
+    redis_client: aioredis.Redis,
+    create_user_session: Callable[[], UserSession],
+):
+    user_session = create_user_session()
+    other_tab = UserSession(user_id=user_session.user_id, client_session_id=f"{uuid4()}")
+
+    await redis_registry.set_resource(user_session, ("project_id", "project_1"))
+    await redis_registry.set_resource(other_tab, ("project_id", "project_2"))
+    assert await redis_registry.find_keys(("project_id", "project_1")) == [user_session]
+    assert sorted(
+        await redis_registry.find_resources(
+            UserSession(user_id=user_session.user_id, client_session_id="*"), "project_id"
+        )
+    ) == ["project_1", "project_2"]
+
+    # overwriting a resource moves the session to the new index
+    await redis_registry.set_resource(user_session, ("project_id", "project_2"))
+    assert not await redis_registry.find_keys(("project_id", "project_1"))
+    assert sorted(
+        await redis_registry.find_keys(("project_id", "project_2")), key=lambda s: s.client_session_id
+    ) == sorted([user_session, other_tab], key=lambda s: s.client_session_id)
+
+    # removing the last resource removes the session from the indexes
+    await redis_registry.remove_resource(other_tab, "project_id")
+    assert await redis_registry.find_keys(("project_id", "project_2")) == [user_session]
+    _, dead_keys = await redis_registry.get_all_resource_keys()
+    assert dead_keys == [user_session]
+
+    # indexes can be rebuilt from scratch
+    await redis_registry.set_key_alive(user_session, expiration_time=10)
+    for index_key in [k async for k in redis_client.scan_iter(match="*index*")]:
+        await redis_client.delete(index_key)
+    assert not await redis_registry.find_keys(("project_id", "project_2"))
+    await redis_registry.rebuild_indexes()
+    assert await redis_registry.find_keys(("project_id", "project_2")) == [user_session]
+    assert await redis_registry.get_all_resource_keys() == ([user_session], [])
+
+    await redis_registry.remove_key(user_session)
+    assert not await redis_registry.find_keys(("project_id", "project_2"))
+    assert await redis_registry.get_all_resource_keys() == ([], [])
+
+
+async def test_redis_registry_find_keys_of_resources(
+    redis_registry: RedisResourceRegistry,
+    create_user_session: Callable[[], UserSession],
+):
+    user_session = create_user_session()
+    other_tab = UserSession(user_id=user_session.user_id, client_session_id=f"{uuid4()}")
+
+    await redis_registry.set_resource(user_session, ("project_id", "project_1"))
+    await redis_registry.set_resource(other_tab, ("project_id", "project_1"))
+    await redis_registry.set_resource(create_user_session(), ("project_id", "project_2"))
+
+    found = await redis_registry.find_keys_of_resources("project_id", ["project_1", "project_2", "project_3"])
+    assert list(found) == ["project_1", "project_2", "project_3"]
+    for project_id, sessions in found.items():
+        assert sessions == await redis_registry.find_keys(("project_id", project_id))
+    assert not found["project_3"]
+    assert await redis_registry.find_keys_of_resources("project_id", []) == {}
+
+
+async def test_redis_registry_prunes_stale_index_entries(
+    redis_registry: RedisResourceRegistry,
+    redis_client: aioredis.Redis,
+    create_user_session: Callable[[], UserSession],
+):
+    user_session = create_user_session()
+    other_session = create_user_session()
+    await redis_registry.set_resource(user_session, ("project_id", "project_1"))
+    await redis_registry.set_resource(user_session, ("socket_id", "socket_1"))
+    await redis_registry.set_resource(other_session, ("project_id", "project_1"))
+
+    # the resources disappear without going through the registry
+    await redis_client.delete(f"{user_session.to_redis_hash_key()}:{RESOURCE_SUFFIX}")
+
+    # stale entries are dropped on read
+    assert await redis_registry.find_keys(("project_id", "project_1")) == [other_session]
+    assert await redis_client.smembers("resource_index:project_id=project_1") == {other_session.to_redis_hash_key()}
+    assert await redis_registry.find_keys_of_resources("project_id", ["project_1"]) == {"project_1": [other_session]}
+
+    # and on rebuild
+    assert await redis_client.smembers("resource_index:socket_id=socket_1")
+    await redis_registry.rebuild_indexes()
+    assert not await redis_client.smembers("resource_index:socket_id=socket_1")
+    assert await redis_registry.get_all_resource_keys() == ([], [other_session])
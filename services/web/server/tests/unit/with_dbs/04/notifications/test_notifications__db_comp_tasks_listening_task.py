@@ -26,6 +26,7 @@ from common_library.async_tools import delayed_start
 from faker import Faker
 from models_library.projects import ProjectAtDB
 from models_library.projects_nodes_io import NodeID
+from models_library.projects_state import RunningState
 from pytest_mock import MockType
 from pytest_mock.plugin import MockerFixture
 from pytest_simcore.helpers.logging_tools import log_context
@@ -35,9 +36,9 @@ from simcore_postgres_database.models.comp_tasks import NodeClass, comp_tasks
 from simcore_postgres_database.models.users import UserRole
 from simcore_postgres_database.webserver_models import DB_CHANNEL_NAME
 from simcore_service_webserver.db_listener._db_comp_tasks_listening_task import (
-    _get_changed_comp_task_row,
+    _get_changed_comp_task_rows,
     _get_project_owner,
-    _handle_db_notification,
+    _handle_db_notifications,
     create_comp_tasks_listening_task,
 )
 from simcore_service_webserver.db_listener._models import CompTaskNotificationPayload
@@ -62,13 +63,13 @@ async def mock_project_subsystem(mocker: MockerFixture) -> dict[str, mock.Mock]:
         return_value="",
     )
 
-    mocked_project_calls["_update_project_state.update_project_node_state"] = mocker.patch(
-        "simcore_service_webserver.projects._projects_service.update_project_node_state",
+    mocked_project_calls["_update_project_state.update_project_nodes_state"] = mocker.patch(
+        "simcore_service_webserver.projects._projects_service.update_project_nodes_state",
         autospec=True,
     )
 
-    mocked_project_calls["_update_project_state.notify_project_node_update"] = mocker.patch(
-        "simcore_service_webserver.projects._projects_service.notify_project_node_update",
+    mocked_project_calls["_update_project_state.notify_project_nodes_update"] = mocker.patch(
+        "simcore_service_webserver.projects._projects_service.notify_project_nodes_update",
         autospec=True,
     )
 
@@ -94,7 +95,7 @@ async def spied_get_changed_comp_task_row(
 ) -> MockType:
     return mocker.spy(
         simcore_service_webserver.db_listener._db_comp_tasks_listening_task,  # noqa: SLF001
-        "_get_changed_comp_task_row",
+        "_get_changed_comp_task_rows",
     )
 
 
@@ -138,8 +139,8 @@ async def _assert_listener_triggers(mock_project_subsystem: dict[str, mock.Mock]
             _CompTaskChangeParams(
                 {"state": StateType.ABORTED},
                 [
-                    "_update_project_state.update_project_node_state",
-                    "_update_project_state.notify_project_node_update",
+                    "_update_project_state.update_project_nodes_state",
+                    "_update_project_state.notify_project_nodes_update",
                     "_update_project_state.notify_project_state_update",
                 ],
             ),
@@ -153,8 +154,8 @@ async def _assert_listener_triggers(mock_project_subsystem: dict[str, mock.Mock]
                 },
                 [
                     "update_node_outputs",
-                    "_update_project_state.update_project_node_state",
-                    "_update_project_state.notify_project_node_update",
+                    "_update_project_state.update_project_nodes_state",
+                    "_update_project_state.notify_project_nodes_update",
                     "_update_project_state.notify_project_state_update",
                 ],
             ),
@@ -204,8 +205,8 @@ async def test_db_listener_triggers_on_event_with_multiple_tasks(
 
     # Assert the spy was called with the correct task_id
     if params.expected_calls:
-        assert any(call.args[1] == updated_task_id for call in spied_get_changed_comp_task_row.call_args_list), (
-            f"_get_changed_comp_task_row was not called with task_id={updated_task_id}."
+        assert any(updated_task_id in call.args[1] for call in spied_get_changed_comp_task_row.call_args_list), (
+            f"_get_changed_comp_task_rows was not called with task_id={updated_task_id}."
             f" Calls: {spied_get_changed_comp_task_row.call_args_list}"
         )
     else:
@@ -388,7 +389,7 @@ async def test_get_project_owner_raises_when_project_missing(
 
 
 @pytest.mark.parametrize("user_role", [UserRole.USER])
-async def test_get_changed_comp_task_row_returns_task(
+async def test_get_changed_comp_task_rows_returns_task(
     sqlalchemy_async_engine: AsyncEngine,
     logged_user: UserInfoDict,
     create_project: Callable[..., Awaitable[ProjectAtDB]],
@@ -405,17 +406,17 @@ async def test_get_changed_comp_task_row_returns_task(
         node_class=NodeClass.COMPUTATIONAL,
     )
     async with sqlalchemy_async_engine.connect() as conn:
-        row = await _get_changed_comp_task_row(conn, task["task_id"])
-    assert row is not None
-    assert row.task_id == task["task_id"]
+        rows = await _get_changed_comp_task_rows(conn, [task["task_id"]])
+    assert list(rows) == [task["task_id"]]
+    assert rows[task["task_id"]].task_id == task["task_id"]
 
 
-async def test_get_changed_comp_task_row_returns_none_for_missing_task(
+async def test_get_changed_comp_task_rows_skips_missing_task(
     sqlalchemy_async_engine: AsyncEngine,
 ):
     async with sqlalchemy_async_engine.connect() as conn:
-        row = await _get_changed_comp_task_row(conn, 999999)
-    assert row is None
+        rows = await _get_changed_comp_task_rows(conn, [999999])
+    assert rows == {}
 
 
 @pytest.mark.parametrize("user_role", [UserRole.USER])
@@ -436,7 +437,7 @@ async def test_handle_db_notification_logs_warning_on_missing_project(
         node_id=faker.uuid4(),
     )
     with caplog.at_level(logging.WARNING):
-        await _handle_db_notification(client.app, payload, sqlalchemy_async_engine)
+        await _handle_db_notifications(client.app, [payload], sqlalchemy_async_engine)
     assert "could not be found" in caplog.text or "not found" in caplog.text.lower()
 
 
@@ -460,7 +461,7 @@ async def test_handle_db_notification_logs_warning_on_missing_comp_task(
         node_id=faker.uuid4(),
     )
     with caplog.at_level(logging.WARNING):
-        await _handle_db_notification(client.app, payload, sqlalchemy_async_engine)
+        await _handle_db_notifications(client.app, [payload], sqlalchemy_async_engine)
     assert "No comp_tasks row found" in caplog.text
 
 
@@ -495,7 +496,7 @@ async def test_handle_db_notification_with_output_change(
         project_id=project.uuid,
         node_id=node_id,
     )
-    await _handle_db_notification(client.app, payload, sqlalchemy_async_engine)
+    await _handle_db_notifications(client.app, [payload], sqlalchemy_async_engine)
     mock_project_subsystem["update_node_outputs"].assert_called_once()
 
 
@@ -535,12 +536,64 @@ async def test_handle_db_notification_with_state_change(
         project_id=project.uuid,
         node_id=node_id,
     )
-    await _handle_db_notification(client.app, payload, sqlalchemy_async_engine)
-    mock_project_subsystem["_update_project_state.update_project_node_state"].assert_called_once()
-    mock_project_subsystem["_update_project_state.notify_project_node_update"].assert_called_once()
+    await _handle_db_notifications(client.app, [payload], sqlalchemy_async_engine)
+    mock_project_subsystem["_update_project_state.update_project_nodes_state"].assert_called_once()
+    mock_project_subsystem["_update_project_state.notify_project_nodes_update"].assert_called_once()
     mock_project_subsystem["_update_project_state.notify_project_state_update"].assert_called_once()
 
 
+@pytest.mark.parametrize("user_role", [UserRole.USER])
+async def test_handle_db_notifications_batches_state_changes_per_project(
+    sqlalchemy_async_engine: AsyncEngine,
+    mock_project_subsystem: dict[str, mock.Mock],
+    client: TestClient,
+    logged_user: UserInfoDict,
+    create_project: Callable[..., Awaitable[ProjectAtDB]],
+    create_pipeline: Callable[..., Awaitable[dict[str, Any]]],
+    create_comp_task: Callable[..., Awaitable[dict[str, Any]]],
+    faker: Faker,
+):
+    assert client.app
+    project = await create_project(logged_user)
+    await create_pipeline(project_id=f"{project.uuid}")
+    payloads = []
+    for _ in range(3):
+        node_id = faker.uuid4()
+        task = await create_comp_task(
+            project_id=f"{project.uuid}",
+            node_id=node_id,
+            outputs=json.dumps({}),
+            node_class=NodeClass.COMPUTATIONAL,
+        )
+        async with sqlalchemy_async_engine.begin() as conn:
+            await conn.execute(
+                comp_tasks.update().values(state=StateType.STARTED).where(comp_tasks.c.task_id == task["task_id"])
+            )
+        # the same node is notified several times
+        payloads.extend(
+            CompTaskNotificationPayload(
+                action="UPDATE",
+                changes=["state"],
+                table="comp_tasks",
+                task_id=task["task_id"],
+                project_id=project.uuid,
+                node_id=node_id,
+            )
+            for _ in range(2)
+        )
+
+    await _handle_db_notifications(client.app, payloads, sqlalchemy_async_engine)
+
+    mocked_update = mock_project_subsystem["_update_project_state.update_project_nodes_state"]
+    mocked_update.assert_called_once()
+    nodes_states = mocked_update.call_args.args[3]
+    assert set(nodes_states) == {p.node_id for p in payloads}
+    assert set(nodes_states.values()) == {RunningState.STARTED}
+    mock_project_subsystem["_update_project_state.notify_project_nodes_update"].assert_called_once()
+    mock_project_subsystem["_update_project_state.notify_project_state_update"].assert_called_once()
+    mock_project_subsystem["update_node_outputs"].assert_not_called()
+
+
 @pytest.mark.parametrize("user_role", [UserRole.USER])
 async def test_handle_db_notification_ignores_non_output_non_state_changes(
     sqlalchemy_async_engine: AsyncEngine,
@@ -570,7 +623,7 @@ async def test_handle_db_notification_ignores_non_output_non_state_changes(
         project_id=project.uuid,
         node_id=node_id,
     )
-    await _handle_db_notification(client.app, payload, sqlalchemy_async_engine)
+    await _handle_db_notifications(client.app, [payload], sqlalchemy_async_engine)
     for mocked_call in mock_project_subsystem.values():
         mocked_call.assert_not_called()
 